@@ -0,0 +1 @@
+# 여러 페이지가 함께 쓰는 공용 엔진 모음 (pages/ 안에 두면 Streamlit이 페이지로 인식하므로 분리)
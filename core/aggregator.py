@@ -0,0 +1,176 @@
+import argparse
+import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import pandas as pd
+
+from core import feeds, scheduler
+from core.storage import session
+
+# ------------------------------------------------------------------
+# [1] 스키마 (구독 피드 + 통합 기사 저장소)
+# ------------------------------------------------------------------
+DB_NAME = "feeds"
+DEFAULT_INTERVAL = 600   # 피드별 기본 폴링 주기(초)
+MAX_WORKERS = 8
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (
+    url      TEXT PRIMARY KEY,
+    name     TEXT NOT NULL,
+    topic    TEXT NOT NULL,
+    interval INTEGER NOT NULL,
+    enabled  INTEGER NOT NULL DEFAULT 1
+);
+CREATE INDEX IF NOT EXISTS idx_sources_topic ON sources (topic);
+CREATE TABLE IF NOT EXISTS entries (
+    key          TEXT PRIMARY KEY,
+    link         TEXT NOT NULL,
+    title        TEXT NOT NULL,
+    source       TEXT,
+    published    TEXT,
+    published_at TEXT,
+    first_seen   REAL NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_entries_link ON entries (link);
+CREATE INDEX IF NOT EXISTS idx_entries_published ON entries (published_at);
+CREATE TABLE IF NOT EXISTS entry_feeds (
+    key      TEXT NOT NULL,
+    feed_url TEXT NOT NULL,
+    PRIMARY KEY (key, feed_url)
+);
+CREATE INDEX IF NOT EXISTS idx_entry_feeds_feed ON entry_feeds (feed_url);
+"""
+
+def _db():
+    return session(DB_NAME, SCHEMA)
+
+def google_news_url(query, days=2):
+    """구글 뉴스 검색 RSS (최근 N일, 최신순)"""
+    q = "+".join(query.split())
+    return f"https://news.google.com/rss/search?q={q}+when:{days}d&hl=ko&gl=KR&ceid=KR:ko&scoring=n"
+
+# ------------------------------------------------------------------
+# [2] 구독 관리
+# ------------------------------------------------------------------
+def register(sources):
+    """[{'url', 'name', 'topic', 'interval'(선택)}] 등록. 이미 있으면 이름/주제/주기만 갱신."""
+    with _db() as conn:
+        conn.executemany(
+            "INSERT INTO sources (url, name, topic, interval) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(url) DO UPDATE SET name = excluded.name, topic = excluded.topic, interval = excluded.interval",
+            [(s["url"], s["name"], s["topic"], int(s.get("interval", DEFAULT_INTERVAL))) for s in sources]
+        )
+
+def due_sources(topic=None, now=None):
+    """주기가 지난(또는 한 번도 안 읽은) 피드 목록"""
+    now = now or time.time()
+    sql = ("SELECT s.url, s.interval FROM sources s LEFT JOIN feed_state f ON f.url = s.url "
+           "WHERE s.enabled = 1 AND (f.polled_at IS NULL OR ? - f.polled_at >= s.interval)")
+    params = [now]
+    if topic:
+        sql += " AND s.topic = ?"
+        params.append(topic)
+    with session(DB_NAME, feeds.SCHEMA + SCHEMA) as conn:
+        return [dict(r) for r in conn.execute(sql, params)]
+
+# ------------------------------------------------------------------
+# [3] 동시 폴링 -> 통합 저장 (네트워크는 병렬, 쓰기는 한 스레드)
+# ------------------------------------------------------------------
+def _store(feed_url, entries):
+    now = time.time()
+    rows = [(e["key"], e["link"], e["title"], e.get("source"), e.get("published"), e.get("published_at") or None, now)
+            for e in entries if e.get("link")]
+    with _db() as conn:
+        before = conn.total_changes
+        # GUID(key) 또는 링크가 이미 있으면 무시 -> 여러 피드에 같은 기사가 떠도 한 번만 저장
+        conn.executemany("INSERT OR IGNORE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+        added = conn.total_changes - before
+        # 피드 소속은 따로 기록 (다른 피드에서 먼저 저장된 기사는 링크로 기존 key를 찾음)
+        conn.executemany(
+            "INSERT OR IGNORE INTO entry_feeds (key, feed_url) "
+            "SELECT key, ? FROM entries WHERE key = ? OR link = ? LIMIT 1",
+            [(feed_url, r[0], r[1]) for r in rows]
+        )
+    return added
+
+def poll(topic=None, force=False, max_workers=MAX_WORKERS):
+    """
+    주기가 된 피드만 동시에 읽어 저장소에 합칩니다. (force=True면 주제의 모든 피드)
+    반환: {'polled': 읽은 피드 수, 'new': 새 기사 수, 'errors': {url: 메시지}}
+    """
+    if force:
+        with _db() as conn:
+            sql, params = "SELECT url, 0 AS interval FROM sources WHERE enabled = 1", []
+            if topic:
+                sql += " AND topic = ?"
+                params.append(topic)
+            targets = [dict(r) for r in conn.execute(sql, params)]
+    else:
+        targets = due_sources(topic)
+
+    result = {"polled": 0, "new": 0, "errors": {}}
+    if not targets:
+        return result
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(targets))) as pool:
+        futures = {pool.submit(feeds.poll_feed, t["url"], t["interval"]): t["url"] for t in targets}
+        for future in as_completed(futures):
+            url = futures[future]
+            try:
+                entries, _, status = future.result()
+            except Exception as e:
+                result["errors"][url] = str(e)
+                continue
+            result["polled"] += 1
+            if status != "cached":
+                result["new"] += _store(url, entries)
+    return result
+
+def poll_in_background(topic=None):
+    """페이지에서 호출: 저장소는 바로 읽고, 폴링은 뒤에서 (주제당 동시에 하나만)"""
+    return scheduler.run_async(f"feeds:{topic or '*'}", poll, topic)
+
+# ------------------------------------------------------------------
+# [4] 조회 (페이지는 저장소만 읽음 -> 피드 수와 무관하게 일정한 속도)
+# ------------------------------------------------------------------
+def query(topic=None, since=None, limit=30):
+    """주제의 기사(중복 제거됨)를 최신순으로. since: 이 시각(UTC) 이후 발행분만"""
+    sql = "SELECT e.key, e.title, e.link, e.published, e.published_at, e.source FROM entries e"
+    params = []
+    if topic:
+        sql += (" WHERE e.key IN (SELECT ef.key FROM entry_feeds ef JOIN sources s ON s.url = ef.feed_url"
+                " WHERE s.topic = ?)")
+        params.append(topic)
+    if since is not None:
+        sql += " AND" if topic else " WHERE"
+        sql += " e.published_at >= ?"
+        params.append(pd.Timestamp(since).strftime("%Y-%m-%dT%H:%M:%S"))
+    sql += " ORDER BY e.published_at DESC LIMIT ?"
+    params.append(int(limit))
+    with _db() as conn:
+        return [dict(r) for r in conn.execute(sql, params)]
+
+def hours_ago(hours):
+    return datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None) - datetime.timedelta(hours=hours)
+
+# ------------------------------------------------------------------
+# [5] 백그라운드 실행: python -m core.aggregator --interval 60
+# ------------------------------------------------------------------
+def run_forever(interval=60):
+    def cycle():
+        r = poll()
+        return f"피드 {r['polled']}개, 새 기사 {r['new']}건, 실패 {len(r['errors'])}"
+    scheduler.every(interval, cycle, "feeds")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="등록된 RSS 피드 주기별 수집")
+    parser.add_argument("--interval", type=int, default=60, help="스케줄 점검 주기(초)")
+    parser.add_argument("--once", action="store_true", help="한 번만 수집하고 종료")
+    args = parser.parse_args()
+
+    if args.once:
+        print(poll())
+    else:
+        run_forever(args.interval)
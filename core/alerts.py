@@ -0,0 +1,168 @@
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from core import scheduler
+from core.market_data import download_close
+from core.storage import session
+
+# ------------------------------------------------------------------
+# [1] 스키마 (감시 레벨 + 발생한 알림)
+# ------------------------------------------------------------------
+# Streamlit 세션이 없어도 돌아가야 하므로 이 모듈은 streamlit을 import하지 않습니다.
+DB_NAME = "alerts"
+DEFAULT_INTERVAL = 300  # 5분마다 한 번 점검
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS alert_levels (
+    ticker     TEXT NOT NULL,
+    label      TEXT NOT NULL,
+    price      REAL NOT NULL,
+    direction  TEXT NOT NULL CHECK (direction IN ('above', 'below')),
+    created_at REAL NOT NULL,
+    active     INTEGER NOT NULL DEFAULT 1,
+    PRIMARY KEY (ticker, label)
+);
+CREATE INDEX IF NOT EXISTS idx_levels_active ON alert_levels (active);
+CREATE TABLE IF NOT EXISTS alerts (
+    id           INTEGER PRIMARY KEY AUTOINCREMENT,
+    ticker       TEXT NOT NULL,
+    label        TEXT NOT NULL,
+    level        REAL NOT NULL,
+    price        REAL NOT NULL,
+    direction    TEXT NOT NULL,
+    triggered_at REAL NOT NULL,
+    seen         INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_alerts_time ON alerts (triggered_at);
+"""
+
+def _db():
+    return session(DB_NAME, SCHEMA)
+
+# ------------------------------------------------------------------
+# [2] 감시 레벨 등록
+# ------------------------------------------------------------------
+def levels_from_scenarios(levels):
+    """stock.calculate_scenarios 결과에서 감시할 핵심 레벨만 뽑습니다."""
+    return {
+        "Pivot R1": levels['pivot']['R1'],
+        "Pivot S1": levels['pivot']['S1'],
+        "Fib 0.618": levels['fib']['0.618'],
+        "Fib Ext 1.618": levels['fib']['ext_1.618'],
+        "Wave E-Value": levels['wave']['e_value'],
+        "ATR Stop Loss": levels['stop_loss'],
+    }
+
+def save_levels(ticker, named_levels, current_price):
+    """레벨을 (재)등록합니다. 현재가보다 위면 '상향 돌파', 아래면 '하향 이탈'을 감시."""
+    now = time.time()
+    rows = [
+        (ticker.upper(), label, float(price), 'above' if price > current_price else 'below', now)
+        for label, price in named_levels.items() if pd.notna(price)
+    ]
+    with _db() as conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO alert_levels (ticker, label, price, direction, created_at, active) "
+            "VALUES (?, ?, ?, ?, ?, 1)", rows
+        )
+    return len(rows)
+
+def active_levels():
+    with _db() as conn:
+        return pd.read_sql_query(
+            "SELECT ticker, label, price, direction FROM alert_levels WHERE active = 1", conn
+        )
+
+# ------------------------------------------------------------------
+# [3] 평가 (벡터 연산)
+# ------------------------------------------------------------------
+def evaluate(levels_df, last_prices):
+    """
+    levels_df: active_levels() 결과, last_prices: {티커: 현재가}
+    반환: 돌파/이탈한 행만 담은 DataFrame (+ 'last' 컬럼)
+    """
+    if levels_df.empty:
+        return levels_df.assign(last=[])
+
+    # 티커를 정수 코드로 바꿔 가격 벡터에서 한 번에 조회 (행 단위 파이썬 루프 없음)
+    codes, uniques = pd.factorize(levels_df['ticker'])
+    price_vec = np.array([last_prices.get(t, np.nan) for t in uniques], dtype=float)
+    last = price_vec[codes]
+
+    level = levels_df['price'].to_numpy(dtype=float)
+    above = levels_df['direction'].to_numpy() == 'above'
+    hit = np.where(above, last >= level, last <= level) & np.isfinite(last)
+
+    return levels_df[hit].assign(last=last[hit])
+
+def fetch_last_prices(tickers):
+    """관심 종목 현재가를 한 번의 배치 호출로 가져옵니다."""
+    close = download_close(tickers, period="5d")
+    if close.empty:
+        return {}
+    last = close.ffill().iloc[-1]
+    return {t: float(p) for t, p in last.items() if pd.notna(p)}
+
+def run_cycle():
+    """레벨 로드 -> 일괄 시세 -> 평가 -> 알림 기록. 발생한 알림 건수를 반환."""
+    levels_df = active_levels()
+    if levels_df.empty:
+        return 0
+
+    prices = fetch_last_prices(levels_df['ticker'].unique().tolist())
+    triggered = evaluate(levels_df, prices)
+    if triggered.empty:
+        return 0
+
+    now = time.time()
+    with _db() as conn:
+        conn.executemany(
+            "INSERT INTO alerts (ticker, label, level, price, direction, triggered_at) VALUES (?, ?, ?, ?, ?, ?)",
+            [(r.ticker, r.label, r.price, r.last, r.direction, now) for r in triggered.itertuples()]
+        )
+        # 한 번 울린 레벨은 비활성화 (다시 등록하기 전까지 중복 알림 방지)
+        conn.executemany(
+            "UPDATE alert_levels SET active = 0 WHERE ticker = ? AND label = ?",
+            [(r.ticker, r.label) for r in triggered.itertuples()]
+        )
+    return len(triggered)
+
+# ------------------------------------------------------------------
+# [4] 조회 (홈 화면용)
+# ------------------------------------------------------------------
+def recent_alerts(limit=20, unseen_only=False):
+    sql = "SELECT id, ticker, label, level, price, direction, triggered_at, seen FROM alerts"
+    if unseen_only:
+        sql += " WHERE seen = 0"
+    sql += " ORDER BY triggered_at DESC LIMIT ?"
+    with _db() as conn:
+        df = pd.read_sql_query(sql, conn, params=[limit])
+    df['triggered_at'] = pd.to_datetime(df['triggered_at'], unit='s', utc=True).dt.tz_convert('Asia/Seoul')
+    return df
+
+def mark_seen(ids=None):
+    with _db() as conn:
+        if ids is None:
+            conn.execute("UPDATE alerts SET seen = 1 WHERE seen = 0")
+        else:
+            conn.executemany("UPDATE alerts SET seen = 1 WHERE id = ?", [(int(i),) for i in ids])
+
+# ------------------------------------------------------------------
+# [5] 백그라운드 실행: python -m core.alerts --interval 300
+# ------------------------------------------------------------------
+def run_forever(interval=DEFAULT_INTERVAL):
+    scheduler.every(interval, lambda: f"새 알림 {run_cycle()}건", "alerts")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="손절/목표 레벨 돌파 감시")
+    parser.add_argument("--interval", type=int, default=DEFAULT_INTERVAL, help="점검 주기(초)")
+    parser.add_argument("--once", action="store_true", help="한 번만 점검하고 종료")
+    args = parser.parse_args()
+
+    if args.once:
+        print(f"새 알림 {run_cycle()}건")
+    else:
+        run_forever(args.interval)
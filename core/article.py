@@ -0,0 +1,166 @@
+import re
+import time
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from core import http_client
+from core.html_extract import extract_text, decode_html
+from core.storage import session
+
+try:
+    import lxml.html as _lxml_html
+except ImportError:
+    _lxml_html = None
+
+# ------------------------------------------------------------------
+# [1] 주소 정규화 (같은 글은 같은 캐시 키로)
+# ------------------------------------------------------------------
+TRACKING_PARAMS = re.compile(r"^(utm_|fbclid$|gclid$|igshid$|from$|trackingCode$)")
+
+def canonical_url(url):
+    """추적 파라미터·#조각을 떼고, 네이버 블로그는 본문이 있는 PostView 주소로 바꿉니다."""
+    url = url.strip()
+    # 네이버 블로그: blog.naver.com/아이디/글번호 -> iframe 안의 진짜 주소(PostView)
+    match = re.search(r'(?:m\.)?blog\.naver\.com/([^/?#]+)/([0-9]+)', url)
+    if match:
+        blog_id, log_no = match.groups()
+        return f"https://blog.naver.com/PostView.naver?blogId={blog_id}&logNo={log_no}"
+
+    parts = urlsplit(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if not TRACKING_PARAMS.match(k)]
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or "/", urlencode(query), ""))
+
+# ------------------------------------------------------------------
+# [2] 본문 추출 (텍스트 밀도 / 링크 밀도 기반, readability 방식)
+# ------------------------------------------------------------------
+# 메뉴·광고·댓글 등으로 보이는 class/id
+BOILERPLATE = re.compile(
+    r"comment|reply|footer|header|sidebar|side_|aside|banner|advert|\bad[s_-]|sponsor|share|sns|social|"
+    r"related|recommend|popular|menu|nav|gnb|lnb|popup|modal|subscribe|copyright|breadcrumb|tag_?list",
+    re.I,
+)
+POSITIVE = re.compile(r"article|content|post|entry|main|body|text|se-main-container|view", re.I)
+DROP_TAGS = ("script", "style", "noscript", "nav", "header", "footer", "aside", "form", "iframe", "button", "svg")
+BLOCK_TAGS = ("p", "td", "pre", "li", "h2", "h3", "blockquote")
+MIN_BLOCK_TEXT = 25
+MIN_ARTICLE_CHARS = 200  # 이보다 짧은 본문은 추출 실패로 간주
+
+def _class_weight(el):
+    label = f"{el.get('class', '')} {el.get('id', '')}"
+    weight = 0
+    if BOILERPLATE.search(label):
+        weight -= 25
+    if POSITIVE.search(label):
+        weight += 25
+    return weight
+
+def _text_len(el):
+    return len(" ".join(el.text_content().split()))
+
+def _link_density(el):
+    total = _text_len(el)
+    if total == 0:
+        return 1.0
+    links = sum(len(" ".join(a.text_content().split())) for a in el.iter("a"))
+    return links / total
+
+def _paragraphs(el):
+    """본문 노드를 문단 단위 문자열 목록으로"""
+    leaf_tags = set(BLOCK_TAGS) | {"div"}
+    lines = []
+    for block in el.iter(*leaf_tags):
+        # 안에 또 블록이 있는 노드는 건너뛰고 말단 블록만 사용 (중복 방지)
+        if any(d.tag in leaf_tags for d in block.iterdescendants()):
+            continue
+        text = " ".join(block.text_content().split())
+        if text and (not lines or lines[-1] != text):
+            lines.append(text)
+    return lines or [" ".join(el.text_content().split())]
+
+def extract_main_content(html):
+    """페이지에서 본문으로 보이는 영역만 골라 (제목, 본문) 반환. 실패 시 전체 텍스트로 대체."""
+    html = decode_html(html)
+    if _lxml_html is None or not html.strip():
+        return "", extract_text(html)
+
+    try:
+        root = _lxml_html.document_fromstring(html)
+    except Exception:
+        return "", extract_text(html)
+
+    title_el = root.find(".//title")
+    title = " ".join(title_el.text_content().split()) if title_el is not None else ""
+
+    # 1. 확실한 잡동사니 제거 (태그 + class/id 패턴)
+    for el in list(root.iter(*DROP_TAGS)):
+        el.drop_tree()
+    for el in list(root.iter("div", "section", "ul", "table")):
+        if el.getparent() is not None and _class_weight(el) < 0 and _link_density(el) > 0.3:
+            el.drop_tree()
+
+    # 2. 문단마다 점수를 매겨 부모(100%)·조부모(50%)에게 누적
+    scores = {}
+    for block in root.iter(*BLOCK_TAGS, "div"):
+        if block.tag == "div" and any(c.tag in ("div", "p", "table") for c in block):
+            continue
+        length = _text_len(block)
+        if length < MIN_BLOCK_TEXT:
+            continue
+        text = block.text_content()
+        score = 1 + text.count(",") + text.count("，") + text.count(".") * 0.5 + min(length / 100, 3)
+        parent = block.getparent()
+        grand = parent.getparent() if parent is not None else None
+        for ancestor, share in ((parent, 1.0), (grand, 0.5)):
+            if ancestor is None or not isinstance(ancestor.tag, str):
+                continue
+            if ancestor not in scores:
+                scores[ancestor] = _class_weight(ancestor)
+            scores[ancestor] += score * share
+
+    if not scores:
+        return title, extract_text(html)
+
+    # 3. 링크가 많은 영역(메뉴/추천글)은 감점 후 최고점 선택
+    best = max(scores, key=lambda el: scores[el] * (1 - _link_density(el)))
+    text = "\n".join(_paragraphs(best))
+
+    # 본문이 너무 짧으면 추출 실패로 보고 전체 텍스트 사용
+    if len(text) < MIN_ARTICLE_CHARS:
+        return title, extract_text(html)
+    return title, text
+
+# ------------------------------------------------------------------
+# [3] URL 단위 캐시 (다시 방문하면 네트워크·파싱 없음)
+# ------------------------------------------------------------------
+DB_NAME = "articles"
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    url        TEXT PRIMARY KEY,
+    title      TEXT,
+    text       TEXT NOT NULL,
+    raw_chars  INTEGER,
+    fetched_at REAL NOT NULL
+);
+"""
+CACHE_TTL = 3600 * 24 * 7
+SHORT_TTL = 60 * 10  # 본문이 너무 짧게 나온 결과(차단 페이지·로딩 중 화면 등)는 10분만 재사용
+
+def get_article(url, timeout=10, ttl=CACHE_TTL):
+    """
+    정규화된 URL로 캐시를 먼저 확인하고, 없으면 내려받아 본문만 추출해 저장합니다.
+    반환: {'url', 'title', 'text', 'raw_chars', 'cached'}
+    """
+    key = canonical_url(url)
+    with session(DB_NAME, SCHEMA) as conn:
+        row = conn.execute("SELECT * FROM articles WHERE url = ?", (key,)).fetchone()
+    if row is not None and time.time() - row["fetched_at"] < (ttl if len(row["text"]) >= MIN_ARTICLE_CHARS else min(ttl, SHORT_TTL)):
+        return {"url": key, "title": row["title"], "text": row["text"], "raw_chars": row["raw_chars"], "cached": True}
+
+    response = http_client.get(key, timeout=timeout)
+    response.raise_for_status()
+    title, text = extract_main_content(response.content)
+    raw_chars = len(extract_text(response.content))
+
+    with session(DB_NAME, SCHEMA) as conn:
+        conn.execute("INSERT OR REPLACE INTO articles VALUES (?, ?, ?, ?, ?)",
+                     (key, title, text, raw_chars, time.time()))
+    return {"url": key, "title": title, "text": text, "raw_chars": raw_chars, "cached": False}
@@ -0,0 +1,144 @@
+import datetime
+import json
+import re
+
+import pandas as pd
+import yfinance as yf
+
+from core import http_client, llm
+from core.market_data import INDICES, download_close
+
+# ------------------------------------------------------------------
+# 아침 브리핑 데이터 (streamlit 없이도 실행 가능 -> 예약 작업에서 미리 계산)
+# ------------------------------------------------------------------
+def korea_today():
+    korea_now = datetime.datetime.utcnow() + datetime.timedelta(hours=9)
+    return korea_now.date()
+
+# ------------------------------------------------------------------
+# [1] 오늘의 브리핑 (날씨 / 역사·명언)
+# ------------------------------------------------------------------
+WEATHER_URL = "https://api.open-meteo.com/v1/forecast?latitude=36.35&longitude=127.38&current_weather=true&timezone=Asia%2FSeoul"
+
+def weather():
+    """대전 현재 날씨 문자열. 실패하면 예외를 그대로 올림 (이전 스냅샷 유지)"""
+    data = http_client.get(WEATHER_URL, timeout=5).json()
+    temp = data['current_weather']['temperature']
+    code = data['current_weather']['weathercode']
+
+    w_text = "맑음 ☀️"
+    if code in [1, 2, 3]: w_text = "구름 조금 ⛅"
+    elif code in [45, 48]: w_text = "안개 🌫️"
+    elif code in [51, 53, 55, 61, 63, 65, 80, 81, 82]: w_text = "비 🌧️"
+    elif code in [71, 73, 75, 77, 85, 86]: w_text = "눈 ❄️"
+    elif code >= 95: w_text = "뇌우 ⚡"
+
+    return f"{w_text} {temp}°C"
+
+def daily_content(day):
+    """오늘의 역사/명언 {'history', 'quote', 'author'} (실패 시 None)"""
+    today_str = pd.Timestamp(day).strftime("%Y년 %m월 %d일")
+    prompt = f"""
+    오늘은 {today_str}이다.
+    1. [역사]: 오늘 날짜의 흥미로운 세계사 사건 1개 (연도 포함).
+    2. [명언]: 민음사 세계문학 전집 스타일의 문장 1개 (출처 포함).
+    JSON 포맷: {{"history": "...", "quote": "...", "author": "..."}}
+    """
+    try:
+        match = re.search(r'\{.*\}', llm.generate(prompt), re.DOTALL)
+        return json.loads(match.group()) if match else None
+    except Exception:
+        return None
+
+# ------------------------------------------------------------------
+# [2] 미국 증시 (지표 / 관심 종목 / 히트맵 / AI 브리핑)
+# ------------------------------------------------------------------
+SPECIALS = {
+    "TSLA": "테슬라 (Tesla)",
+    "BTC-USD": "비트코인 (Bitcoin)",
+    "GOOGL": "구글 (Alphabet)"
+}
+
+SECTOR_MAP = {
+    "Big Tech": ["AAPL", "MSFT", "GOOGL", "AMZN", "META"],
+    "Semi & AI": ["NVDA", "AMD", "AVGO", "TSM", "INTC"],
+    "Auto": ["TSLA", "RIVN", "F", "GM"],
+    "Finance": ["JPM", "V", "MA", "BAC"],
+    "Health": ["LLY", "JNJ", "PFE"]
+}
+
+def market_summary():
+    """(종목별 {'price', 'change'}, 히트맵 행 목록)"""
+    all_tickers = list(INDICES.keys()) + list(SPECIALS.keys()) + [t for cat in SECTOR_MAP.values() for t in cat]
+    all_tickers = list(set(all_tickers))
+
+    # 게이트웨이 경유: 같은 순간 여러 세션이 열어도 다운로드는 한 번
+    data = download_close(all_tickers, period="5d")
+
+    summary = {}
+    for t in all_tickers:
+        series = data[t].dropna() if t in data.columns else pd.Series(dtype=float)
+        if len(series) >= 2:
+            curr = float(series.iloc[-1])
+            prev = float(series.iloc[-2])
+            summary[t] = {"price": curr, "change": (curr - prev) / prev * 100}
+        else:
+            summary[t] = {"price": 0, "change": 0}
+
+    heatmap = []
+    for sector, symbols in SECTOR_MAP.items():
+        for s in symbols:
+            if s in summary:
+                heatmap.append({"Sector": sector, "Ticker": s, "Change": summary[s]['change'], "Price": summary[s]['price']})
+    return summary, heatmap
+
+def special_news():
+    news_dict = {}
+    for ticker in SPECIALS.keys():
+        try:
+            items = yf.Ticker(ticker).news[:1]
+            news_dict[ticker] = items[0]['title'] if items else "뉴스 없음"
+        except Exception:
+            news_dict[ticker] = "로딩 실패"
+    return news_dict
+
+def combined_brief(summary, news_map):
+    vix = summary.get("^VIX", {}).get('price', 0)
+    usd = summary.get("KRW=X", {}).get('price', 0)
+
+    tsla = summary.get("TSLA", {})
+    btc = summary.get("BTC-USD", {})
+    googl = summary.get("GOOGL", {})
+
+    prompt = f"""
+    당신은 월스트리트 수석 전략가입니다.
+    한국 투자자를 위해 [미국 증시 마감 시황]과 [3대 관심 종목]을 브리핑하세요.
+
+    [1. 시장 지표]
+    - 나스닥 등락: {summary.get('^IXIC', {}).get('change', 0):.2f}%
+    - 공포지수(VIX): {vix:.2f} (높으면 공포)
+    - 환율: {usd:.1f}원
+
+    [2. Special 3 종목]
+    - 테슬라: {tsla.get('change', 0):.2f}% (뉴스: {news_map.get('TSLA')})
+    - 비트코인: {btc.get('change', 0):.2f}% (뉴스: {news_map.get('BTC-USD')})
+    - 구글: {googl.get('change', 0):.2f}% (뉴스: {news_map.get('GOOGL')})
+
+    [작성 요청]
+    1. **시장 총평**: 거시경제/금리 관점에서 시장 분위기 요약 (국장 영향 포함).
+    2. **테슬라 & 2차전지**: 주가 원인 분석 + 한국 2차전지주(에코프로 등) 영향.
+    3. **구글 & AI**: 빅테크 AI 흐름 분석 + 한국 반도체/SW주 영향.
+    4. **비트코인**: 가상자산 시장 분위기.
+    """
+    try:
+        return llm.generate(prompt)
+    except Exception:
+        return "브리핑 생성 실패"
+
+def us_market():
+    """미국 증시 화면 전체 데이터 {'summary', 'heatmap', 'news', 'brief'} (지표가 비면 None)"""
+    summary, heatmap = market_summary()
+    if not any(v["price"] for v in summary.values()):
+        return None
+    news = special_news()
+    return {"summary": summary, "heatmap": heatmap, "news": news, "brief": combined_brief(summary, news)}
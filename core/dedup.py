@@ -0,0 +1,126 @@
+import re
+import zlib
+
+import numpy as np
+
+# ------------------------------------------------------------------
+# [1] 설정
+# ------------------------------------------------------------------
+NUM_PERM = 64          # MinHash 서명 길이
+BANDS = 16             # LSH 밴드 수 (밴드당 4행 -> 유사도 약 0.5부터 후보로 잡힘)
+SHINGLE = 3            # 글자 3-gram (한국어는 띄어쓰기가 들쭉날쭉해서 단어보다 글자 단위가 안정적)
+THRESHOLD = 0.5        # 추정 자카드 유사도가 이 이상이면 같은 기사로 간주
+MERSENNE = np.uint64((1 << 61) - 1)
+
+# 게임 홍보·광고성 제목 (뉴스가 아님)
+SPAM_PATTERNS = [
+    r"컴투스\s*프로야구", r"프로야구\s*(H2|H3|V\d+|라이브|매니저)", r"야구\s*게임", r"모바일\s*게임",
+    r"사전\s*예약", r"쿠폰", r"이벤트\s*진행", r"업데이트\s*실시", r"출시\s*기념", r"\bMLB\s*9이닝스",
+]
+_SPAM = re.compile("|".join(SPAM_PATTERNS), re.I)
+
+_rng = np.random.default_rng(20240301)  # 고정 시드 -> 실행마다 같은 서명
+_A = _rng.integers(1, int(MERSENNE), size=NUM_PERM, dtype=np.uint64)
+_B = _rng.integers(0, int(MERSENNE), size=NUM_PERM, dtype=np.uint64)
+
+# ------------------------------------------------------------------
+# [2] 정규화 & 서명
+# ------------------------------------------------------------------
+def normalize_title(title):
+    """'[포토] 제목 - 스포츠조선' -> '제목' (언론사 꼬리표·말머리·문장부호 제거)"""
+    t = re.sub(r"\s+-\s+[^-]{1,30}$", "", title or "")       # 구글 뉴스가 붙이는 ' - 언론사'
+    t = re.sub(r"^\s*[\[(【<][^\])】>]{1,10}[\])】>]\s*", "", t)  # [단독] (종합) 등 말머리
+    t = re.sub(r"[^\w가-힣]+", "", t.lower())
+    return t
+
+def is_spam(title):
+    return bool(_SPAM.search(title or ""))
+
+def _shingles(text):
+    if len(text) <= SHINGLE:
+        return [text] if text else []
+    return [text[i:i + SHINGLE] for i in range(len(text) - SHINGLE + 1)]
+
+def _shift32_mod(x):
+    """x * 2^32 mod p (x < p = 2^61-1). 2^61 ≡ 1 (mod p) 이므로 x를 29비트 경계에서 나눠 곱셈 없이 계산"""
+    return ((x >> np.uint64(29)) + ((x & np.uint64((1 << 29) - 1)) << np.uint64(32))) % MERSENNE
+
+def minhash_signatures(texts):
+    """모든 문서의 MinHash 서명을 한 번에 계산 -> (문서 수 x NUM_PERM)"""
+    hashes, offsets = [], []
+    for text in texts:
+        offsets.append(len(hashes))
+        sh = _shingles(text) or [""]
+        hashes.extend(zlib.crc32(s.encode()) for s in set(sh))
+
+    h = np.asarray(hashes, dtype=np.uint64)
+    # (a*h + b) mod p 를 모든 순열 x 모든 shingle에 대해 한 번에.
+    # a(61비트) x h(32비트)는 uint64를 넘으므로 a = a_hi * 2^32 + a_lo 로 쪼개 각 곱이 2^64 안에 들도록 계산
+    a_hi, a_lo = _A >> np.uint64(32), _A & np.uint64(0xFFFFFFFF)
+    hi = _shift32_mod((a_hi[:, None] * h[None, :]) % MERSENNE)   # a_hi < 2^29 -> 곱 < 2^61
+    lo = (a_lo[:, None] * h[None, :]) % MERSENNE                   # a_lo < 2^32 -> 곱 < 2^64
+    mixed = (hi + lo + _B[:, None]) % MERSENNE                     # 세 항 모두 p 미만 -> 합 < 2^63
+    # 문서별 구간 최솟값
+    return np.minimum.reduceat(mixed, np.asarray(offsets), axis=1).T
+
+# ------------------------------------------------------------------
+# [3] LSH 후보 -> 검증 -> 묶기
+# ------------------------------------------------------------------
+def cluster_texts(texts, threshold=THRESHOLD):
+    """비슷한 문장끼리 묶은 클러스터 목록 (각 클러스터는 원래 인덱스 리스트, 입력 순서 유지)"""
+    n = len(texts)
+    if n == 0:
+        return []
+    sig = minhash_signatures(texts)
+    rows = NUM_PERM // BANDS
+
+    parent = list(range(n))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for b in range(BANDS):
+        buckets = {}
+        band = sig[:, b * rows:(b + 1) * rows]
+        for i in range(n):
+            buckets.setdefault(band[i].tobytes(), []).append(i)
+        for members in buckets.values():
+            first = members[0]
+            for other in members[1:]:
+                ri, rj = find(first), find(other)
+                if ri == rj:
+                    continue
+                # 후보 쌍만 서명 전체로 유사도 검증
+                if np.mean(sig[first] == sig[other]) >= threshold:
+                    parent[max(ri, rj)] = min(ri, rj)
+
+    clusters = {}
+    for i in range(n):
+        clusters.setdefault(find(i), []).append(i)
+    return sorted(clusters.values(), key=lambda c: c[0])
+
+def dedupe(items, key="title", threshold=THRESHOLD, drop_spam=True):
+    """
+    스팸 제거 후 비슷한 제목을 묶어 대표 기사(목록에서 먼저 나온 것 = 최신)만 남깁니다.
+    반환: (대표 목록, {'input', 'spam', 'duplicates', 'output'})
+    대표 기사에는 'dupes'(묶인 기사 수 - 1) 키가 추가됩니다.
+    """
+    kept = [it for it in items if not (drop_spam and is_spam(it.get(key)))]
+    clusters = cluster_texts([normalize_title(it.get(key)) for it in kept], threshold)
+
+    reps = []
+    for members in clusters:
+        rep = dict(kept[members[0]])
+        rep["dupes"] = len(members) - 1
+        reps.append(rep)
+
+    stats = {
+        "input": len(items),
+        "spam": len(items) - len(kept),
+        "duplicates": len(kept) - len(reps),
+        "output": len(reps),
+    }
+    return reps, stats
@@ -0,0 +1,90 @@
+import hashlib
+import json
+import time
+
+import feedparser
+
+from core.storage import session
+
+# ------------------------------------------------------------------
+# [1] 스키마 (피드별 마지막 상태)
+# ------------------------------------------------------------------
+DB_NAME = "feeds"
+MIN_POLL_INTERVAL = 300  # 5분 안에 다시 열면 네트워크 요청 자체를 생략
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS feed_state (
+    url       TEXT PRIMARY KEY,
+    etag      TEXT,
+    modified  TEXT,
+    digest    TEXT,
+    entries   TEXT,
+    polled_at REAL
+);
+"""
+
+# ------------------------------------------------------------------
+# [2] 헬퍼
+# ------------------------------------------------------------------
+def entry_key(entry):
+    """GUID가 있으면 GUID, 없으면 링크로 기사 식별"""
+    return entry.get("id") or entry.get("guid") or entry.get("link") or entry.get("title", "")
+
+def normalize(entry):
+    source = entry.get("source")
+    parsed = entry.get("published_parsed") or entry.get("updated_parsed")
+    return {
+        "key": entry_key(entry),
+        "title": entry.get("title", ""),
+        "link": entry.get("link", ""),
+        "published": entry.get("published", ""),
+        # 정렬·기간 조회용 UTC ISO 시각 (피드마다 날짜 형식이 달라도 비교 가능)
+        "published_at": time.strftime("%Y-%m-%dT%H:%M:%S", parsed) if parsed else "",
+        "source": source.get("title", "뉴스") if source else "뉴스",
+    }
+
+def digest_of(entries):
+    """기사 식별자 목록의 해시. 순서가 바뀌어도 같은 기사 묶음이면 같은 값."""
+    keys = sorted(e["key"] for e in entries)
+    return hashlib.sha1("\n".join(keys).encode()).hexdigest()
+
+# ------------------------------------------------------------------
+# [3] 조건부 폴링
+# ------------------------------------------------------------------
+def poll_feed(url, min_interval=MIN_POLL_INTERVAL):
+    """
+    etag / modified를 feedparser에 넘겨 바뀐 경우에만 본문을 받습니다.
+    반환: (entries, digest, status)  status: 'cached'(요청 생략) / 'not-modified'(304) / 'unchanged' / 'updated'
+    """
+    with session(DB_NAME, SCHEMA) as conn:
+        row = conn.execute("SELECT * FROM feed_state WHERE url = ?", (url,)).fetchone()
+
+    if row is not None and row["entries"] and time.time() - (row["polled_at"] or 0) < min_interval:
+        return json.loads(row["entries"]), row["digest"], "cached"
+
+    feed = feedparser.parse(
+        url,
+        etag=row["etag"] if row else None,
+        modified=row["modified"] if row else None,
+    )
+    now = time.time()
+    status_code = getattr(feed, "status", None)
+
+    if status_code == 304 and row is not None and row["entries"]:
+        with session(DB_NAME, SCHEMA) as conn:
+            conn.execute("UPDATE feed_state SET polled_at = ? WHERE url = ?", (now, url))
+        return json.loads(row["entries"]), row["digest"], "not-modified"
+
+    entries = [normalize(e) for e in feed.entries]
+    if not entries and row is not None and row["entries"]:
+        # 일시적 오류로 빈 피드가 오면 이전 결과 유지
+        return json.loads(row["entries"]), row["digest"], "unchanged"
+
+    digest = digest_of(entries)
+    status = "unchanged" if row is not None and row["digest"] == digest else "updated"
+    with session(DB_NAME, SCHEMA) as conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO feed_state VALUES (?, ?, ?, ?, ?, ?)",
+            (url, feed.get("etag"), feed.get("modified"), digest, json.dumps(entries, ensure_ascii=False), now)
+        )
+    return entries, digest, status
@@ -0,0 +1,171 @@
+import argparse
+import time
+
+# ------------------------------------------------------------------
+# [1] 파서 백엔드 선택 (빠른 것부터, 설치된 것만)
+# ------------------------------------------------------------------
+# selectolax(C 기반, 가장 빠름) > lxml > 파이썬 내장 html.parser 순으로 자동 선택
+try:
+    from selectolax.lexbor import LexborHTMLParser as _SelectolaxParser
+except ImportError:
+    try:
+        # 1.0 이전 버전은 Modest 백엔드만 제공
+        from selectolax.parser import HTMLParser as _SelectolaxParser
+    except ImportError:
+        _SelectolaxParser = None
+
+try:
+    import lxml.html as _lxml_html
+except ImportError:
+    _lxml_html = None
+
+from bs4 import BeautifulSoup, UnicodeDammit
+
+BS4_PARSER = "lxml" if _lxml_html is not None else "html.parser"
+BACKEND = "selectolax" if _SelectolaxParser is not None else f"bs4+{BS4_PARSER}"
+
+# 본문 텍스트를 뽑을 때 버리는 태그
+DEFAULT_DROP = ("script", "style", "noscript", "header", "footer", "nav", "iframe")
+
+def decode_html(html):
+    """바이트로 받은 응답은 <meta charset>을 존중해서 디코딩 (네이버 구형 페이지는 EUC-KR)"""
+    if isinstance(html, bytes):
+        return UnicodeDammit(html, user_encodings=["utf-8", "euc-kr"], is_html=True).unicode_markup or ""
+    return html
+
+# ------------------------------------------------------------------
+# [2] CSS 선택자 헬퍼 (백엔드가 달라도 같은 사용법)
+# ------------------------------------------------------------------
+class Node:
+    """selectolax 노드 / BeautifulSoup 태그를 같은 모양으로 감싼 객체"""
+
+    def __init__(self, raw):
+        self._raw = raw
+
+    def select(self, css):
+        if BACKEND == "selectolax":
+            return [Node(n) for n in self._raw.css(css)]
+        return [Node(n) for n in self._raw.select(css)]
+
+    def select_one(self, css):
+        if BACKEND == "selectolax":
+            n = self._raw.css_first(css)
+        else:
+            n = self._raw.select_one(css)
+        return Node(n) if n is not None else None
+
+    def text(self, strip=True, separator=""):
+        if BACKEND == "selectolax":
+            return self._raw.text(separator=separator, strip=strip)
+        return self._raw.get_text(separator=separator, strip=strip)
+
+    def attr(self, name, default=None):
+        value = self._raw.attributes.get(name) if BACKEND == "selectolax" else self._raw.get(name)
+        return value if value is not None else default
+
+    def __getitem__(self, name):
+        value = self.attr(name)
+        if value is None:
+            raise KeyError(name)
+        return value
+
+
+class Document(Node):
+    """파싱된 HTML 문서. 디버그용 미리보기는 요청할 때만 만듭니다."""
+
+    def __init__(self, html):
+        self.html = decode_html(html)
+        if BACKEND == "selectolax":
+            super().__init__(_SelectolaxParser(self.html))
+        else:
+            super().__init__(BeautifulSoup(self.html, BS4_PARSER))
+
+    def preview(self, limit=1000):
+        # prettify()는 문서 전체를 다시 직렬화하므로 비쌈 -> 원문 앞부분만 잘라서 보여줌
+        return self.html[:limit]
+
+
+def parse(html):
+    return Document(html)
+
+# ------------------------------------------------------------------
+# [3] 본문 텍스트 추출 (트리 순회 최소화)
+# ------------------------------------------------------------------
+def extract_text(html, drop=DEFAULT_DROP, separator=" "):
+    """HTML에서 불필요한 태그를 버리고 텍스트만 빠르게 뽑습니다."""
+    html = decode_html(html)
+    if not html.strip():
+        return ""
+
+    if _SelectolaxParser is not None:
+        tree = _SelectolaxParser(html)
+        tree.strip_tags(list(drop))
+        root = tree.body or tree.root
+        return root.text(separator=separator, strip=True) if root else ""
+
+    if _lxml_html is not None:
+        try:
+            root = _lxml_html.document_fromstring(html)
+        except Exception:
+            root = None
+        if root is not None:
+            # 순회 중에 지우면 다음 형제를 건너뜀 -> 목록으로 먼저 모은 뒤 제거
+            for el in list(root.iter(*drop)):
+                # 태그 뒤에 붙은 텍스트(tail)는 본문이므로 살려둠
+                el.drop_tree()
+            chunks = (t.strip() for t in root.itertext())
+            return separator.join(t for t in chunks if t)
+
+    soup = BeautifulSoup(html, "html.parser")
+    for tag in soup(list(drop)):
+        tag.decompose()
+    return soup.get_text(separator=separator, strip=True)
+
+# ------------------------------------------------------------------
+# [4] 벤치마크: python -m core.html_extract --bench page1.html page2.html ...
+# ------------------------------------------------------------------
+def _synthetic_page(n_items):
+    """저장된 HTML이 없을 때 쓰는 네이버 목록 페이지 모양의 가짜 문서"""
+    items = "".join(
+        f"<li><dl><dt><a href='https://n.news.naver.com/{i}'>사설 제목 {i}</a></dt>"
+        f"<dd><span class='lede'>요약 {i} " + "본문 " * 20 + "</span><span class='date'>1시간전</span></dd></dl></li>"
+        for i in range(n_items)
+    )
+    return (f"<html><head><script>var x = 1;</script><style>a{{}}</style></head><body><nav>메뉴</nav>"
+            f"<ul class='type06_headline'>{items}</ul></body></html>")
+
+def _time(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t)
+    return best * 1000
+
+def benchmark(pages, repeat=5):
+    """페이지 크기별로 백엔드마다 파싱/텍스트 추출 시간을 재서 표(list of dict)로 돌려줍니다."""
+    rows = []
+    for label, html in pages:
+        row = {"page": label, "size_kb": round(len(html.encode()) / 1024, 1)}
+        row["bs4 html.parser"] = _time(lambda: BeautifulSoup(html, "html.parser").select("ul li"), repeat)
+        if _lxml_html is not None:
+            row["bs4 lxml"] = _time(lambda: BeautifulSoup(html, "lxml").select("ul li"), repeat)
+        if _SelectolaxParser is not None:
+            row["selectolax"] = _time(lambda: _SelectolaxParser(html).css("ul li"), repeat)
+        row[f"extract_text ({BACKEND})"] = _time(lambda: extract_text(html), repeat)
+        rows.append(row)
+    return rows
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="HTML 파서 백엔드 속도 비교 (단위: ms)")
+    parser.add_argument("--bench", nargs="*", default=None, help="저장해 둔 HTML 파일 경로들")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.bench:
+        pages = [(path, decode_html(open(path, "rb").read())) for path in args.bench]
+    else:
+        pages = [(f"synthetic x{n}", _synthetic_page(n)) for n in (20, 200, 2000)]
+
+    for row in benchmark(pages, args.repeat):
+        print(" | ".join(f"{k}: {v:.2f}" if isinstance(v, float) else f"{k}: {v}" for k, v in row.items()))
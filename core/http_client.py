@@ -0,0 +1,280 @@
+import email.utils
+import json
+import re
+import tempfile
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.retry import Retry
+
+from core.storage import session as db_session
+
+# ------------------------------------------------------------------
+# [1] 공용 세션 (Keep-Alive 커넥션 풀)
+# ------------------------------------------------------------------
+# requests는 HTTP/2를 지원하지 않으므로, 대신 호스트별 커넥션을 재사용해 DNS/TCP/TLS 비용을 없앱니다.
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+}
+DEFAULT_TIMEOUT = 10
+MAX_CACHE_BODY = 5 * 1024 * 1024  # 5MB 넘는 응답은 디스크 캐시에 저장하지 않음
+MAX_DOWNLOAD = 100 * 1024 * 1024  # 파일 다운로드 최대 크기
+SPOOL_MEMORY = 8 * 1024 * 1024    # 이보다 큰 다운로드는 메모리 대신 임시 파일에 기록
+DOWNLOAD_CHUNK = 256 * 1024
+
+def _build_session():
+    s = requests.Session()
+    # raise_on_status=False: 재시도를 다 써도 예외 대신 마지막 5xx 응답을 그대로 돌려줌 (기존 호출부 동작 유지)
+    retry = Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504), allowed_methods=("GET", "HEAD"),
+                  raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry)
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+    s.headers.update(DEFAULT_HEADERS)
+    return s
+
+SESSION = _build_session()
+
+# ------------------------------------------------------------------
+# [2] 디스크 HTTP 캐시 (ETag / Last-Modified / Cache-Control)
+# ------------------------------------------------------------------
+# 같은 URL이라도 Vary에 적힌 요청 헤더 값이 다르면 다른 응답 -> (url, variant) 단위로 저장
+DB_NAME = "http_cache"
+MAX_CACHE_AGE = 3600 * 24 * 14          # 이보다 오래 저장된 응답은 삭제
+MAX_CACHE_BYTES = 200 * 1024 * 1024     # 본문 합계가 넘으면 오래된 것부터 삭제
+PRUNE_EVERY = 50                        # 저장 N번마다 한 번 정리
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS http_responses (
+    url         TEXT NOT NULL,
+    variant     TEXT NOT NULL,
+    vary        TEXT NOT NULL,
+    status      INTEGER NOT NULL,
+    headers     TEXT NOT NULL,
+    body        BLOB NOT NULL,
+    size        INTEGER NOT NULL,
+    stored_at   REAL NOT NULL,
+    fresh_until REAL NOT NULL,
+    PRIMARY KEY (url, variant)
+);
+CREATE INDEX IF NOT EXISTS idx_http_responses_stored ON http_responses (stored_at);
+"""
+
+def _cache_control(headers):
+    """'max-age=60, no-cache' -> {'max-age': '60', 'no-cache': True}"""
+    directives = {}
+    for part in headers.get("Cache-Control", "").split(","):
+        part = part.strip().lower()
+        if not part:
+            continue
+        key, _, value = part.partition("=")
+        directives[key] = value.strip('"') if value else True
+    return directives
+
+def _http_date(value):
+    try:
+        return email.utils.parsedate_to_datetime(value).timestamp() if value else None
+    except (TypeError, ValueError):
+        return None
+
+def current_age(headers):
+    """RFC 9111 4.2.3: 중간 캐시(CDN)에서 이미 보낸 시간 (Age 헤더, 초)"""
+    try:
+        return max(0, int(headers.get("Age", 0)))
+    except (TypeError, ValueError):
+        return 0
+
+def _fresh_until(headers):
+    """지금부터 재검증 없이 쓸 수 있는 시각 (max-age 등에서 Age만큼 이미 소모됨)"""
+    return time.time() + freshness_lifetime(headers) - current_age(headers)
+
+def _vary_names(headers):
+    """응답의 Vary -> 소문자 헤더 이름 목록 ('*'면 None: 저장 불가)"""
+    names = [h.strip().lower() for h in headers.get("Vary", "").split(",") if h.strip()]
+    return None if "*" in names else sorted(set(names))
+
+def _variant(names, req_headers):
+    """Vary에 적힌 요청 헤더들의 실제 값 -> 저장 키"""
+    return json.dumps([[n, " ".join((req_headers.get(n) or "").split())] for n in names], ensure_ascii=False)
+
+def freshness_lifetime(headers, now=None):
+    """RFC 9111 4.2: 응답이 재검증 없이 재사용 가능한 시간(초)"""
+    now = now or time.time()
+    cc = _cache_control(headers)
+    if "no-cache" in cc or "no-store" in cc:
+        return 0
+    for key in ("s-maxage", "max-age"):
+        if key in cc:
+            try:
+                return max(0, int(cc[key]))
+            except ValueError:
+                return 0
+    expires = _http_date(headers.get("Expires"))
+    if expires is not None:
+        date = _http_date(headers.get("Date")) or now
+        return max(0, expires - date)
+    # 휴리스틱: Last-Modified만 있으면 (경과 시간의 10%) 동안 신선하다고 간주
+    last_modified = _http_date(headers.get("Last-Modified"))
+    if last_modified is not None:
+        date = _http_date(headers.get("Date")) or now
+        return max(0, (date - last_modified) * 0.1)
+    return 0
+
+def _load(url, req_headers):
+    """이 요청 헤더와 Vary 값이 맞는 저장본 (없으면 None)"""
+    with db_session(DB_NAME, SCHEMA) as conn:
+        rows = conn.execute("SELECT * FROM http_responses WHERE url = ?", (url,)).fetchall()
+    for row in rows:
+        if row["variant"] == _variant(json.loads(row["vary"]), req_headers):
+            return row
+    return None
+
+_stores = 0
+
+def _store(url, vary, variant, status, headers, body, fresh_until):
+    global _stores
+    with db_session(DB_NAME, SCHEMA) as conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO http_responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (url, variant, json.dumps(vary), status, json.dumps(dict(headers)), body, len(body), time.time(), fresh_until)
+        )
+        _stores += 1
+        if _stores % PRUNE_EVERY == 1:
+            _prune(conn)
+
+def _prune(conn, max_age=MAX_CACHE_AGE, max_bytes=MAX_CACHE_BYTES):
+    """오래된 응답 삭제 + 전체 크기가 넘으면 오래된 것부터 삭제"""
+    conn.execute("DELETE FROM http_responses WHERE stored_at < ?", (time.time() - max_age,))
+    total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM http_responses").fetchone()[0]
+    if total <= max_bytes:
+        return
+    doomed = []
+    for row in conn.execute("SELECT url, variant, size FROM http_responses ORDER BY stored_at"):
+        if total <= max_bytes:
+            break
+        doomed.append((row["url"], row["variant"]))
+        total -= row["size"]
+    conn.executemany("DELETE FROM http_responses WHERE url = ? AND variant = ?", doomed)
+
+def _touch(url, variant, headers, fresh_until):
+    with db_session(DB_NAME, SCHEMA) as conn:
+        conn.execute(
+            "UPDATE http_responses SET headers = ?, stored_at = ?, fresh_until = ? WHERE url = ? AND variant = ?",
+            (json.dumps(dict(headers)), time.time(), fresh_until, url, variant)
+        )
+
+def _as_response(row, url, from_cache, revalidated=False):
+    """캐시 행을 일반 requests.Response처럼 쓸 수 있게 변환 (.text / .json() / .content 그대로 사용)"""
+    resp = requests.Response()
+    resp.status_code = row["status"]
+    resp._content = row["body"]
+    resp.headers = CaseInsensitiveDict(json.loads(row["headers"]))
+    resp.url = url
+    resp.encoding = requests.utils.get_encoding_from_headers(resp.headers)
+    resp.from_cache = from_cache
+    resp.revalidated = revalidated
+    return resp
+
+# ------------------------------------------------------------------
+# [3] 공개 API
+# ------------------------------------------------------------------
+def get(url, headers=None, timeout=DEFAULT_TIMEOUT, cache=True, **kwargs):
+    """
+    공용 풀 세션으로 GET. cache=True면
+    - 신선한 캐시가 있으면 네트워크 없이 반환
+    - 오래된 캐시는 If-None-Match / If-Modified-Since로 재검증 -> 304면 본문 재사용
+    - 응답의 Vary에 적힌 요청 헤더 값이 다르면 별도 항목으로 저장
+    반환 객체에는 from_cache(네트워크 생략), revalidated(304) 속성이 붙습니다.
+    """
+    if not cache:
+        return SESSION.get(url, headers=headers, timeout=timeout, **kwargs)
+
+    now = time.time()
+    # 실제로 나가는 요청 헤더 (세션 기본값 + 호출자 헤더) 기준으로 Vary 비교
+    effective = CaseInsensitiveDict(SESSION.headers)
+    effective.update(headers or {})
+    try:
+        row = _load(url, effective)
+    except Exception:
+        row = None  # 캐시 DB 문제로 페이지가 멈추면 안 됨 -> 그냥 네트워크로
+
+    if row is not None and row["fresh_until"] > now:
+        return _as_response(row, url, from_cache=True)
+
+    req_headers = dict(headers or {})
+    if row is not None:
+        cached_headers = CaseInsensitiveDict(json.loads(row["headers"]))
+        if cached_headers.get("ETag"):
+            req_headers["If-None-Match"] = cached_headers["ETag"]
+        if cached_headers.get("Last-Modified"):
+            req_headers["If-Modified-Since"] = cached_headers["Last-Modified"]
+
+    resp = SESSION.get(url, headers=req_headers, timeout=timeout, **kwargs)
+
+    if resp.status_code == 304 and row is not None:
+        # 304: 새 헤더로 신선도만 갱신하고 저장된 본문 재사용
+        merged = CaseInsensitiveDict(json.loads(row["headers"]))
+        merged.update(resp.headers)
+        try:
+            _touch(url, row["variant"], merged, _fresh_until(merged))
+        except Exception:
+            pass
+        return _as_response({**dict(row), "headers": json.dumps(dict(merged))}, url, from_cache=False, revalidated=True)
+
+    resp.from_cache = False
+    resp.revalidated = False
+    cc = _cache_control(resp.headers)
+    validators = resp.headers.get("ETag") or resp.headers.get("Last-Modified")
+    lifetime = freshness_lifetime(resp.headers)
+    vary = _vary_names(resp.headers)
+    # 이 캐시는 대시보드 전용(private cache)이므로 'private' 응답도 저장 가능
+    cacheable = resp.status_code == 200 and "no-store" not in cc and vary is not None
+    if cacheable and (lifetime > 0 or validators) and len(resp.content) <= MAX_CACHE_BODY:
+        try:
+            _store(url, vary, _variant(vary, effective), resp.status_code, resp.headers, resp.content,
+                   _fresh_until(resp.headers))
+        except Exception:
+            pass
+    return resp
+
+def clear_cache(url_pattern=None):
+    """캐시 비우기 (url_pattern: 정규식, 없으면 전체)"""
+    with db_session(DB_NAME, SCHEMA) as conn:
+        if url_pattern is None:
+            conn.execute("DELETE FROM http_responses")
+            return
+        urls = [r["url"] for r in conn.execute("SELECT DISTINCT url FROM http_responses")]
+        conn.executemany("DELETE FROM http_responses WHERE url = ?",
+                         [(u,) for u in urls if re.search(url_pattern, u)])
+
+def download(url, headers=None, max_bytes=MAX_DOWNLOAD, deadline=60, timeout=DEFAULT_TIMEOUT, on_progress=None):
+    """
+    큰 파일을 조각 단위로 받아 SpooledTemporaryFile에 기록합니다. (작으면 메모리, 크면 디스크)
+    max_bytes를 넘거나 deadline(초) 안에 끝나지 않으면 중단하고 예외를 냅니다.
+    on_progress(받은 바이트, 전체 바이트 또는 None). 반환: 처음 위치로 되감긴 파일 객체
+    """
+    started = time.monotonic()
+    with SESSION.get(url, headers=headers, timeout=timeout, stream=True) as resp:
+        resp.raise_for_status()
+        length = int(resp.headers.get("Content-Length") or 0) or None
+        if length and length > max_bytes:
+            raise ValueError(f"파일이 너무 큽니다 ({length / 1e6:.0f}MB > {max_bytes / 1e6:.0f}MB)")
+
+        out = tempfile.SpooledTemporaryFile(max_size=SPOOL_MEMORY)
+        received = 0
+        try:
+            for block in resp.iter_content(DOWNLOAD_CHUNK):
+                received += len(block)
+                if received > max_bytes:
+                    raise ValueError(f"파일이 너무 큽니다 (>{max_bytes / 1e6:.0f}MB)")
+                if time.monotonic() - started > deadline:
+                    raise TimeoutError(f"다운로드가 {deadline}초 안에 끝나지 않았습니다")
+                out.write(block)
+                if on_progress:
+                    on_progress(received, length)
+        except Exception:
+            out.close()
+            raise
+    out.seek(0)
+    return out
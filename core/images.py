@@ -0,0 +1,119 @@
+import hashlib
+import io
+import math
+import time
+
+from PIL import Image, ImageOps
+
+from core.storage import session
+
+# ------------------------------------------------------------------
+# [1] 설정 (용도별 전처리 방식)
+# ------------------------------------------------------------------
+# Gemini는 큰 이미지를 내부에서 줄여 보므로 긴 변 1536px 정도면 인식 정확도는 그대로, 전송량은 수십분의 1
+PROFILES = {
+    # keep_original: 줄이거나 돌릴 필요가 없고 다시 압축해도 작아지지 않으면 원본을 그대로 보냄
+    "photo": {"max_side": 1536, "gray": False, "format": "JPEG", "quality": 85, "keep_original": True},    # 사물·풍경 (색 유지)
+    "document": {"max_side": 2048, "gray": True, "format": "JPEG", "quality": 80, "keep_original": False},  # 고지서·영수증 (글씨 대비 강조)
+}
+MIME = {"JPEG": "image/jpeg", "WEBP": "image/webp", "PNG": "image/png"}
+ORIENTATION = 0x0112  # EXIF 회전 정보 태그
+
+DB_NAME = "images"
+CACHE_KEEP = 200  # 최근 처리본만 보관
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS processed (
+    sha256         TEXT NOT NULL,
+    profile        TEXT NOT NULL,
+    data           BLOB NOT NULL,
+    mime           TEXT NOT NULL,
+    width          INTEGER NOT NULL,
+    height         INTEGER NOT NULL,
+    original_bytes INTEGER NOT NULL,
+    created_at     REAL NOT NULL,
+    PRIMARY KEY (sha256, profile)
+);
+CREATE INDEX IF NOT EXISTS idx_processed_created ON processed (created_at);
+"""
+
+def _db():
+    return session(DB_NAME, SCHEMA)
+
+# ------------------------------------------------------------------
+# [2] 전처리 (회전 보정 -> 축소 -> 흑백·대비 -> 압축)
+# ------------------------------------------------------------------
+def _read_bytes(source):
+    """바이트 / 업로드 파일 / 파일 객체 -> 원본 바이트"""
+    if isinstance(source, (bytes, bytearray)):
+        return bytes(source)
+    if hasattr(source, "getvalue"):
+        return source.getvalue()
+    source.seek(0)
+    data = source.read()
+    source.seek(0)
+    return data
+
+def _process(raw, max_side, gray, fmt, quality):
+    """반환: (압축본, (가로, 세로), 원본 MIME 또는 None). 크기·방향이 바뀌었으면 원본 MIME은 None"""
+    img = Image.open(io.BytesIO(raw))
+    source_mime = MIME.get(img.format)
+    w, h = img.size
+    scale = max_side / max(w, h)
+    if scale < 1:
+        source_mime = None
+        # JPEG는 디코딩 단계에서 1/2, 1/4 ... 크기로 바로 읽음 (1200만 화소 전체를 풀지 않음)
+        img.draft("L" if gray else "RGB", (math.ceil(w * scale), math.ceil(h * scale)))
+    if img.getexif().get(ORIENTATION, 1) != 1:
+        source_mime = None
+    img = ImageOps.exif_transpose(img)  # 폰 사진의 회전 정보(EXIF)를 실제 픽셀에 반영
+    img.thumbnail((max_side, max_side), Image.LANCZOS)
+    if gray:
+        img = ImageOps.autocontrast(img.convert("L"), cutoff=1)
+    elif img.mode not in ("RGB", "L"):
+        img = img.convert("RGB")  # 투명도(PNG) 등은 JPEG로 저장할 수 없음
+
+    out = io.BytesIO()
+    img.save(out, format=fmt, quality=quality, optimize=True)
+    return out.getvalue(), img.size, source_mime
+
+def prepare(source, profile="photo"):
+    """
+    비전 모델에 보낼 이미지. 같은 원본(SHA-256)·같은 용도면 저장된 처리본을 바로 반환.
+    반환: {'data', 'mime', 'size', 'original_bytes', 'bytes', 'saved', 'elapsed', 'cached'}
+    """
+    started = time.perf_counter()
+    raw = _read_bytes(source)
+    sha = hashlib.sha256(raw).hexdigest()
+
+    with _db() as conn:
+        row = conn.execute("SELECT * FROM processed WHERE sha256 = ? AND profile = ?", (sha, profile)).fetchone()
+    if row is not None:
+        data, mime, size, cached = row["data"], row["mime"], (row["width"], row["height"]), True
+    else:
+        opts = PROFILES[profile]
+        data, size, source_mime = _process(raw, opts["max_side"], opts["gray"], opts["format"], opts["quality"])
+        mime, cached = MIME[opts["format"]], False
+        if opts["keep_original"] and source_mime and len(data) >= len(raw):
+            data, mime = raw, source_mime  # 작은 PNG 등은 다시 압축하면 오히려 커짐
+        with _db() as conn:
+            conn.execute("INSERT OR REPLACE INTO processed VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                         (sha, profile, data, mime, size[0], size[1], len(raw), time.time()))
+            conn.execute("DELETE FROM processed WHERE rowid NOT IN "
+                         "(SELECT rowid FROM processed ORDER BY created_at DESC LIMIT ?)", (CACHE_KEEP,))
+
+    return {"data": data, "mime": mime, "size": size, "original_bytes": len(raw), "bytes": len(data),
+            "saved": len(raw) - len(data), "elapsed": time.perf_counter() - started, "cached": cached}
+
+def part(prepared):
+    """generate_content에 그대로 넣는 이미지 조각 (SDK가 다시 인코딩하지 않음)"""
+    return {"mime_type": prepared["mime"], "data": prepared["data"]}
+
+def report(prepared):
+    """'3.2MB → 180KB (94% 절감) · 1536×1152 · 전처리 85ms'"""
+    def fmt(n):
+        return f"{n / 1e6:.1f}MB" if n >= 1e6 else f"{n / 1e3:.0f}KB" if n >= 1e3 else f"{n}B"
+    ratio = prepared["saved"] / prepared["original_bytes"] * 100 if prepared["original_bytes"] else 0
+    source = "저장본" if prepared["cached"] else "전처리"
+    saving = f"{ratio:.0f}% 절감" if ratio > 0 else "압축 효과 없음"
+    return (f"{fmt(prepared['original_bytes'])} → {fmt(prepared['bytes'])} ({saving}) · "
+            f"{prepared['size'][0]}×{prepared['size'][1]} · {source} {prepared['elapsed'] * 1000:.0f}ms")
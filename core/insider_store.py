@@ -0,0 +1,182 @@
+import datetime
+import hashlib
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import pandas as pd
+import yfinance as yf
+
+from core.storage import session
+
+# ------------------------------------------------------------------
+# [1] 스키마
+# ------------------------------------------------------------------
+DB_NAME = "insider"
+REFRESH_INTERVAL = 3600 * 12   # 같은 종목은 12시간에 한 번만 새로 받음
+EMPTY_INTERVAL = 3600 * 3       # 거래가 없던 종목(빈 응답)은 3시간 뒤 다시 확인
+MAX_WORKERS = 8
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS insider_tx (
+    ticker      TEXT NOT NULL,
+    filing_key  TEXT NOT NULL,
+    start_date  TEXT,
+    insider     TEXT,
+    position    TEXT,
+    tx_type     TEXT,
+    text        TEXT,
+    shares      REAL,
+    value       REAL,
+    ownership   TEXT,
+    url         TEXT,
+    fetched_at  REAL,
+    PRIMARY KEY (ticker, filing_key)
+);
+CREATE INDEX IF NOT EXISTS idx_insider_date ON insider_tx (start_date);
+CREATE INDEX IF NOT EXISTS idx_insider_type_date ON insider_tx (tx_type, start_date);
+CREATE TABLE IF NOT EXISTS insider_refresh (
+    ticker       TEXT PRIMARY KEY,
+    refreshed_at REAL NOT NULL
+);
+"""
+
+def _db():
+    return session(DB_NAME, SCHEMA)
+
+# ------------------------------------------------------------------
+# [2] 정규화 헬퍼
+# ------------------------------------------------------------------
+def classify(text, transaction=""):
+    """'Purchase at price 12.3' 같은 설명을 Purchase / Sale / Award / Gift / Other 로 분류"""
+    blob = f"{text or ''} {transaction or ''}".lower()
+    if "purchase" in blob or "buy" in blob:
+        return "Purchase"
+    if "sale" in blob or "sell" in blob:
+        return "Sale"
+    if "award" in blob or "grant" in blob:
+        return "Award"
+    if "gift" in blob:
+        return "Gift"
+    return "Other"
+
+def _filing_key(row):
+    """yfinance는 공시 번호를 주지 않으므로, 거래를 식별하는 필드들의 해시를 키로 사용"""
+    raw = "|".join(str(row.get(k, "")) for k in ("Start Date", "Insider", "Shares", "Value", "Text", "URL"))
+    return hashlib.sha1(raw.encode()).hexdigest()[:20]
+
+def _to_rows(ticker, df, fetched_at):
+    if df is None or df.empty:
+        return []
+    rows = []
+    for rec in df.reset_index(drop=True).to_dict('records'):
+        start = pd.to_datetime(rec.get("Start Date"), errors='coerce')
+        rows.append((
+            ticker,
+            _filing_key(rec),
+            start.strftime("%Y-%m-%d") if pd.notna(start) else None,
+            rec.get("Insider"),
+            rec.get("Position"),
+            classify(rec.get("Text"), rec.get("Transaction")),
+            rec.get("Text"),
+            float(rec["Shares"]) if pd.notna(rec.get("Shares")) else None,
+            float(rec["Value"]) if pd.notna(rec.get("Value")) else None,
+            rec.get("Ownership"),
+            rec.get("URL"),
+            fetched_at,
+        ))
+    return rows
+
+# ------------------------------------------------------------------
+# [3] 증분 갱신 (관심 종목 동시 수집)
+# ------------------------------------------------------------------
+def _fetch(ticker):
+    try:
+        return ticker, yf.Ticker(ticker).insider_transactions, None
+    except Exception as e:
+        return ticker, None, str(e)
+
+def stale_tickers(tickers, max_age=REFRESH_INTERVAL):
+    """마지막 갱신 후 max_age초가 지난(또는 한 번도 안 받은) 종목만 골라냅니다."""
+    tickers = sorted(set(t.upper() for t in tickers))
+    if not tickers:
+        return []
+    with _db() as conn:
+        marks = ",".join("?" * len(tickers))
+        seen = dict(conn.execute(
+            f"SELECT ticker, refreshed_at FROM insider_refresh WHERE ticker IN ({marks})", tickers
+        ).fetchall())
+    now = time.time()
+    return [t for t in tickers if now - seen.get(t, 0) > max_age]
+
+def refresh(tickers, max_age=REFRESH_INTERVAL, max_workers=MAX_WORKERS, on_progress=None):
+    """
+    오래된 종목만 병렬로 받아 저장합니다. (이미 저장된 거래는 무시 -> 새 거래만 추가)
+    실패한 종목은 갱신 시각을 기록하지 않음 (다음 호출 때 다시 받음)
+    반환: {'fetched': n, 'empty': n, 'inserted': n, 'errors': {ticker: msg}}
+    """
+    targets = stale_tickers(tickers, max_age)
+    stats = {"fetched": 0, "empty": 0, "inserted": 0, "errors": {}}
+    if not targets:
+        return stats
+
+    # 네트워크 수집이 끝날 때까지 DB는 열지 않음 (수집 중에 쓰기 잠금을 잡고 있으면 다른 writer가 대기)
+    fetched = []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(targets))) as pool:
+        futures = [pool.submit(_fetch, t) for t in targets]
+        for i, fut in enumerate(as_completed(futures), 1):
+            ticker, df, err = fut.result()
+            if err:
+                stats["errors"][ticker] = err
+            else:
+                fetched.append((ticker, df, time.time()))
+            if on_progress:
+                on_progress(i, len(targets), ticker)
+
+    # 쓰기는 모아서 짧은 트랜잭션 한 번에 (SQLite 단일 writer)
+    with _db() as conn:
+        for ticker, df, now in fetched:
+            rows = _to_rows(ticker, df, now)
+            if rows:
+                before = conn.total_changes
+                conn.executemany("INSERT OR IGNORE INTO insider_tx VALUES (?,?,?,?,?,?,?,?,?,?,?,?)", rows)
+                stats["inserted"] += conn.total_changes - before
+                stats["fetched"] += 1
+            else:
+                # 거래가 없는 종목도 기록 (매번 다시 받지 않도록). 일시적인 빈 응답일 수 있어 EMPTY_INTERVAL 뒤 만료되게 기록
+                now -= max(0, max_age - EMPTY_INTERVAL)
+                stats["empty"] += 1
+            conn.execute("INSERT OR REPLACE INTO insider_refresh VALUES (?, ?)", (ticker, now))
+    return stats
+
+# ------------------------------------------------------------------
+# [4] 조회 (전부 로컬 인덱스로 처리)
+# ------------------------------------------------------------------
+def query(tickers=None, since=None, until=None, tx_type=None, limit=None):
+    """종목/기간/거래유형 조건으로 저장된 내부자 거래를 최신순 DataFrame으로 반환"""
+    sql = ("SELECT ticker, start_date, insider, position, tx_type, text, shares, value, ownership, url "
+           "FROM insider_tx WHERE 1=1")
+    params = []
+    if tickers:
+        tickers = [t.upper() for t in tickers]
+        sql += f" AND ticker IN ({','.join('?' * len(tickers))})"
+        params += tickers
+    if tx_type:
+        sql += " AND tx_type = ?"
+        params.append(tx_type)
+    if since:
+        sql += " AND start_date >= ?"
+        params.append(str(since))
+    if until:
+        sql += " AND start_date <= ?"
+        params.append(str(until))
+    sql += " ORDER BY start_date DESC"
+    if limit:
+        sql += " LIMIT ?"
+        params.append(int(limit))
+
+    with _db() as conn:
+        return pd.read_sql_query(sql, conn, params=params)
+
+def month_start(today=None):
+    today = today or datetime.date.today()
+    return today.replace(day=1)
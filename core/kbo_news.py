@@ -0,0 +1,103 @@
+import json
+import re
+
+from core import aggregator, dedup, feeds, kv, llm
+
+# ------------------------------------------------------------------
+# [1] 피드 설정
+# ------------------------------------------------------------------
+# 1. q=KBO+리그 : 검색어 깔끔하게 변경
+# 2. when:2d : 무조건 최근 2일(48시간) 이내 기사만 검색 (옛날 기사 원천 차단)
+# 3. &scoring=n : 최신순(Newest) 정렬 강제
+RSS_URL = aggregator.google_news_url("KBO 리그")
+CURATION_NS = "kbo_curation"
+
+# 주제별 피드 (팀·선수 피드를 늘려도 화면은 로컬 저장소만 읽으므로 느려지지 않음)
+TEAMS = ["KIA 타이거즈", "삼성 라이온즈", "LG 트윈스", "두산 베어스", "KT 위즈",
+         "SSG 랜더스", "롯데 자이언츠", "한화 이글스", "NC 다이노스", "키움 히어로즈"]
+ALL_TOPIC = "kbo"
+KBO_SOURCES = [{"url": RSS_URL, "name": "KBO 리그", "topic": ALL_TOPIC, "interval": feeds.MIN_POLL_INTERVAL}] + [
+    {"url": aggregator.google_news_url(team), "name": team, "topic": f"kbo:{team}", "interval": 900} for team in TEAMS
+]
+
+def topic_of(team=None):
+    return ALL_TOPIC if not team or team == "전체" else f"kbo:{team}"
+
+# ------------------------------------------------------------------
+# [2] 수집 -> 로컬 중복 제거 -> AI 선별
+# ------------------------------------------------------------------
+def get_raw_news(topic=ALL_TOPIC, force=False):
+    """통합 저장소에서 '최근 48시간' 뉴스만 가져옵니다. (피드 폴링은 주기에 맞춰 뒤에서)
+    게임 홍보는 버리고, 같은 사건을 다룬 기사는 로컬에서 묶어 대표 기사만 남깁니다."""
+    aggregator.register(KBO_SOURCES)
+    top = aggregator.query(topic, since=aggregator.hours_ago(48), limit=30)
+    if force or not top:
+        # 새로고침이거나 저장소가 비어 있을 때만 기다려서 읽음
+        aggregator.poll(topic, force=force)
+        top = aggregator.query(topic, since=aggregator.hours_ago(48), limit=30)
+    else:
+        aggregator.poll_in_background(topic)
+
+    # 글자 3-gram MinHash로 비슷한 제목끼리 묶기 -> Gemini에는 대표 기사만 전달
+    reps, stats = dedup.dedupe(top)
+    news_pool = []
+    for i, entry in enumerate(reps):
+        news_pool.append({
+            "id": i,
+            "title": entry["title"],
+            "link": entry["link"],
+            "published": entry["published"],
+            "source": entry["source"],
+            "dupes": entry["dupes"]
+        })
+    # 이 30개 기사 묶음의 지문 -> AI 큐레이션 캐시 키
+    return news_pool, feeds.digest_of(top), stats
+
+def curate_news_with_ai(news_pool, digest=None):
+    """Gemini가 (이미 중복이 제거된) 뉴스 제목을 보고 중요 기사만 뽑습니다."""
+
+    # 같은 기사 묶음은 이미 골라둔 결과 재사용 (Gemini 호출 없음)
+    if digest:
+        picked = kv.get(CURATION_NS, digest)
+        if picked is not None:
+            return [news for news in news_pool if news['link'] in picked]
+
+    candidates = "\n".join([f"{item['id']}: {item['title']}" for item in news_pool])
+
+    prompt = f"""
+    당신은 까다로운 '프로야구 뉴스 편집장'입니다.
+    아래는 방금 들어온 최신 뉴스 속보들입니다. 가장 중요한 기사 5~7개를 엄선하세요.
+
+    [목록]
+    {candidates}
+
+    [선별 원칙]
+    1. **중복 삭제:** 비슷한 기사는 이미 하나로 묶였습니다. 그래도 같은 사건을 다룬 기사가 있으면 하나만 남기세요.
+    2. **최신성:** 경기 결과, 선수 영입, 부상 소식 등 '지금 발생한 일' 위주로 뽑으세요.
+    3. **다양성:** 특정 팀 이야기만 하지 말고 골고루 섞으세요.
+
+    [출력 형식]
+    선택한 기사의 ID 리스트만 JSON으로 주세요.
+    예시: [0, 5, 12, 15, 22]
+    """
+
+    try:
+        text = llm.generate(prompt)
+
+        # 숫자 리스트 추출
+        match = re.search(r'\[.*\]', text, re.DOTALL)
+        if match:
+            selected_ids = json.loads(match.group())
+            final_list = [news for news in news_pool if news['id'] in selected_ids]
+            if digest and final_list:
+                kv.put(CURATION_NS, digest, [news['link'] for news in final_list])
+            return final_list
+        else:
+            return news_pool[:5]
+    except Exception:
+        return news_pool[:5]
+
+def briefing(topic=ALL_TOPIC, force=False):
+    """화면에 바로 그릴 결과 {'news': 선별 기사, 'stats': 중복 제거 통계} (기사가 없으면 news=[])"""
+    raw_news, digest, stats = get_raw_news(topic, force=force)
+    return {"news": curate_news_with_ai(raw_news, digest) if raw_news else [], "stats": stats}
@@ -0,0 +1,39 @@
+import json
+import time
+
+from core.storage import session
+
+# ------------------------------------------------------------------
+# 로컬 키-값 캐시 (AI 응답·스냅샷 등 JSON으로 저장 가능한 결과용)
+# ------------------------------------------------------------------
+DB_NAME = "kv"
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS kv (
+    namespace  TEXT NOT NULL,
+    key        TEXT NOT NULL,
+    value      TEXT NOT NULL,
+    stored_at  REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+);
+"""
+
+def get(namespace, key, ttl=None, default=None):
+    """저장된 값을 돌려줍니다. ttl(초)이 지났으면 default."""
+    with session(DB_NAME, SCHEMA) as conn:
+        row = conn.execute("SELECT value, stored_at FROM kv WHERE namespace = ? AND key = ?", (namespace, key)).fetchone()
+    if row is None or (ttl is not None and time.time() - row["stored_at"] > ttl):
+        return default
+    return json.loads(row["value"])
+
+def get_with_time(namespace, key):
+    """(값, 저장 시각) 또는 (None, None)"""
+    with session(DB_NAME, SCHEMA) as conn:
+        row = conn.execute("SELECT value, stored_at FROM kv WHERE namespace = ? AND key = ?", (namespace, key)).fetchone()
+    if row is None:
+        return None, None
+    return json.loads(row["value"]), row["stored_at"]
+
+def put(namespace, key, value):
+    with session(DB_NAME, SCHEMA) as conn:
+        conn.execute("INSERT OR REPLACE INTO kv VALUES (?, ?, ?, ?)",
+                     (namespace, key, json.dumps(value, ensure_ascii=False), time.time()))
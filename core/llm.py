@@ -0,0 +1,38 @@
+import os
+import threading
+
+import google.generativeai as genai
+
+# ------------------------------------------------------------------
+# Gemini 공용 모델 (페이지 밖 백그라운드 작업에서도 사용)
+# ------------------------------------------------------------------
+MODEL_NAME = 'gemini-flash-latest'
+MAX_CONCURRENT = int(os.environ.get("GEMINI_MAX_CONCURRENT", "4"))  # 동시에 보내는 요청 수 (분당 한도 보호)
+_model = None
+_slots = threading.BoundedSemaphore(MAX_CONCURRENT)
+
+def api_key():
+    """환경변수 GEMINI_API_KEY -> .streamlit/secrets.toml 순서로 찾습니다."""
+    key = os.environ.get("GEMINI_API_KEY")
+    if key:
+        return key
+    try:
+        import streamlit as st
+        return st.secrets.get("GEMINI_API_KEY")
+    except Exception:
+        return None
+
+def get_model():
+    global _model
+    if _model is None:
+        key = api_key()
+        if key:
+            genai.configure(api_key=key)
+        _model = genai.GenerativeModel(MODEL_NAME)
+    return _model
+
+def generate(prompt):
+    """여러 스레드에서 불러도 동시에 MAX_CONCURRENT개까지만 요청 (나머지는 순서대로 대기)"""
+    model = get_model()
+    with _slots:
+        return model.generate_content(prompt).text
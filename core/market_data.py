@@ -0,0 +1,199 @@
+import datetime
+import threading
+import time
+from concurrent.futures import Future
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+import yfinance as yf
+
+# ------------------------------------------------------------------
+# [1] 공용 시장 지표 정의
+# ------------------------------------------------------------------
+# 주요 지수 (월스트리트 인사이드 화면 + 포트폴리오 스트레스 팩터)
+INDICES = {
+    "^GSPC": "S&P 500",
+    "^IXIC": "나스닥",
+    "^SOX": "반도체",
+    "^VIX": "공포지수(VIX)",
+    "KRW=X": "원/달러 환율"
+}
+
+NY_TZ = ZoneInfo("America/New_York")
+
+# ------------------------------------------------------------------
+# [2] 시장 데이터 게이트웨이 (요청 합치기 / Single-flight)
+# ------------------------------------------------------------------
+class MarketDataGateway:
+    """
+    여러 페이지·여러 가족 세션이 같은 시세를 동시에 요청할 때 yfinance 호출을 한 번으로 줄입니다.
+    - 같은 키로 진행 중인 요청이 있으면 새로 부르지 않고 그 결과를 기다림 (single-flight)
+    - 짧은 시간(batch_window) 안에 들어온 단일 종목 요청은 모아서 한 번에 다운로드
+    - 결과는 캐시에 읽기 전용으로 한 벌만 두고, 호출자에게는 데이터를 공유하는 얕은 복사본을 넘김
+    """
+
+    def __init__(self, batch_window=0.05, ttl=60, timeout=60, max_entries=256):
+        self.batch_window = batch_window
+        self.ttl = ttl
+        self.timeout = timeout
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._inflight = {}   # key -> Future
+        self._pending = {}    # (period, interval) -> [ticker, ...]
+        self._cache = {}      # key -> (저장 시각, 공유 결과)
+
+    # --- 공통: 캐시 / single-flight ---
+    def _cached(self, key):
+        hit = self._cache.get(key)
+        if hit and time.time() - hit[0] < self.ttl:
+            return hit[1]
+        return None
+
+    def _evict(self, now):
+        """만료된 항목을 지우고, 그래도 많으면 오래된 것부터 지움 (lock 안에서 호출)"""
+        for key in [k for k, (saved, _) in self._cache.items() if now - saved >= self.ttl]:
+            del self._cache[key]
+        overflow = len(self._cache) - self.max_entries
+        if overflow > 0:
+            for key in sorted(self._cache, key=lambda k: self._cache[k][0])[:overflow]:
+                del self._cache[key]
+
+    def _finish(self, key, fut, value=None, error=None):
+        if isinstance(value, pd.DataFrame):
+            value = _read_only(value)
+        with self._lock:
+            self._inflight.pop(key, None)
+            if error is None:
+                now = time.time()
+                self._cache[key] = (now, value)
+                self._evict(now)
+        if error is None:
+            fut.set_result(value)
+        else:
+            fut.set_exception(error)
+
+    def call(self, key, fn):
+        """key가 같은 동시 요청은 fn을 한 번만 실행하고 결과를 나눠 받습니다."""
+        with self._lock:
+            value = self._cached(key)
+            if value is not None:
+                return value
+            fut = self._inflight.get(key)
+            owner = fut is None
+            if owner:
+                fut = self._inflight[key] = Future()
+
+        if owner:
+            try:
+                self._finish(key, fut, fn())
+            except Exception as e:
+                self._finish(key, fut, error=e)
+        return fut.result(timeout=self.timeout)
+
+    # --- 단일 종목 시세: 모아서 한 번에 ---
+    def history(self, ticker, period="1y", interval="1d"):
+        """단일 종목 OHLCV. 동시에 들어온 다른 종목 요청과 합쳐 다운로드합니다."""
+        ticker = ticker.upper()
+        key = ("history", ticker, period, interval)
+        with self._lock:
+            value = self._cached(key)
+            if value is not None:
+                return value.copy(deep=False)
+            fut = self._inflight.get(key)
+            if fut is None:
+                fut = self._inflight[key] = Future()
+                batch = self._pending.setdefault((period, interval), [])
+                batch.append(ticker)
+                # 이 묶음의 첫 요청이 타이머를 걸고, 창이 닫히면 한꺼번에 처리
+                if len(batch) == 1:
+                    threading.Timer(self.batch_window, self._flush, args=(period, interval)).start()
+
+        return fut.result(timeout=self.timeout).copy(deep=False)
+
+    def _flush(self, period, interval):
+        with self._lock:
+            tickers = self._pending.pop((period, interval), [])
+            futures = {t: self._inflight[("history", t, period, interval)] for t in tickers}
+        if not tickers:
+            return
+
+        try:
+            data = yf.download(tickers, period=period, interval=interval,
+                               group_by='ticker', progress=False, threads=True)
+        except Exception as e:
+            for t, fut in futures.items():
+                self._finish(("history", t, period, interval), fut, error=e)
+            return
+
+        for t, fut in futures.items():
+            frame = pd.DataFrame()
+            if data is not None and not data.empty:
+                if isinstance(data.columns, pd.MultiIndex):
+                    if t in data.columns.get_level_values(0):
+                        frame = data[t].dropna(how='all')
+                else:
+                    frame = data
+            self._finish(("history", t, period, interval), fut, frame)
+
+    # --- 여러 종목 종가 / 종목 정보 ---
+    def close(self, tickers, period="1y"):
+        tickers = tuple(sorted(set(tickers)))
+        return self.call(("close", tickers, period), lambda: _download_close(tickers, period)).copy(deep=False)
+
+    def info(self, ticker):
+        ticker = ticker.upper()
+        return dict(self.call(("info", ticker), lambda: yf.Ticker(ticker).info) or {})
+
+
+gateway = MarketDataGateway()
+
+# ------------------------------------------------------------------
+# [3] 헬퍼 함수
+# ------------------------------------------------------------------
+def _read_only(frame):
+    """
+    캐시에 넣는 표의 값 배열을 읽기 전용으로 잠급니다. 호출자는 copy(deep=False)로 같은 배열을 나눠 씀.
+    - pandas 3 (Copy-on-Write): 호출자가 값을 고치면 그 열만 복사되고 캐시는 그대로
+    - pandas 2: 얕은 복사본에 쓰면 캐시까지 바뀌므로, 잠가 두어 제자리 수정은 ValueError로 막음
+    열 추가·교체(df['MA20'] = ...)는 두 버전 모두 호출자 쪽 표에만 반영
+    """
+    for arr in frame._mgr.arrays:
+        if isinstance(arr, np.ndarray):
+            arr.flags.writeable = False
+    return frame
+
+def trading_day(now=None):
+    """뉴욕 기준 '가장 최근 거래일' 문자열 (캐시 키로 사용)"""
+    now = now or datetime.datetime.now(NY_TZ)
+    day = now.date()
+    # 주말이면 직전 금요일로 되돌림 (공휴일은 yfinance 데이터가 알아서 비어 있음)
+    while day.weekday() >= 5:
+        day -= datetime.timedelta(days=1)
+    return day.isoformat()
+
+def _download_close(tickers, period):
+    if not tickers:
+        return pd.DataFrame()
+
+    data = yf.download(list(tickers), period=period, interval="1d", progress=False)
+    if data is None or data.empty:
+        return pd.DataFrame()
+
+    close = data['Close']
+    # 티커가 1개면 Series로 오는 경우가 있어 표 형태로 통일
+    if isinstance(close, pd.Series):
+        close = close.to_frame(tickers[0])
+    return close
+
+def download_close(tickers, period="1y"):
+    """여러 종목의 종가를 한 번의 호출로 받아 (날짜 x 티커) 표로 돌려줍니다."""
+    return gateway.close(tickers, period)
+
+def get_history(ticker, period="1y", interval="1d"):
+    """단일 종목 OHLCV (게이트웨이 경유)"""
+    return gateway.history(ticker, period, interval)
+
+def get_info(ticker):
+    """yfinance Ticker.info (게이트웨이 경유)"""
+    return gateway.info(ticker)
@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+
+# ------------------------------------------------------------------
+# [1] 설정
+# ------------------------------------------------------------------
+DEFAULT_WINDOWS = (14, 20, 60)  # 단기(MFI 표준) / 한 달 / 분기
+
+# ------------------------------------------------------------------
+# [2] 계산 헬퍼
+# ------------------------------------------------------------------
+def _rolling_sums(x, windows):
+    """누적합 한 번으로 여러 창(window)의 이동합을 동시에 구합니다. (앞부분은 NaN)"""
+    cs = np.concatenate([[0.0], np.cumsum(x)])
+    out = {}
+    for w in windows:
+        s = np.full(x.size, np.nan)
+        if x.size >= w:
+            s[w - 1:] = cs[w:] - cs[:-w]
+        out[w] = s
+    return out
+
+def _safe_div(a, b):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(b != 0, a / b, np.nan)
+
+# ------------------------------------------------------------------
+# [3] 자금 흐름 지표 (MFI / CMF / A/D / OBV)
+# ------------------------------------------------------------------
+def money_flow_indicators(high, low, close, volume, windows=DEFAULT_WINDOWS):
+    """
+    고가/저가/종가/거래량 배열에서 자금 흐름 지표를 한 번에 계산합니다.
+    반환: {'OBV', 'AD', 'MFI_14', 'CMF_14', ...} 형태의 배열 딕셔너리
+    """
+    h = np.asarray(high, dtype=float)
+    l = np.asarray(low, dtype=float)
+    c = np.asarray(close, dtype=float)
+    v = np.nan_to_num(np.asarray(volume, dtype=float))
+
+    # 1. 대표가격(Typical Price) x 거래량 = 자금 흐름 (MFI의 재료)
+    tp = (h + l + c) / 3
+    raw_flow = tp * v
+    tp_dir = np.sign(np.diff(tp, prepend=np.nan))
+    pos_flow = np.where(tp_dir > 0, raw_flow, 0.0)
+    neg_flow = np.where(tp_dir < 0, raw_flow, 0.0)
+
+    # 2. 종가 위치(CLV) x 거래량 = 매집/분산 물량 (A/D, CMF의 재료)
+    hl = h - l
+    clv = np.where(hl > 0, _safe_div((c - l) - (h - c), hl), 0.0)
+    mf_volume = clv * v
+
+    # 3. 종가 방향 x 거래량 = OBV
+    c_dir = np.sign(np.diff(c, prepend=c[:1]))
+
+    result = {
+        "OBV": np.cumsum(c_dir * v),
+        "AD": np.cumsum(mf_volume),
+    }
+
+    pos_sum = _rolling_sums(pos_flow, windows)
+    neg_sum = _rolling_sums(neg_flow, windows)
+    mfv_sum = _rolling_sums(mf_volume, windows)
+    vol_sum = _rolling_sums(v, windows)
+
+    for w in windows:
+        result[f"MFI_{w}"] = 100 * _safe_div(pos_sum[w], pos_sum[w] + neg_sum[w])
+        result[f"CMF_{w}"] = _safe_div(mfv_sum[w], vol_sum[w])
+
+    return result
+
+def add_money_flow(hist, windows=DEFAULT_WINDOWS):
+    """yfinance OHLCV 표에 지표 컬럼을 붙여서 돌려줍니다."""
+    ind = money_flow_indicators(hist['High'].to_numpy(), hist['Low'].to_numpy(),
+                                hist['Close'].to_numpy(), hist['Volume'].to_numpy(), windows)
+    return hist.assign(**{k: pd.Series(v, index=hist.index) for k, v in ind.items()})
@@ -0,0 +1,78 @@
+import numpy as np
+
+# -----------------------------------------------------------------------------
+# Monte Carlo Price-Path Engine
+# -----------------------------------------------------------------------------
+DEFAULT_SEED = 42
+DEFAULT_PATHS = 100_000
+CHUNK_PATHS = 20_000  # paths per block -> bounds memory to CHUNK_PATHS x days floats
+
+
+def make_rng(seed=DEFAULT_SEED):
+    """Single seeded generator shared by every chunk so a run is reproducible."""
+    return np.random.default_rng(seed)
+
+
+def _draw_log_returns(rng, log_rets, method, n, days):
+    """Draws an (n x days) block of daily log returns."""
+    if method == "bootstrap":
+        # Resample actual historical days (keeps fat tails / skew)
+        idx = rng.integers(0, log_rets.size, size=(n, days))
+        return log_rets[idx]
+
+    # GBM: constant drift and volatility estimated from history
+    mu = log_rets.mean()
+    sigma = log_rets.std(ddof=1)
+    return rng.standard_normal((n, days), dtype=np.float64) * sigma + mu
+
+
+def simulate_touch_probabilities(close, levels, days=20, method="gbm",
+                                 n_paths=DEFAULT_PATHS, seed=DEFAULT_SEED, chunk=CHUNK_PATHS):
+    """
+    Probability that the price path touches each level within `days` sessions.
+
+    close:  1-D array of historical closes (oldest -> newest)
+    levels: {label: price}. Levels above spot count as touched when the running
+            max reaches them, levels below spot when the running min does.
+    """
+    close = np.asarray(close, dtype=float)
+    close = close[np.isfinite(close)]
+    if close.size < 30:
+        return None
+
+    log_rets = np.diff(np.log(close))
+    spot = close[-1]
+    rng = make_rng(seed)
+
+    labels = list(levels.keys())
+    # Work in log-distance space so the test is a single comparison per path
+    log_levels = np.log(np.asarray([levels[k] for k in labels], dtype=float) / spot)
+    upside = log_levels >= 0
+
+    hits = np.zeros(len(labels), dtype=np.int64)
+    finals = np.empty(n_paths, dtype=np.float64)
+
+    done = 0
+    while done < n_paths:
+        n = min(chunk, n_paths - done)
+        paths = np.cumsum(_draw_log_returns(rng, log_rets, method, n, days), axis=1)
+        path_max = paths.max(axis=1)
+        path_min = paths.min(axis=1)
+
+        up_hit = path_max[:, None] >= log_levels[None, :]
+        down_hit = path_min[:, None] <= log_levels[None, :]
+        hits += np.where(upside[None, :], up_hit, down_hit).sum(axis=0)
+
+        finals[done:done + n] = paths[:, -1]
+        done += n
+
+    final_prices = spot * np.exp(finals)
+    return {
+        "spot": spot,
+        "days": days,
+        "paths": n_paths,
+        "method": method,
+        "touch": {k: float(hits[i] / n_paths) for i, k in enumerate(labels)},
+        "final_percentiles": dict(zip((5, 25, 50, 75, 95), np.percentile(final_prices, [5, 25, 50, 75, 95]).tolist())),
+        "prob_up": float((finals > 0).mean()),
+    }
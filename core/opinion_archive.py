@@ -0,0 +1,199 @@
+import datetime
+import re
+import time
+
+import pandas as pd
+
+from core import http_client
+from core.html_extract import parse
+from core.storage import session
+
+# ------------------------------------------------------------------
+# [1] 설정 & 스키마
+# ------------------------------------------------------------------
+LIST_URL = "https://news.naver.com/main/list.naver?mode=LPOD&mid=sec&oid={code}&sid1=110&page={page}"
+# 네이버 뉴스 '리스트 페이지' 언론사 코드 (화면과 아침 예열 작업이 함께 사용)
+PRESSES = {
+    '조선일보': '023',
+    '중앙일보': '025',
+    '한국일보': '469'
+}
+HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8'
+}
+MAX_PAGES = 10          # 한 번에 최대 10페이지까지만 거슬러 올라감 (첫 수집 시 폭주 방지)
+MIN_INTERVAL = 600      # 같은 신문사는 10분 안에 다시 긁지 않음
+
+DB_NAME = "opinion"
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    press      TEXT NOT NULL,
+    aid        TEXT NOT NULL,
+    title      TEXT NOT NULL,
+    link       TEXT NOT NULL,
+    published  TEXT,
+    date_text  TEXT,
+    crawled_at REAL NOT NULL,
+    PRIMARY KEY (press, aid)
+);
+CREATE INDEX IF NOT EXISTS idx_opinion_published ON articles (published);
+CREATE INDEX IF NOT EXISTS idx_opinion_press_published ON articles (press, published);
+CREATE TABLE IF NOT EXISTS crawl_state (
+    press        TEXT PRIMARY KEY,
+    last_aid     TEXT,
+    last_crawled REAL
+);
+"""
+
+def _db():
+    return session(DB_NAME, SCHEMA)
+
+# ------------------------------------------------------------------
+# [2] 파싱 헬퍼
+# ------------------------------------------------------------------
+def article_id(link):
+    """네이버 기사 링크에서 기사 번호(aid) 추출. 신문사 안에서는 번호가 계속 커집니다."""
+    match = re.search(r'/article/\d+/(\d+)', link) or re.search(r'[?&]aid=(\d+)', link)
+    return match.group(1) if match else None
+
+def parse_date(date_text, now=None):
+    """'2026.10.19. 오후 3:20' / '1시간전' / '50분전' -> ISO 시각 문자열"""
+    now = now or datetime.datetime.now()
+    text = (date_text or "").strip()
+
+    rel = re.match(r'(\d+)\s*(분|시간|일)\s*전', text)
+    if rel:
+        n, unit = int(rel.group(1)), rel.group(2)
+        delta = {"분": datetime.timedelta(minutes=n), "시간": datetime.timedelta(hours=n), "일": datetime.timedelta(days=n)}[unit]
+        return (now - delta).isoformat(timespec="minutes")
+
+    day = re.search(r'(\d{4})\.(\d{1,2})\.(\d{1,2})', text)
+    clock = re.search(r'(오전|오후)?\s*(\d{1,2}):(\d{2})', text)
+    if not day and not clock:
+        return None
+
+    date = datetime.date(*map(int, day.groups())) if day else now.date()
+    hour = minute = 0
+    if clock:
+        hour, minute = int(clock.group(2)), int(clock.group(3))
+        if clock.group(1) == "오후" and hour < 12:
+            hour += 12
+        elif clock.group(1) == "오전" and hour == 12:
+            hour = 0
+    return datetime.datetime.combine(date, datetime.time(hour, minute)).isoformat(timespec="minutes")
+
+def parse_list_page(html):
+    """리스트 페이지 HTML -> [{'aid', 'title', 'link', 'date_text'}] (페이지에 나온 순서 = 최신순)"""
+    soup = parse(html)
+    items = []
+    for group in soup.select('ul.type06_headline') + soup.select('ul.type06'):
+        for item in group.select('li'):
+            dts = item.select('dt')
+            if not dts:
+                continue
+            title_tag = dts[-1].select_one('a')
+            if title_tag is None:
+                continue
+            link = title_tag.attr('href', '')
+            aid = article_id(link)
+            if not aid:
+                continue
+            date_tag = item.select_one('dd span.date')
+            items.append({
+                'aid': aid,
+                'title': title_tag.text(strip=True),
+                'link': link,
+                'date_text': date_tag.text(strip=True) if date_tag else "",
+            })
+    return items, soup
+
+# ------------------------------------------------------------------
+# [3] 증분 크롤러
+# ------------------------------------------------------------------
+def crawl_press(press, code, max_pages=MAX_PAGES, min_interval=MIN_INTERVAL, timeout=8, debug=False):
+    """
+    최신 페이지부터 읽다가 '지난번에 본 마지막 기사'를 만나면 멈춥니다.
+    변화가 없으면(최근에 긁었거나, 1페이지가 304) 파싱도 저장도 하지 않습니다.
+    반환: {'new': 새 기사 수, 'pages': 읽은 페이지 수, 'skipped': 사유 또는 None, 'url', 'status', 'error', 'html_preview'}
+    """
+    first_url = LIST_URL.format(code=code, page=1)
+    info = {"new": 0, "pages": 0, "skipped": None, "url": first_url, "status": None, "error": None, "html_preview": ""}
+
+    with _db() as conn:
+        state = conn.execute("SELECT last_aid, last_crawled FROM crawl_state WHERE press = ?", (press,)).fetchone()
+    last_aid = int(state["last_aid"]) if state and state["last_aid"] else 0
+
+    if state and state["last_crawled"] and time.time() - state["last_crawled"] < min_interval:
+        info["skipped"] = "recent"
+        return info
+
+    fresh, newest, prev_first = [], last_aid, None
+    now = datetime.datetime.now()
+    try:
+        for page in range(1, max_pages + 1):
+            response = http_client.get(LIST_URL.format(code=code, page=page), headers=HEADERS, timeout=timeout)
+            if page == 1:
+                info["status"] = response.status_code
+                # 1페이지가 그대로면 (캐시 재사용/304) 새 기사도 없음 -> 바로 종료
+                if getattr(response, "from_cache", False) or getattr(response, "revalidated", False):
+                    info["skipped"] = "unchanged"
+                    break
+            if response.status_code != 200:
+                info["error"] = f"Status Code: {response.status_code}"
+                break
+
+            items, soup = parse_list_page(response.content)
+            info["pages"] = page
+            if debug and page == 1:
+                info["html_preview"] = soup.preview(1000)
+
+            # 마지막 페이지를 넘기면 네이버는 마지막 페이지를 다시 보여줌 -> 같은 첫 기사면 끝
+            if not items or items[0]['aid'] == prev_first:
+                break
+            prev_first = items[0]['aid']
+
+            reached_seen = False
+            for item in items:
+                aid = int(item['aid'])
+                if aid <= last_aid:
+                    reached_seen = True
+                    continue
+                newest = max(newest, aid)
+                fresh.append((press, item['aid'], item['title'], item['link'],
+                              parse_date(item['date_text'], now), item['date_text'], time.time()))
+            if reached_seen:
+                break
+    except Exception as e:
+        info["error"] = str(e)
+
+    with _db() as conn:
+        if fresh:
+            conn.executemany("INSERT OR IGNORE INTO articles VALUES (?, ?, ?, ?, ?, ?, ?)", fresh)
+        if info["error"] is None:
+            conn.execute("INSERT OR REPLACE INTO crawl_state VALUES (?, ?, ?)", (press, str(newest) if newest else None, time.time()))
+    info["new"] = len(fresh)
+    return info
+
+# ------------------------------------------------------------------
+# [4] 조회 (로컬 아카이브만 사용)
+# ------------------------------------------------------------------
+def query(presses=None, start=None, end=None, limit=None):
+    """기간(날짜, 양끝 포함)·신문사 조건으로 저장된 사설/칼럼을 최신순으로 반환"""
+    sql = "SELECT press, aid, title, link, published, date_text FROM articles WHERE 1=1"
+    params = []
+    if presses:
+        sql += f" AND press IN ({','.join('?' * len(presses))})"
+        params += list(presses)
+    if start:
+        sql += " AND published >= ?"
+        params.append(str(start))
+    if end:
+        # 종료일 당일 기사까지 포함
+        sql += " AND published < ?"
+        params.append(str(pd.Timestamp(end).date() + datetime.timedelta(days=1)))
+    sql += " ORDER BY published DESC, aid DESC"
+    if limit:
+        sql += " LIMIT ?"
+        params.append(int(limit))
+    with _db() as conn:
+        return pd.read_sql_query(sql, conn, params=params)
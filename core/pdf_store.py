@@ -0,0 +1,120 @@
+import hashlib
+import re
+import time
+
+from core.storage import session
+
+# ------------------------------------------------------------------
+# [1] 스키마 (PDF 내용 해시 기준 저장소)
+# ------------------------------------------------------------------
+# 같은 파일이면 올린 사람·링크와 상관없이 같은 SHA-256 -> 추출·요약을 한 번만
+DB_NAME = "pdf_cache"
+URL_TTL = 3600 * 24 * 7  # 링크 -> 해시 매핑을 믿는 기간 (그 뒤엔 다시 받아서 확인)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    sha256     TEXT PRIMARY KEY,
+    pages      INTEGER NOT NULL,
+    chars      INTEGER NOT NULL,
+    tokens     INTEGER NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pages (
+    sha256  TEXT NOT NULL,
+    page_no INTEGER NOT NULL,
+    text    TEXT NOT NULL,
+    tokens  INTEGER NOT NULL,
+    PRIMARY KEY (sha256, page_no)
+);
+CREATE TABLE IF NOT EXISTS summaries (
+    sha256     TEXT NOT NULL,
+    variant    TEXT NOT NULL,
+    summary    TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (sha256, variant)
+);
+CREATE TABLE IF NOT EXISTS urls (
+    url        TEXT PRIMARY KEY,
+    sha256     TEXT NOT NULL,
+    fetched_at REAL NOT NULL
+);
+"""
+
+def _db():
+    return session(DB_NAME, SCHEMA)
+
+# ------------------------------------------------------------------
+# [2] 해시 & 토큰 추정
+# ------------------------------------------------------------------
+def sha256_of(source, chunk=1024 * 1024):
+    """바이트 또는 파일 객체(처음부터 끝까지 조각 단위로 읽고 다시 처음으로 되감음)"""
+    if isinstance(source, (bytes, bytearray)):
+        return hashlib.sha256(source).hexdigest()
+    h = hashlib.sha256()
+    source.seek(0)
+    for block in iter(lambda: source.read(chunk), b""):
+        h.update(block)
+    source.seek(0)
+    return h.hexdigest()
+
+_NON_ASCII = re.compile(r"[^\x00-\x7f]")
+
+def estimate_tokens(text):
+    """Gemini 토큰 수 근사치: 영문 약 4자당 1토큰, 한글 등은 약 1.5자당 1토큰"""
+    non_ascii = len(_NON_ASCII.findall(text))
+    return int((len(text) - non_ascii) / 4 + non_ascii / 1.5) + 1 if text else 0
+
+# ------------------------------------------------------------------
+# [3] 페이지 텍스트
+# ------------------------------------------------------------------
+def document(sha):
+    """{'pages', 'chars', 'tokens', 'created_at'} 또는 None"""
+    with _db() as conn:
+        row = conn.execute("SELECT * FROM documents WHERE sha256 = ?", (sha,)).fetchone()
+    return dict(row) if row else None
+
+def load_pages(sha):
+    """저장된 페이지 텍스트 목록 (전체 추출이 끝난 문서만, 없으면 None)"""
+    if document(sha) is None:
+        return None
+    with _db() as conn:
+        rows = conn.execute("SELECT text FROM pages WHERE sha256 = ? ORDER BY page_no", (sha,)).fetchall()
+    return [r["text"] for r in rows]
+
+def save_pages(sha, pages):
+    tokens = [estimate_tokens(t) for t in pages]
+    with _db() as conn:
+        conn.execute("DELETE FROM pages WHERE sha256 = ?", (sha,))
+        conn.executemany("INSERT INTO pages VALUES (?, ?, ?, ?)",
+                         [(sha, i, text, n) for i, (text, n) in enumerate(zip(pages, tokens))])
+        conn.execute("INSERT OR REPLACE INTO documents VALUES (?, ?, ?, ?, ?)",
+                     (sha, len(pages), sum(map(len, pages)), sum(tokens), time.time()))
+
+def page_tokens(sha):
+    """페이지별 추정 토큰 수 목록"""
+    with _db() as conn:
+        return [r["tokens"] for r in conn.execute("SELECT tokens FROM pages WHERE sha256 = ? ORDER BY page_no", (sha,))]
+
+# ------------------------------------------------------------------
+# [4] 요약 & 링크 매핑
+# ------------------------------------------------------------------
+def get_summary(sha, variant="default"):
+    with _db() as conn:
+        row = conn.execute("SELECT summary FROM summaries WHERE sha256 = ? AND variant = ?", (sha, variant)).fetchone()
+    return row["summary"] if row else None
+
+def save_summary(sha, summary, variant="default"):
+    with _db() as conn:
+        conn.execute("INSERT OR REPLACE INTO summaries VALUES (?, ?, ?, ?)", (sha, variant, summary, time.time()))
+
+def sha_for_url(url, ttl=URL_TTL):
+    """최근에 받은 적 있는 링크면 그 파일의 해시 (없으면 None)"""
+    with _db() as conn:
+        row = conn.execute("SELECT sha256, fetched_at FROM urls WHERE url = ?", (url,)).fetchone()
+    if row is None or time.time() - row["fetched_at"] > ttl:
+        return None
+    return row["sha256"]
+
+def remember_url(url, sha):
+    with _db() as conn:
+        conn.execute("INSERT OR REPLACE INTO urls VALUES (?, ?, ?)", (url, sha, time.time()))
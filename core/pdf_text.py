@@ -0,0 +1,257 @@
+import argparse
+import io
+import mmap
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from pypdf import PdfReader
+
+# ------------------------------------------------------------------
+# [1] 설정
+# ------------------------------------------------------------------
+CHUNK_PAGES = 4          # 프로세스 하나가 한 번에 맡는 최소 페이지 수 (진행률 갱신 단위)
+MIN_PARALLEL_PAGES = 24  # 이보다 짧은 문서는 프로세스 띄우는 비용이 더 커서 한 프로세스로 처리
+MAX_WORKERS = max(1, min(8, (os.cpu_count() or 1)))
+MMAP_MIN_BYTES = 8 * 1024 * 1024  # 디스크에 있는 큰 파일은 메모리 매핑해서 읽음 (통째로 복사하지 않음)
+# 스레드가 여럿 도는 Streamlit 서버를 fork하면 다른 스레드가 잡고 있던 잠금째 복제돼 멈출 수 있음
+# -> 깨끗한 프로세스에서 작업자를 띄움 (작업자는 파일 경로만 받으므로 비용이 작음)
+_MP_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn")
+
+# ------------------------------------------------------------------
+# [2] 페이지 단위 추출 (작업 프로세스에서 실행)
+# ------------------------------------------------------------------
+def _page_text(page):
+    """텍스트가 없는 페이지(스캔 이미지 등)는 None 대신 빈 문자열"""
+    try:
+        return page.extract_text() or ""
+    except Exception:
+        return ""
+
+_reader_cache = {}  # 작업 프로세스마다 문서를 한 번만 열어 재사용 (청크마다 페이지 트리를 다시 읽지 않도록)
+
+def _reader(path):
+    if path not in _reader_cache:
+        _reader_cache.clear()
+        _reader_cache[path] = PdfReader(path)
+    return _reader_cache[path]
+
+def _extract_range(path, start, stop):
+    """path 파일의 [start, stop) 페이지 텍스트 -> (start, [텍스트, ...])"""
+    reader = _reader(path)
+    return start, [_page_text(reader.pages[i]) for i in range(start, stop)]
+
+# ------------------------------------------------------------------
+# [3] 공개 API
+# ------------------------------------------------------------------
+def _as_stream(source):
+    """바이트 / 경로 / 파일 객체 -> PdfReader에 넘길 스트림 (큰 디스크 파일은 mmap)"""
+    if isinstance(source, (bytes, bytearray)):
+        return io.BytesIO(source)
+    if isinstance(source, (str, Path)):
+        with open(source, "rb") as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    size = source.seek(0, os.SEEK_END)
+    source.seek(0)
+    if size >= MMAP_MIN_BYTES:
+        try:
+            return mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+        except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+            pass  # 메모리 안의 파일(업로드 등)은 그대로 사용
+    return source
+
+def extract_pages(source, workers=MAX_WORKERS, chunk=CHUNK_PAGES, on_progress=None):
+    """
+    PDF(바이트 / 경로 / 파일 객체)의 페이지별 텍스트 목록.
+    페이지 범위를 프로세스 풀에 나눠 주고, 끝나는 대로 on_progress(완료 페이지 수, 전체 페이지 수) 호출.
+    """
+    stream = _as_stream(source)
+    reader = PdfReader(stream)
+    total = len(reader.pages)
+    pages = [""] * total
+    if total == 0:
+        return pages
+
+    if workers <= 1 or total < MIN_PARALLEL_PAGES:
+        for i, page in enumerate(reader.pages):
+            pages[i] = _page_text(page)
+            if on_progress:
+                on_progress(i + 1, total)
+        return pages
+
+    # 작업 프로세스에는 바이트 대신 파일 경로만 넘김 (청크마다 문서 전체를 복사하지 않도록)
+    if isinstance(source, (str, Path)):
+        path, owned = str(source), False
+    else:
+        stream.seek(0)
+        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
+            shutil.copyfileobj(stream, tmp)
+            path, owned = tmp.name, True
+    try:
+        done = 0
+        with ProcessPoolExecutor(max_workers=workers, mp_context=_MP_CONTEXT) as pool:
+            # 큰 문서는 프로세스당 8조각 정도로 나눠 작업 전달 비용을 줄임
+            size = max(chunk, total // (workers * 8))
+            futures = [pool.submit(_extract_range, path, s, min(s + size, total)) for s in range(0, total, size)]
+            for future in as_completed(futures):
+                start, texts = future.result()
+                pages[start:start + len(texts)] = texts
+                done += len(texts)
+                if on_progress:
+                    on_progress(done, total)
+    finally:
+        if owned:
+            os.unlink(path)
+    return pages
+
+def extract_text(source, workers=MAX_WORKERS, on_progress=None):
+    """페이지 텍스트를 한 번에 이어 붙인 전체 텍스트"""
+    return "\n".join(extract_pages(source, workers=workers, on_progress=on_progress))
+
+# ------------------------------------------------------------------
+# [4] 지연 추출 (필요한 페이지만, 예산이 차면 중단)
+# ------------------------------------------------------------------
+def page_count(source):
+    return len(PdfReader(_as_stream(source)).pages)
+
+def outline(source):
+    """
+    PDF 목차(북마크)의 최상위 장 목록 [{'title', 'start', 'end'}] (쪽 번호는 0부터, end는 포함 안 함)
+    목차가 없으면 빈 목록
+    """
+    reader = PdfReader(_as_stream(source))
+    total = len(reader.pages)
+    starts = []
+    try:
+        for item in reader.outline:
+            if isinstance(item, list):
+                continue  # 하위 목차는 상위 장에 포함
+            try:
+                starts.append((reader.get_destination_page_number(item), item.title))
+            except Exception:
+                continue
+    except Exception:
+        return []
+
+    starts = sorted({(p, t) for p, t in starts if 0 <= p < total})
+    chapters = []
+    for k, (start, title) in enumerate(starts):
+        end = starts[k + 1][0] if k + 1 < len(starts) else total
+        if end > start:
+            chapters.append({"title": title, "start": start, "end": end})
+    return chapters
+
+def parse_page_ranges(spec, total):
+    """'1-20, 35' -> [0, ..., 19, 34] (사람 기준 1쪽부터, 범위 밖은 무시, 빈 값이면 전체)"""
+    spec = (spec or "").strip()
+    if not spec:
+        return list(range(total))
+    picked = set()
+    for part in spec.replace(" ", "").split(","):
+        if not part:
+            continue
+        lo, _, hi = part.partition("-")
+        lo = int(lo) if lo else 1
+        hi = int(hi) if hi else (lo if not _ else total)
+        picked.update(range(max(lo, 1) - 1, min(hi, total)))
+    return sorted(picked)
+
+def read_order(pages, chapters=None, head=2):
+    """
+    읽을 순서. 목차가 있으면 각 장의 앞 head쪽(도입부)을 먼저 읽고 나머지는 문서 순서대로
+    -> 예산이 일찍 차도 모든 장이 조금씩은 요약에 들어감
+    """
+    if not chapters:
+        return list(pages)
+    selected = set(pages)
+    first = [p for ch in chapters for p in range(ch["start"], min(ch["start"] + head, ch["end"])) if p in selected]
+    seen = set(first)
+    return first + [p for p in pages if p not in seen]
+
+def iter_pages(source, order):
+    """order 순서대로 (쪽 번호, 텍스트)를 하나씩 (필요할 때만 파싱)"""
+    reader = PdfReader(_as_stream(source))
+    for i in order:
+        yield i, _page_text(reader.pages[i])
+
+def take_budget(pairs, budget=None, count_tokens=None, on_progress=None):
+    """
+    (쪽, 텍스트)를 받으면서 토큰 합이 budget에 닿으면 멈춤 (뒤 페이지는 파싱하지 않음)
+    반환: (쪽 번호순으로 정렬한 [(쪽, 텍스트)], 사용한 토큰 수, 예산 때문에 멈췄는지)
+    """
+    count_tokens = count_tokens or (lambda t: len(t) // 3)
+    picked, used, stopped = [], 0, False
+    for i, text in pairs:
+        if text.strip():
+            picked.append((i, text))
+            used += count_tokens(text)
+        if on_progress:
+            on_progress(len(picked), used)
+        if budget is not None and used >= budget:
+            stopped = True
+            break
+    return sorted(picked), used, stopped
+
+# ------------------------------------------------------------------
+# [5] 벤치마크: python -m core.pdf_text --bench a.pdf b.pdf ...
+# ------------------------------------------------------------------
+def _synthetic_pdf(n_pages, lines=40):
+    """텍스트만 있는 n쪽짜리 PDF (벤치마크용 파일이 없을 때)"""
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", None, "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for p in range(n_pages):
+        body = "BT /F1 10 Tf 12 TL 50 780 Td " + " ".join(
+            f"(Page {p + 1} line {i + 1}: the quick brown fox jumps over the lazy dog) '" for i in range(lines)) + " ET"
+        objects.append(f"<< /Length {len(body)} >>\nstream\n{body}\nendstream")
+        content_id = len(objects)
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+                       f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_id} 0 R >>")
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {n_pages} >>"
+
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for i, obj in enumerate(objects, start=1):
+        offsets.append(out.tell())
+        out.write(f"{i} 0 obj\n{obj}\nendobj\n".encode("latin-1"))
+    xref = out.tell()
+    out.write(f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode())
+    for off in offsets:
+        out.write(f"{off:010d} 00000 n \n".encode())
+    out.write(f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode())
+    return out.getvalue()
+
+def _serial_baseline(data):
+    """기존 방식: 한 프로세스에서 문자열을 계속 이어 붙임"""
+    text = ""
+    for page in PdfReader(io.BytesIO(data)).pages:
+        text += (page.extract_text() or "") + "\n"
+    return text
+
+def benchmark(corpus, workers=MAX_WORKERS):
+    for name, data in corpus:
+        n = len(PdfReader(io.BytesIO(data)).pages)
+        t0 = time.perf_counter()
+        _serial_baseline(data)
+        t1 = time.perf_counter()
+        extract_text(data, workers=workers)
+        t2 = time.perf_counter()
+        print(f"{name}: {n}쪽 | 기존 {n / (t1 - t0):,.0f}쪽/초 | 병렬({workers}) {n / (t2 - t1):,.0f}쪽/초 "
+              f"| {(t1 - t0) / (t2 - t1):.2f}배")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="PDF 텍스트 추출 벤치마크")
+    parser.add_argument("--bench", nargs="*", default=[], help="PDF 파일들 (없으면 합성 문서 사용)")
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS)
+    args = parser.parse_args()
+
+    corpus = [(p, Path(p).read_bytes()) for p in args.bench] or [
+        (f"synthetic-{n}p", _synthetic_pdf(n)) for n in (50, 200, 500)
+    ]
+    benchmark(corpus, args.workers)
@@ -0,0 +1,169 @@
+import numpy as np
+import pandas as pd
+from statistics import NormalDist
+
+# ------------------------------------------------------------------
+# [1] 수익률 행렬 & 비중
+# ------------------------------------------------------------------
+MIN_COVERAGE = 0.8  # 전체 기간의 80% 이상 가격이 있는 종목만 사용 (최근 상장 종목이 전체 기간을 잘라먹지 않도록)
+
+def usable_columns(prices, min_coverage=MIN_COVERAGE):
+    """
+    가격이 아예 없는 열(잘못된 티커)과 기간이 너무 짧은 열(최근 상장)을 미리 뺍니다.
+    반환: (남은 가격 표, 제외된 열 이름 목록)
+    """
+    counts = prices.notna().sum()
+    longest = counts.max() if len(counts) else 0
+    keep = counts[(counts > 0) & (counts >= longest * min_coverage)].index
+    excluded = [c for c in prices.columns if c not in keep]
+    return prices[list(keep)], excluded
+
+def returns_matrix(prices):
+    """종가 표(날짜 x 티커)를 일간 수익률 행렬(T x N)로 변환합니다."""
+    prices = prices.sort_index().ffill()
+    rets = prices.pct_change().iloc[1:]
+    # 상장 기간이 짧은 종목 때문에 비는 날짜는 통째로 제외 (행렬 연산을 위해 정렬 필수)
+    rets = rets.dropna(how='any')
+    return list(rets.columns), rets.to_numpy(dtype=float), rets.index
+
+def position_weights(quantities, last_prices):
+    """보유 수량 x 현재가 -> 평가금액과 비중 벡터"""
+    values = np.asarray(quantities, dtype=float) * np.asarray(last_prices, dtype=float)
+    total = values.sum()
+    if total == 0:
+        return values, values
+    return values, values / total
+
+# ------------------------------------------------------------------
+# [2] 공분산 (Ledoit-Wolf 수축 추정)
+# ------------------------------------------------------------------
+def shrinkage_covariance(R):
+    """
+    표본 공분산을 '평균 분산 x 단위행렬' 쪽으로 수축시킵니다.
+    종목 수에 비해 관측일이 적을 때 표본 공분산이 불안정해지는 문제를 막아줍니다.
+    """
+    T, N = R.shape
+    X = R - R.mean(axis=0)
+    S = X.T @ X / T
+
+    mu = np.trace(S) / N
+    target = mu * np.eye(N)
+
+    d2 = np.sum((S - target) ** 2) / N
+    # 표본 공분산 자체의 추정 오차 (관측치별 외적의 흩어짐)
+    row_norm2 = np.sum(X ** 2, axis=1)
+    b2_bar = (np.sum(row_norm2 ** 2) / T - np.sum(S ** 2)) / (T * N)
+    b2 = min(b2_bar, d2)
+
+    shrink = b2 / d2 if d2 > 0 else 1.0
+    return shrink * target + (1 - shrink) * S, shrink
+
+# ------------------------------------------------------------------
+# [3] VaR / CVaR
+# ------------------------------------------------------------------
+def parametric_var(w, mean, cov, confidence=0.95, horizon=1):
+    """정규분포 가정 VaR/CVaR (손실을 양수 비율로 반환)"""
+    mu_p = float(w @ mean) * horizon
+    sigma_p = float(np.sqrt(w @ cov @ w * horizon))
+
+    dist = NormalDist()
+    z = dist.inv_cdf(1 - confidence)
+    var = -(mu_p + z * sigma_p)
+    cvar = -(mu_p - sigma_p * dist.pdf(z) / (1 - confidence))
+    return var, cvar
+
+def historical_var(w, R, confidence=0.95, horizon=1):
+    """실제 과거 수익률 분포로 계산한 VaR/CVaR"""
+    port = R @ w
+    if horizon > 1:
+        # 겹치는 구간의 누적 수익률 (컨볼루션으로 한 번에)
+        port = np.convolve(port, np.ones(horizon), mode='valid')
+
+    cutoff = np.quantile(port, 1 - confidence)
+    tail = port[port <= cutoff]
+    var = -float(cutoff)
+    cvar = -float(tail.mean()) if tail.size else var
+    return var, cvar
+
+def risk_contributions(w, cov):
+    """종목별 위험 기여도 (합계 = 1)"""
+    port_var = w @ cov @ w
+    if port_var == 0:
+        return np.zeros_like(w)
+    return w * (cov @ w) / port_var
+
+# ------------------------------------------------------------------
+# [4] 스트레스 테스트 (팩터 충격 시나리오)
+# ------------------------------------------------------------------
+def factor_betas(R_assets, R_factors):
+    """종목 수익률을 팩터 수익률로 한 번에 회귀 -> 베타 행렬(N x K)"""
+    T = R_assets.shape[0]
+    X = np.column_stack([np.ones(T), R_factors])
+    coef, *_ = np.linalg.lstsq(X, R_assets, rcond=None)
+    return coef[1:].T
+
+def stress_test(w, betas, shocks):
+    """팩터별 충격(비율 벡터)을 주었을 때 종목별/포트폴리오 예상 수익률"""
+    asset_impact = betas @ np.asarray(shocks, dtype=float)
+    return asset_impact, float(w @ asset_impact)
+
+# ------------------------------------------------------------------
+# [5] 통합 실행
+# ------------------------------------------------------------------
+def compute_portfolio_risk(prices, holdings, factor_prices=None, confidence=0.95, horizon=1):
+    """
+    holdings: {티커: 수량}
+    prices: 보유 종목 종가 표, factor_prices: 팩터(지수) 종가 표
+    """
+    tickers = [t for t in holdings if t in prices.columns]
+    if not tickers:
+        return None
+
+    frame = prices[tickers]
+    if factor_prices is not None and not factor_prices.empty:
+        # 종목/팩터 날짜를 맞추기 위해 한 표로 합친 뒤 분리
+        frame = pd.concat([frame, factor_prices.add_prefix("F:")], axis=1)
+
+    # 한 종목의 빈 열 때문에 모든 날짜가 지워지지 않도록 행 단위 제거 전에 열부터 정리
+    frame, dropped = usable_columns(frame)
+    excluded = [c for c in dropped if not c.startswith("F:")]
+    tickers = [t for t in tickers if t not in excluded]
+    if not tickers:
+        return None
+
+    cols, R_all, dates = returns_matrix(frame)
+    if len(dates) < 20:
+        return None
+
+    asset_idx = [i for i, c in enumerate(cols) if not c.startswith("F:")]
+    factor_idx = [i for i, c in enumerate(cols) if c.startswith("F:")]
+    R = R_all[:, asset_idx]
+
+    last_prices = prices[tickers].ffill().iloc[-1].to_numpy(dtype=float)
+    values, w = position_weights([holdings[t] for t in tickers], last_prices)
+
+    mean = R.mean(axis=0)
+    cov, shrink = shrinkage_covariance(R)
+
+    p_var, p_cvar = parametric_var(w, mean, cov, confidence, horizon)
+    h_var, h_cvar = historical_var(w, R, confidence, horizon)
+
+    result = {
+        "tickers": tickers,
+        "excluded": excluded,
+        "values": values,
+        "weights": w,
+        "total_value": float(values.sum()),
+        "cov": cov,
+        "shrinkage": shrink,
+        "volatility": float(np.sqrt(w @ cov @ w * 252)),
+        "parametric": {"var": p_var, "cvar": p_cvar},
+        "historical": {"var": h_var, "cvar": h_cvar},
+        "contributions": risk_contributions(w, cov),
+        "observations": len(dates),
+        "factors": [cols[i][2:] for i in factor_idx],
+        "betas": None,
+    }
+    if factor_idx:
+        result["betas"] = factor_betas(R, R_all[:, factor_idx])
+    return result
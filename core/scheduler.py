@@ -0,0 +1,68 @@
+import datetime
+import threading
+import time
+from zoneinfo import ZoneInfo
+
+# ------------------------------------------------------------------
+# 작업 스케줄러 (주기 실행 / 매일 정해진 한국 시각 / 백그라운드 1회 실행)
+# ------------------------------------------------------------------
+KST = ZoneInfo("Asia/Seoul")
+
+def parse_hhmm(text):
+    hour, minute = map(int, text.split(":"))
+    return datetime.time(hour, minute)
+
+def next_daily(at, now=None):
+    """다음 '매일 at(HH:MM, 한국 시각)' 시각"""
+    now = now or datetime.datetime.now(KST)
+    at = parse_hhmm(at) if isinstance(at, str) else at
+    target = now.replace(hour=at.hour, minute=at.minute, second=0, microsecond=0)
+    if target <= now:
+        target += datetime.timedelta(days=1)
+    return target
+
+def _run_logged(fn, label):
+    started = time.time()
+    try:
+        result = fn()
+        print(f"[{label}] {time.strftime('%H:%M:%S')} 완료 ({time.time() - started:.1f}초) {result if result is not None else ''}", flush=True)
+    except Exception as e:
+        print(f"[{label}] 실패: {e}", flush=True)
+
+def every(interval, fn, label="job"):
+    """interval초마다 fn 실행 (실행 시간만큼 대기 시간을 줄임)"""
+    while True:
+        started = time.time()
+        _run_logged(fn, label)
+        time.sleep(max(0, interval - (time.time() - started)))
+
+def daily(at, fn, label="job"):
+    """매일 at(HH:MM, 한국 시각)에 fn 실행"""
+    while True:
+        target = next_daily(at)
+        print(f"[{label}] 다음 실행: {target:%m-%d %H:%M} KST", flush=True)
+        time.sleep(max(0, (target - datetime.datetime.now(KST)).total_seconds()))
+        _run_logged(fn, label)
+
+# 페이지에서 호출: 같은 이름의 작업은 동시에 하나만 백그라운드로 실행
+_running = set()
+_running_lock = threading.Lock()
+
+def run_async(name, fn, *args, **kwargs):
+    """이미 실행 중이면 False, 새로 시작했으면 True"""
+    with _running_lock:
+        if name in _running:
+            return False
+        _running.add(name)
+
+    def worker():
+        try:
+            fn(*args, **kwargs)
+        except Exception:
+            pass
+        finally:
+            with _running_lock:
+                _running.discard(name)
+
+    threading.Thread(target=worker, name=name, daemon=True).start()
+    return True
@@ -0,0 +1,203 @@
+import re
+import sqlite3
+import time
+from contextlib import contextmanager
+
+from core.storage import session
+
+# ------------------------------------------------------------------
+# [1] 스키마 (문서 원본 + FTS5 색인)
+# ------------------------------------------------------------------
+# 2글자 겹침 토큰(bigram) 색인: '기준금리' -> 기준 준금 금리
+# -> 금리·야구·환율 같은 2글자 검색어도 BM25 순위로 찾고, 긴 검색어는 bigram 구(phrase)로 부분 문자열 검색
+# 색인은 본문을 저장하지 않는 contentless 테이블이라 본문을 두 번 저장하지 않음
+DB_NAME = "search"
+INDEX_VERSION = 2  # 1: trigram 외부 콘텐츠 색인
+MAX_BODY = 200_000  # 문서 하나당 색인하는 최대 글자 수
+
+KINDS = {
+    "pdf": "📑 PDF 요약",
+    "youtube": "⛏️ 유튜브",
+    "note": "🧠 지식 노트",
+    "travel": "🍽️ 맛집 분석",
+    "memo": "📝 메모",
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id         INTEGER PRIMARY KEY,
+    kind       TEXT NOT NULL,
+    ref        TEXT NOT NULL,
+    title      TEXT NOT NULL,
+    body       TEXT NOT NULL,
+    url        TEXT,
+    created_at REAL NOT NULL,
+    UNIQUE (kind, ref)
+);
+CREATE INDEX IF NOT EXISTS idx_documents_created ON documents (created_at);
+CREATE VIRTUAL TABLE IF NOT EXISTS documents_bi USING fts5(title, body, content='');
+CREATE TRIGGER IF NOT EXISTS documents_bi_ai AFTER INSERT ON documents BEGIN
+    INSERT INTO documents_bi (rowid, title, body) VALUES (new.id, bigrams(new.title), bigrams(new.body));
+END;
+CREATE TRIGGER IF NOT EXISTS documents_bi_ad AFTER DELETE ON documents BEGIN
+    INSERT INTO documents_bi (documents_bi, rowid, title, body)
+    VALUES ('delete', old.id, bigrams(old.title), bigrams(old.body));
+END;
+CREATE TRIGGER IF NOT EXISTS documents_bi_au AFTER UPDATE ON documents BEGIN
+    INSERT INTO documents_bi (documents_bi, rowid, title, body)
+    VALUES ('delete', old.id, bigrams(old.title), bigrams(old.body));
+    INSERT INTO documents_bi (rowid, title, body) VALUES (new.id, bigrams(new.title), bigrams(new.body));
+END;
+"""
+
+_RUN = re.compile(r"[^\W_]+")
+
+def bigrams(text):
+    """'기준금리 인상' -> '기준 준금 금리 인상' (글자 덩어리마다 2글자씩 겹쳐 자름, 1글자 덩어리는 그대로)"""
+    tokens = []
+    for run in _RUN.findall((text or "").lower()):
+        if len(run) == 1:
+            tokens.append(run)
+        else:
+            tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+    return " ".join(tokens)
+
+def _migrate(conn):
+    """trigram 색인(버전 1)을 지우고 기존 문서로 bigram 색인을 다시 채움"""
+    if conn.execute("PRAGMA user_version").fetchone()[0] >= INDEX_VERSION:
+        return
+    conn.executescript("""
+        DROP TRIGGER IF EXISTS documents_ai;
+        DROP TRIGGER IF EXISTS documents_ad;
+        DROP TRIGGER IF EXISTS documents_au;
+        DROP TABLE IF EXISTS documents_fts;
+        DELETE FROM documents_bi;
+        INSERT INTO documents_bi (rowid, title, body) SELECT id, bigrams(title), bigrams(body) FROM documents;
+    """)
+    conn.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+
+@contextmanager
+def _db():
+    # 트리거가 파이썬 함수 bigrams()를 쓰므로 연결마다 등록한 뒤 스키마 실행
+    with session(DB_NAME) as conn:
+        conn.create_function("bigrams", 1, bigrams, deterministic=True)
+        conn.executescript(SCHEMA)
+        _migrate(conn)
+        yield conn
+
+# ------------------------------------------------------------------
+# [2] 쓰기 (페이지에서 결과가 나올 때마다 한 건씩)
+# ------------------------------------------------------------------
+_UPSERT = (
+    "INSERT INTO documents (kind, ref, title, body, url, created_at) VALUES (?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT(kind, ref) DO UPDATE SET title = excluded.title, body = excluded.body, url = excluded.url "
+    # 내용이 같으면 갱신하지 않음 -> 색인 재작성 없음
+    "WHERE documents.title != excluded.title OR documents.body != excluded.body"
+)
+
+def _row(kind, ref, title, body, url=None, created_at=None):
+    return (kind, str(ref), (title or "").strip()[:300] or "(제목 없음)", (body or "")[:MAX_BODY], url,
+            created_at or time.time())
+
+def add(kind, ref, title, body, url=None, created_at=None):
+    """같은 (kind, ref)가 있으면 내용만 갱신. 색인 실패가 화면을 막지 않도록 오류는 무시."""
+    try:
+        with _db() as conn:
+            conn.execute(_UPSERT, _row(kind, ref, title, body, url, created_at))
+        return True
+    except sqlite3.Error:
+        return False
+
+def add_many(docs):
+    """[{'kind', 'ref', 'title', 'body', 'url'(선택), 'created_at'(선택)}] 한 번에 저장"""
+    try:
+        with _db() as conn:
+            conn.executemany(_UPSERT, [_row(**d) for d in docs])
+        return True
+    except sqlite3.Error:
+        return False
+
+def remove(kind, ref):
+    with _db() as conn:
+        conn.execute("DELETE FROM documents WHERE kind = ? AND ref = ?", (kind, str(ref)))
+
+def sync(kind, docs):
+    """
+    원본(시트 등)이 따로 있는 종류: docs로 upsert하고, docs에 없는 같은 종류 문서는 삭제
+    (수정·삭제된 메모가 검색에 남지 않도록)
+    """
+    rows = [_row(**{**d, "kind": kind}) for d in docs]
+    refs = {r[1] for r in rows}
+    try:
+        with _db() as conn:
+            conn.executemany(_UPSERT, rows)
+            stale = [(kind, r["ref"]) for r in conn.execute("SELECT ref FROM documents WHERE kind = ?", (kind,))
+                     if r["ref"] not in refs]
+            conn.executemany("DELETE FROM documents WHERE kind = ? AND ref = ?", stale)
+        return True
+    except sqlite3.Error:
+        return False
+
+# ------------------------------------------------------------------
+# [3] 검색 (BM25, 제목 가중치 5배)
+# ------------------------------------------------------------------
+def _snippet(body, terms, width=80):
+    """색인이 본문을 저장하지 않으므로 첫 일치 위치 주변을 직접 잘라 검색어를 굵게 표시"""
+    lower = body.lower()
+    pos = min((lower.find(t.lower()) for t in terms if t.lower() in lower), default=0)
+    start = max(0, pos - width // 2)
+    text = body[start:start + width].replace("\n", " ")
+    for t in sorted(set(terms), key=len, reverse=True):
+        text = re.sub(re.escape(t), lambda m: f"**{m.group(0)}**", text, flags=re.I)
+    return ("…" if start else "") + text + "…"
+
+def search(query, kinds=None, limit=20):
+    """
+    검색어(띄어쓰기로 구분, 모두 포함)로 문서를 찾습니다.
+    2글자 이상 단어는 bigram 색인(BM25 순위), 1글자 단어만 추가 조건(LIKE)으로 거릅니다.
+    반환: [{'kind', 'ref', 'title', 'url', 'created_at', 'snippet', 'score'}]
+    """
+    terms = [t for t in re.split(r"\s+", (query or "").strip()) if t]
+    if not terms:
+        return []
+    # 단어마다 bigram 구로 변환 ('기준금리' -> "기준 준금 금리": 이어진 토큰만 일치 = 부분 문자열 검색)
+    phrases = {t: bigrams(t) for t in terms}
+    long_terms = [t for t in terms if len(t) >= 2 and phrases[t]]
+    short_terms = [t for t in terms if t not in long_terms]
+
+    params = []
+    if long_terms:
+        match = " AND ".join(f'"{phrases[t]}"' for t in long_terms)
+        sql = ("SELECT d.kind, d.ref, d.title, d.url, d.created_at, d.body, bm25(documents_bi, 5.0, 1.0) AS score "
+               "FROM documents_bi JOIN documents d ON d.id = documents_bi.rowid "
+               "WHERE documents_bi MATCH ?")
+        params.append(match)
+    else:
+        sql = ("SELECT d.kind, d.ref, d.title, d.url, d.created_at, d.body, 0.0 AS score "
+               "FROM documents d WHERE 1=1")
+
+    for t in short_terms:
+        sql += " AND (d.title LIKE ? OR d.body LIKE ?)"
+        params += [f"%{t}%", f"%{t}%"]
+    if kinds:
+        sql += f" AND d.kind IN ({','.join('?' * len(kinds))})"
+        params += list(kinds)
+    sql += " ORDER BY score, d.created_at DESC LIMIT ?" if long_terms else " ORDER BY d.created_at DESC LIMIT ?"
+    params.append(int(limit))
+
+    with _db() as conn:
+        rows = conn.execute(sql, params).fetchall()
+
+    results = []
+    for r in rows:
+        results.append({
+            "kind": r["kind"], "ref": r["ref"], "title": r["title"], "url": r["url"],
+            "created_at": r["created_at"], "score": r["score"],
+            "snippet": _snippet(r["body"], terms),
+        })
+    return results
+
+def stats():
+    """종류별 문서 수"""
+    with _db() as conn:
+        return {r["kind"]: r["n"] for r in conn.execute("SELECT kind, COUNT(*) AS n FROM documents GROUP BY kind")}
@@ -0,0 +1,34 @@
+import time
+
+from core import kv, scheduler
+
+# ------------------------------------------------------------------
+# 스냅샷 저장소: 미리 계산해 둔 화면 데이터를 먼저 보여주고, 오래됐으면 뒤에서 갱신
+# ------------------------------------------------------------------
+NAMESPACE = "snapshot"
+
+def load(name):
+    """(값, 저장 시각) 또는 (None, None)"""
+    return kv.get_with_time(NAMESPACE, name)
+
+def save(name, value):
+    kv.put(NAMESPACE, name, value)
+
+def refresh(name, compute):
+    """다시 계산해 저장. None(실패)이면 기존 스냅샷 유지."""
+    value = compute()
+    if value is not None:
+        save(name, value)
+    return value
+
+def read_through(name, compute, max_age=None):
+    """
+    스냅샷이 있으면 바로 반환하고, max_age(초)가 지났으면 백그라운드에서 갱신합니다.
+    스냅샷이 없을 때만 기다려서 계산합니다. 반환: (값, 저장 시각)
+    """
+    value, saved_at = load(name)
+    if value is None:
+        return refresh(name, compute), time.time()
+    if max_age is not None and time.time() - saved_at > max_age:
+        scheduler.run_async(f"snapshot:{name}", refresh, name, compute)
+    return value, saved_at
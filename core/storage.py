@@ -0,0 +1,34 @@
+import os
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+
+# ------------------------------------------------------------------
+# 로컬 저장소 (SQLite) 공용 헬퍼
+# ------------------------------------------------------------------
+# 기본 위치: 프로젝트 루트의 data/ (환경변수 DASHBOARD_DATA_DIR로 변경 가능)
+DATA_DIR = Path(os.environ.get("DASHBOARD_DATA_DIR", Path(__file__).resolve().parent.parent / "data"))
+
+def connect(name):
+    """data/<name>.db 연결을 엽니다. 여러 세션/스레드가 동시에 읽을 수 있도록 WAL 모드 사용."""
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(DATA_DIR / f"{name}.db", timeout=30)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+@contextmanager
+def session(name, schema=None):
+    """연결을 열고(필요하면 스키마 생성) 끝나면 커밋 후 닫습니다."""
+    conn = connect(name)
+    try:
+        if schema:
+            conn.executescript(schema)
+        yield conn
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
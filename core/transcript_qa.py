@@ -0,0 +1,106 @@
+import math
+import re
+from collections import Counter
+
+from core import llm, transcripts
+
+# ------------------------------------------------------------------
+# [1] 구간 나누기 (자막 여러 줄 -> 질문 검색 단위)
+# ------------------------------------------------------------------
+SEGMENT_CHARS = 600   # 구간 하나의 대략적인 글자 수
+TOP_K = 6             # 질문마다 보내는 구간 수 -> 영상 길이와 상관없이 프롬프트 약 4천 자
+
+def segment(starts, texts, size=SEGMENT_CHARS):
+    """
+    연속된 자막 줄을 size 글자 안팎으로 묶습니다. 앞 구간의 마지막 줄을 겹쳐 넣어 문장이 끊기지 않게.
+    반환: [{'start': 시작 ms, 'end': 다음 구간 시작 ms, 'text'}]
+    """
+    segments, lines, length, first, carried = [], [], 0, 0, 0
+    for i, text in enumerate(texts):
+        if not lines:
+            first = i
+        lines.append(text)
+        length += len(text) + 1
+        if length >= size:
+            segments.append({"start": starts[first], "text": " ".join(lines)})
+            lines, length, carried = [], 0, 0
+            if i + 1 < len(texts) and len(text) + 1 < size:
+                lines, length, first, carried = [text], len(text) + 1, i, 1  # 한 줄 겹침 (그 줄만으로 구간이 차면 겹치지 않음)
+    if len(lines) > carried:  # 겹친 줄만 남았으면 새 구간을 만들지 않음
+        segments.append({"start": starts[first], "text": " ".join(lines)})
+    for k, seg in enumerate(segments):
+        seg["end"] = segments[k + 1]["start"] if k + 1 < len(segments) else None
+    return segments
+
+# ------------------------------------------------------------------
+# [2] BM25 (형태소 분석기 없이 한국어 2글자 단위로 색인)
+# ------------------------------------------------------------------
+K1, B = 1.5, 0.75
+MIN_RELATIVE_SCORE = 0.1  # 1등 점수의 10% 미만인 구간은 보내지 않음
+_WORD = re.compile(r"[0-9a-zA-Z]+|[가-힣]+")
+
+def tokenize(text):
+    """영문·숫자는 단어 그대로, 한글은 2글자씩 겹쳐 자름 ('금리인상' -> 금리, 리인, 인상) -> 조사가 붙어도 매칭"""
+    tokens = []
+    for word in _WORD.findall(text.lower()):
+        if word.isascii() or len(word) <= 2:
+            tokens.append(word)
+        else:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return tokens
+
+def build_index(segments):
+    """구간 목록 -> {'segments', 'tfs', 'lengths', 'avgdl', 'idf'}"""
+    tfs = [Counter(tokenize(seg["text"])) for seg in segments]
+    lengths = [sum(tf.values()) for tf in tfs]
+    df = Counter(term for tf in tfs for term in tf)
+    n = len(segments)
+    idf = {term: math.log(1 + (n - f + 0.5) / (f + 0.5)) for term, f in df.items()}
+    return {"segments": segments, "tfs": tfs, "lengths": lengths,
+            "avgdl": (sum(lengths) / n) if n else 0.0, "idf": idf}
+
+def search(index, query, k=TOP_K):
+    """질문과 가장 관련 있는 구간 k개 (영상 시간 순서로 정렬)"""
+    terms = [t for t in set(tokenize(query)) if t in index["idf"]]
+    if not terms:
+        return []
+    scored = []
+    avgdl = index["avgdl"] or 1.0
+    for i, tf in enumerate(index["tfs"]):
+        norm = K1 * (1 - B + B * index["lengths"][i] / avgdl)
+        score = sum(index["idf"][t] * tf[t] * (K1 + 1) / (tf[t] + norm) for t in terms if t in tf)
+        if score > 0:
+            scored.append((score, i))
+    top = sorted(scored, key=lambda x: (-x[0], x[1]))[:k]  # 동점이면 앞 구간 우선
+    if top:
+        top = [(score, i) for score, i in top if score >= top[0][0] * MIN_RELATIVE_SCORE]  # 흔한 단어로만 걸린 구간 제외
+    return [{**index["segments"][i], "score": score} for score, i in sorted(top, key=lambda x: x[1])]
+
+# ------------------------------------------------------------------
+# [3] 질문 -> 관련 구간만 담은 프롬프트 -> 답변
+# ------------------------------------------------------------------
+PROMPT = """
+다음은 유튜브 영상 '{title}'의 자막 중 질문과 관련 있는 구간들이야. (각 구간 앞의 [mm:ss]는 영상 시각)
+
+[관련 구간]
+{context}
+
+[질문]
+{question}
+
+[답변 규칙]
+1. 위 구간 내용만 근거로 한국어로 답해.
+2. 근거가 된 부분마다 [mm:ss] 타임스탬프를 붙여.
+3. 구간에 답이 없으면 "영상의 관련 부분에서 찾지 못했습니다"라고 말해.
+"""
+
+def build_prompt(title, question, hits):
+    context = "\n\n".join(f"[{transcripts.timestamp(h['start'])}] {h['text']}" for h in hits)
+    return PROMPT.format(title=title or "제목 없음", context=context, question=question)
+
+def answer(index, title, question, k=TOP_K):
+    """반환: (답변, 사용한 구간 목록)"""
+    hits = search(index, question, k)
+    if not hits:
+        return "질문과 관련된 부분을 자막에서 찾지 못했습니다. 다른 단어로 물어봐 주세요.", []
+    return llm.generate(build_prompt(title, question, hits)), hits
@@ -0,0 +1,308 @@
+import argparse
+import codecs
+import json
+import re
+import time
+import zlib
+from array import array
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import yt_dlp
+
+from core import http_client
+from core.storage import session
+
+# ------------------------------------------------------------------
+# [1] 스키마 (영상 ID 단위 자막 저장소)
+# ------------------------------------------------------------------
+# 자막은 (시작 ms int32 배열, 문장 목록) 두 덩어리로 압축 저장 -> 한 시간짜리 영상도 수십 KB
+DB_NAME = "youtube"
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS transcripts (
+    video_id   TEXT PRIMARY KEY,
+    title      TEXT,
+    channel    TEXT,
+    duration   INTEGER,
+    lang       TEXT,
+    track      TEXT,
+    starts     BLOB NOT NULL,
+    texts      BLOB NOT NULL,
+    fetched_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS summaries (
+    video_id   TEXT NOT NULL,
+    variant    TEXT NOT NULL,
+    summary    TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (video_id, variant)
+);
+"""
+LANG_PRIORITY = ['ko', 'en']  # 한국어 우선, 없으면 영어
+
+def _db():
+    return session(DB_NAME, SCHEMA)
+
+def video_id(url):
+    """watch?v= / youtu.be / shorts / embed 주소에서 11자리 영상 ID"""
+    match = re.search(r'(?:v=|youtu\.be/|shorts/|embed/|live/)([A-Za-z0-9_-]{11})', url or "")
+    return match.group(1) if match else None
+
+# ------------------------------------------------------------------
+# [2] 압축 저장 / 복원
+# ------------------------------------------------------------------
+def _pack(starts, texts):
+    return array('i', starts).tobytes(), zlib.compress("\n".join(texts).encode("utf-8"))
+
+def _unpack(starts_blob, texts_blob):
+    starts = array('i')
+    starts.frombytes(starts_blob)
+    texts = zlib.decompress(texts_blob).decode("utf-8").split("\n") if starts else []
+    return starts, texts
+
+def load(vid):
+    """저장된 자막 {'video_id', 'title', 'channel', 'duration', 'lang', 'track', 'starts', 'texts'} 또는 None"""
+    with _db() as conn:
+        row = conn.execute("SELECT * FROM transcripts WHERE video_id = ?", (vid,)).fetchone()
+    if row is None:
+        return None
+    starts, texts = _unpack(row["starts"], row["texts"])
+    return {"video_id": vid, "title": row["title"], "channel": row["channel"], "duration": row["duration"],
+            "lang": row["lang"], "track": row["track"], "starts": starts, "texts": texts}
+
+def save(meta, starts, texts):
+    starts_blob, texts_blob = _pack(starts, texts)
+    with _db() as conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO transcripts VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (meta["video_id"], meta.get("title"), meta.get("channel"), meta.get("duration"),
+             meta.get("lang"), meta.get("track"), starts_blob, texts_blob, time.time())
+        )
+
+def get_summary(vid, variant="default"):
+    with _db() as conn:
+        row = conn.execute("SELECT summary FROM summaries WHERE video_id = ? AND variant = ?", (vid, variant)).fetchone()
+    return row["summary"] if row else None
+
+def save_summary(vid, summary, variant="default"):
+    with _db() as conn:
+        conn.execute("INSERT OR REPLACE INTO summaries VALUES (?, ?, ?, ?)", (vid, variant, summary, time.time()))
+
+# ------------------------------------------------------------------
+# [3] yt-dlp 자막 추출 (저장본이 없을 때만)
+# ------------------------------------------------------------------
+YDL_OPTS = {
+    'skip_download': True,      # 영상은 다운로드 안 함
+    'writeautomaticsub': True,  # 자동 생성 자막 가져오기
+    'writesubtitles': True,     # 수동 자막도 가져오기
+    'subtitleslangs': LANG_PRIORITY,
+    'quiet': True,              # 로그 출력 끄기
+}
+
+def _choose_track(info):
+    """우선순위: 한국어(수동) > 한국어(자동) > 영어(수동) > 영어(자동) > 아무 자동 자막"""
+    subs = info.get('subtitles') or {}
+    auto_subs = info.get('automatic_captions') or {}
+    for lang in LANG_PRIORITY:
+        if lang in subs:
+            return lang, "manual", subs[lang]
+        if lang in auto_subs:
+            return lang, "auto", auto_subs[lang]
+    if auto_subs:
+        first_lang = list(auto_subs.keys())[0]
+        return first_lang, "auto", auto_subs[first_lang]
+    return None, None, None
+
+STREAM_CHUNK = 256 * 1024
+# json3 이벤트는 {"tStartMs": N, ..., "segs": [{"utf8": "..."}, ...]} 형태 (tStartMs가 항상 segs보다 앞)
+# -> 이벤트·조각을 dict로 만들지 않고 필요한 두 필드만 정규식으로 바로 뽑음
+# 문자열 안의 따옴표는 항상 \" 로 이스케이프되므로 본문 속 글자가 키로 잘못 잡히지 않음
+# (두 키의 공통 접두사 '"'를 밖으로 빼고, 문자열은 '이스케이프 없는 구간 위주'로 읽어 정규식 역추적을 줄임)
+_FIELD = re.compile(r'"(?:tStartMs"\s*:\s*(\d+)|utf8"\s*:\s*"([^"\\]*(?:\\.[^"\\]*)*)")')
+_EVENT_KEY = '"tStartMs"'
+_string = json.JSONDecoder()
+
+def _scan(text, starts, texts):
+    """
+    완성된 이벤트들만 담긴 text -> 배열에 추가.
+    뽑은 필드를 [구분자 시작ms 구분자 조각 조각 ...] 한 줄로 이어 붙인 뒤 이벤트 단위로 나눔
+    (조각은 이어 붙이기만 하고, 공백 정리·이스케이프 해제는 이벤트마다 한 번)
+    """
+    found = _FIELD.findall(text)
+    if not found:
+        return
+    # JSON 문자열 원문에는 제어 문자가 그대로 올 수 없으므로 \x00, \x01을 구분자로 써도 안전
+    joined = "".join([f"\x00{ms}\x01" if ms else seg for ms, seg in found])
+    for event in joined.split("\x00")[1:]:
+        ms, _, body = event.partition("\x01")
+        if "\\" in body:
+            body = _string.decode(f'"{body}"')  # \n, \u00e9 등 이스케이프가 있는 이벤트만 해제
+        if body and not body.isspace():
+            starts.append(int(ms))
+            texts.append(" ".join(body.split()))  # 줄바꿈은 저장 구분자로 쓰므로 공백으로
+
+def parse_json3(chunks):
+    """
+    json3 바이트 조각들 -> (시작 ms int32 배열, 문장 목록). (ijson처럼 받는 대로 처리)
+    버퍼는 마지막 이벤트 시작 위치에서 잘라 완성된 이벤트만 스캔 -> 메모리는 조각 하나 크기 정도
+    """
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    starts, texts = array('i'), []
+    buf = ""
+    for chunk in chunks:
+        buf += utf8.decode(chunk)
+        cut = buf.rfind(_EVENT_KEY)
+        if cut > 0:
+            _scan(buf[:cut], starts, texts)
+            buf = buf[cut:]
+    _scan(buf + utf8.decode(b"", final=True), starts, texts)
+    return starts, texts
+
+def _json3_url(track):
+    """트랙에 json3 포맷이 없으면 timedtext 주소의 fmt만 json3로 바꿔 요청 (vtt·srv3를 json3 파서에 넣지 않음)"""
+    fmt = next((f for f in track if f.get('ext') == 'json3'), None)
+    if fmt is not None:
+        return fmt['url']
+    parts = urlsplit(track[0]['url'])
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k != 'fmt'] + [('fmt', 'json3')]
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+def fetch(url):
+    """yt-dlp로 메타데이터·자막 트랙을 찾아 받아옵니다. 반환: (meta, starts, texts)"""
+    with yt_dlp.YoutubeDL(YDL_OPTS) as ydl:
+        info = ydl.extract_info(url, download=False)
+
+    lang, kind, track = _choose_track(info)
+    if not track:
+        raise LookupError("자막 트랙을 찾을 수 없습니다.")
+
+    # 자막 URL은 서명이 매번 바뀌므로 캐시 없이 공용 커넥션 풀만 사용, 받는 대로 파싱
+    with http_client.get(_json3_url(track), timeout=15, cache=False, stream=True) as response:
+        response.raise_for_status()
+        starts, texts = parse_json3(response.iter_content(STREAM_CHUNK))
+    if not texts:
+        # json3가 아닌 응답(vtt 등)도 파서는 조용히 빈 결과를 돌려주므로 여기서 실패로 처리 (빈 자막은 저장하지 않음)
+        raise LookupError("json3 자막을 받지 못했습니다.")
+
+    meta = {
+        "video_id": info.get('id') or video_id(url),
+        "title": info.get('title'),
+        "channel": info.get('channel') or info.get('uploader'),
+        "duration": info.get('duration'),
+        "lang": lang,
+        "track": f"{kind}:json3",
+    }
+    return meta, starts, texts
+
+def is_collection(url):
+    """재생목록(list=) 또는 채널(@핸들, /channel/, /c/, /user/) 주소인지"""
+    return bool(re.search(r'[?&]list=|youtube\.com/(?:@|channel/|c/|user/)', url or ""))
+
+def _channel_videos_url(url):
+    """채널 첫 화면은 '동영상/쇼츠' 탭 목록이 나오므로 동영상 탭으로 바로 이동"""
+    match = re.match(r'(https?://(?:www\.|m\.)?youtube\.com/(?:@[^/?#]+|channel/[^/?#]+|c/[^/?#]+|user/[^/?#]+))/?(?:[?#].*)?$', url)
+    return f"{match.group(1)}/videos" if match else url
+
+def list_videos(url, limit=50):
+    """
+    재생목록·채널의 영상 목록을 영상 페이지는 열지 않고(flat) 가져옵니다.
+    반환: [{'video_id', 'title', 'url', 'duration'}] (목록 순서, 최대 limit개)
+    """
+    opts = {'extract_flat': 'in_playlist', 'skip_download': True, 'quiet': True, 'playlistend': limit}
+    with yt_dlp.YoutubeDL(opts) as ydl:
+        info = ydl.extract_info(_channel_videos_url(url), download=False)
+
+    videos, seen = [], set()
+    for entry in info.get('entries') or []:
+        if not entry:
+            continue
+        vid = video_id(entry.get('url')) or entry.get('id')
+        if not vid or len(vid) != 11 or vid in seen:
+            continue  # 하위 재생목록·탭 등 영상이 아닌 항목
+        seen.add(vid)
+        videos.append({"video_id": vid, "title": entry.get('title'), "duration": entry.get('duration'),
+                       "url": f"https://www.youtube.com/watch?v={vid}"})
+    return videos[:limit]
+
+def get_transcript(url, refresh=False):
+    """
+    영상 ID로 저장본을 먼저 찾고, 없을 때만 yt-dlp 실행 후 저장합니다.
+    반환: load()와 같은 dict + 'cached'
+    """
+    vid = video_id(url)
+    if vid and not refresh:
+        cached = load(vid)
+        if cached is not None and cached["texts"]:  # 예전에 저장된 빈 자막은 다시 받음
+            return {**cached, "cached": True}
+
+    meta, starts, texts = fetch(url)
+    save(meta, starts, texts)
+    return {**meta, "starts": starts, "texts": texts, "cached": False}
+
+# ------------------------------------------------------------------
+# [4] 화면용 변환 (저장은 배열 그대로, 문자열은 필요할 때만)
+# ------------------------------------------------------------------
+def timestamp(ms):
+    m, s = divmod(int(ms) // 1000, 60)
+    return f"{m:02d}:{s:02d}"
+
+def format_script(starts, texts, max_chars=None):
+    """'[mm:ss] 문장 [mm:ss] 문장 ...' (max_chars를 넘으면 그 앞에서 멈춤 -> 자를 부분은 만들지도 않음)"""
+    parts, size = [], 0
+    for ms, text in zip(starts, texts):
+        part = f"[{timestamp(ms)}] {text}"
+        size += len(part) + 1
+        if max_chars is not None and size > max_chars + 1:
+            break
+        parts.append(part)
+    return " ".join(parts)
+
+# ------------------------------------------------------------------
+# [5] 벤치마크: python -m core.transcripts --bench [--hours 3]
+# ------------------------------------------------------------------
+def _synthetic_json3(hours=3):
+    """유튜브가 주는 모양 그대로의 자동 자막 json3 (들여쓰기, 단어 단위 segs + 인식 신뢰도, 약 2초마다 이벤트)"""
+    words = "오늘은 자막 파싱 성능을 측정합니다 오늘은 자막 파싱 성능을".split()
+    events = []
+    for i in range(int(hours * 3600 / 2)):
+        events.append({"tStartMs": i * 2000, "dDurationMs": 2000, "wWinId": 1,
+                       "segs": [{"utf8": (" " if k else "") + w, "tOffsetMs": k * 300, "acAsrConf": 200}
+                                for k, w in enumerate(words)]})
+        events.append({"tStartMs": i * 2000 + 1900, "wWinId": 1, "aAppend": 1, "segs": [{"utf8": "\n"}]})
+    doc = {"wireMagic": "pb3", "pens": [{}], "wsWinStyles": [{}], "wpWinPositions": [{}], "events": events}
+    return json.dumps(doc, indent=2, ensure_ascii=False).encode("utf-8")
+
+def _legacy_parse(raw):
+    """기존 방식: 전체 json 로드 후 문자열 += 로 이어 붙임"""
+    full_text = ""
+    for event in json.loads(raw).get('events', []):
+        start_sec = int(event.get('tStartMs', 0) / 1000)
+        m, s = divmod(start_sec, 60)
+        text = "".join([seg.get('utf8', '') for seg in event.get('segs', [])]).strip()
+        if text:
+            full_text += f"[{m:02d}:{s:02d}] {text} "
+    return full_text
+
+def benchmark(hours=3, repeat=5):
+    """시간은 tracemalloc 없이 repeat번 중 최솟값, 메모리는 따로 한 번 측정"""
+    import tracemalloc
+    raw = _synthetic_json3(hours)
+    chunks = lambda: (raw[i:i + STREAM_CHUNK] for i in range(0, len(raw), STREAM_CHUNK))
+    print(f"합성 자막 {hours:g}시간 · 원본 {len(raw) / 1e6:,.1f}MB")
+    for name, fn in (("기존(json+문자열)", lambda: _legacy_parse(raw)), ("스트리밍(배열)", lambda: parse_json3(chunks()))):
+        elapsed = []
+        for _ in range(repeat):
+            t = time.perf_counter()
+            fn()
+            elapsed.append(time.perf_counter() - t)
+        tracemalloc.start()
+        fn()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"{name}: {min(elapsed) * 1000:,.0f}ms · 최대 메모리 {peak / 1e6:,.1f}MB")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="json3 자막 파서 벤치마크")
+    parser.add_argument("--bench", action="store_true")
+    parser.add_argument("--hours", type=float, default=3)
+    args = parser.parse_args()
+    benchmark(args.hours)
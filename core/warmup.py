@@ -0,0 +1,77 @@
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from core import briefing, kbo_news, opinion_archive, scheduler, snapshots
+
+# ------------------------------------------------------------------
+# [1] 스냅샷 목록 (이름 -> 계산 함수, 최대 허용 나이)
+# ------------------------------------------------------------------
+WARMUP_AT = os.environ.get("DASHBOARD_WARMUP_AT", "06:30")  # 한국 시각 (미국장 마감 후, 출근 전)
+WEATHER_TTL = 1800
+MARKET_TTL = 1800
+KBO_TTL = 600
+
+def _spec(name, force=False):
+    if name == "weather":
+        return briefing.weather, WEATHER_TTL
+    if name.startswith("daily_content:"):
+        return partial(briefing.daily_content, name.split(":", 1)[1]), None  # 날짜별 키 -> 그날은 계속 유효
+    if name == "us_market":
+        return briefing.us_market, MARKET_TTL
+    if name.startswith("kbo:"):
+        return partial(kbo_news.briefing, name[4:], force=force), KBO_TTL
+    raise KeyError(name)
+
+def daily_content_name(day=None):
+    return f"daily_content:{day or briefing.korea_today()}"
+
+def read(name, force=False):
+    """
+    페이지용: 스냅샷을 먼저 반환하고 오래됐으면 뒤에서 갱신. (값, 저장 시각)
+    force=True면 기다려서 다시 계산합니다.
+    """
+    compute, max_age = _spec(name, force)
+    if force:
+        return snapshots.refresh(name, compute), time.time()
+    return snapshots.read_through(name, compute, max_age)
+
+# ------------------------------------------------------------------
+# [2] 아침 예열 (모든 스냅샷 + 오피니언 수집을 동시에)
+# ------------------------------------------------------------------
+def morning_names():
+    return ["weather", daily_content_name(), "us_market", f"kbo:{kbo_news.ALL_TOPIC}"]
+
+def run_all(max_workers=6):
+    """반환: {작업 이름: 'ok' 또는 오류 메시지}"""
+    jobs = {name: partial(snapshots.refresh, name, _spec(name)[0]) for name in morning_names()}
+    for press, code in opinion_archive.PRESSES.items():
+        jobs[f"opinion:{press}"] = partial(opinion_archive.crawl_press, press, code, min_interval=0)
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {name: pool.submit(fn) for name, fn in jobs.items()}
+        for name, future in futures.items():
+            try:
+                future.result()
+                results[name] = "ok"
+            except Exception as e:
+                results[name] = str(e)
+    return results
+
+# ------------------------------------------------------------------
+# [3] 실행: python -m core.warmup --at 06:30  (또는 --now)
+# ------------------------------------------------------------------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="아침 브리핑 미리 계산")
+    parser.add_argument("--at", default=WARMUP_AT, help="매일 실행할 한국 시각 (HH:MM)")
+    parser.add_argument("--now", action="store_true", help="지금 한 번만 실행하고 종료")
+    args = parser.parse_args()
+
+    if args.now:
+        for name, status in run_all().items():
+            print(f"{name}: {status}")
+    else:
+        scheduler.daily(args.at, run_all, "warmup")
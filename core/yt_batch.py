@@ -0,0 +1,99 @@
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from core import llm, search_index, transcripts
+
+# ------------------------------------------------------------------
+# 재생목록·채널 일괄 요약 (자막 풀 -> 요약 풀 2단계, 요약 동시 요청은 llm 공용 제한)
+# ------------------------------------------------------------------
+VARIANT = "batch"        # 일괄 모드 요약은 단일 분석과 따로 저장
+CAPTION_WORKERS = 4      # 동시에 자막을 받는 영상 수 (yt-dlp 실행이 무거움)
+SUMMARY_WORKERS = 16     # 요약 대기 스레드 수 (실제 동시 요청 수는 llm.MAX_CONCURRENT 세마포어가 제한)
+PROMPT_CHARS = 30000     # 영상 하나당 프롬프트에 넣는 자막 최대 글자 수
+
+PROMPT = """
+다음은 유튜브 영상 '{title}'의 자막 스크립트야.
+
+[스크립트 데이터]
+{script}
+
+[요청사항]
+1. 첫 줄: 영상의 핵심을 한 문장으로.
+2. 이어서 핵심 내용 3가지를 타임스탬프([00:00])와 함께 불렛포인트로.
+한국어로 짧고 명료하게.
+"""
+
+def _result(video, status, summary=None, title=None):
+    return {"video_id": video["video_id"], "title": title or video.get("title"), "url": video["url"],
+            "status": status, "summary": summary}
+
+def fetch_captions(video):
+    """
+    1단계 (자막 풀): 저장된 자막 -> yt-dlp 순서로 자막을 받음
+    반환: (자막 dict, None) 또는 실패 시 (None, 결과 dict)
+    """
+    try:
+        transcript = transcripts.get_transcript(video["url"])
+    except Exception as e:
+        return None, _result(video, f"자막 실패: {e}")
+    if not transcript["texts"]:
+        return None, _result(video, "자막 없음", title=transcript.get("title"))
+    return transcript, None
+
+def summarize_captions(video, transcript, variant=VARIANT):
+    """2단계 (요약 풀): Gemini 요약 -> 저장·색인. 동시 요청 수는 llm 공용 제한(GEMINI_MAX_CONCURRENT)이 정함"""
+    title = transcript.get("title") or video.get("title") or video["video_id"]
+    script = transcripts.format_script(transcript["starts"], transcript["texts"], max_chars=PROMPT_CHARS)
+    try:
+        summary = llm.generate(PROMPT.format(title=title, script=script))
+    except Exception as e:
+        return _result(video, f"요약 실패: {e}", title=title)
+
+    transcripts.save_summary(video["video_id"], summary, variant)
+    search_index.add("youtube", video["video_id"], title,
+                     f"{summary}\n\n{transcripts.format_script(transcript['starts'], transcript['texts'])}",
+                     url=video["url"])
+    return _result(video, "완료", summary, title)
+
+def summarize_video(video, variant=VARIANT):
+    """
+    영상 하나 처리: 저장된 요약 -> 저장된 자막 -> yt-dlp 순서로 필요한 것만 실행
+    반환: {'video_id', 'title', 'url', 'status', 'summary'}
+    """
+    cached = transcripts.get_summary(video["video_id"], variant)
+    if cached:
+        return _result(video, "저장됨", cached)
+    transcript, failed = fetch_captions(video)
+    return failed or summarize_captions(video, transcript, variant)
+
+def run(videos, workers=CAPTION_WORKERS, variant=VARIANT):
+    """
+    영상 목록을 병렬로 처리하고, 끝나는 순서대로 결과를 하나씩 돌려줍니다. (호출한 스레드에서 화면 갱신)
+    자막을 받은 영상은 바로 요약 풀에 넘김 -> 자막 받기와 요약이 겹쳐서 진행
+    이미 요약이 저장된 영상은 바로 반환 -> 중간에 멈춰도 다시 실행하면 남은 영상만 처리
+    """
+    pending = []
+    for video in videos:
+        cached = transcripts.get_summary(video["video_id"], variant)
+        if cached:
+            yield _result(video, "저장됨", cached)
+        else:
+            pending.append(video)
+    if not pending:
+        return
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as captions, \
+            ThreadPoolExecutor(max_workers=SUMMARY_WORKERS) as summaries:
+        stage = {captions.submit(fetch_captions, video): video for video in pending}
+        while stage:
+            done, _ = wait(stage, return_when=FIRST_COMPLETED)
+            for future in done:
+                video = stage.pop(future)
+                outcome = future.result()
+                if isinstance(outcome, dict):          # 요약까지 끝난 결과
+                    yield outcome
+                    continue
+                transcript, failed = outcome
+                if failed:
+                    yield failed
+                else:
+                    stage[summaries.submit(summarize_captions, video, transcript, variant)] = video
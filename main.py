@@ -1,6 +1,8 @@
 import streamlit as st
 import datetime
 
+from core import alerts
+
 # ------------------------------------------------------------------
 # [1] 페이지 설정
 # ------------------------------------------------------------------
@@ -51,6 +53,7 @@ with col_left:
         
         st.page_link("pages/valuation.py", label="🧮 적정 주가 판독기 (S-RIM)", icon="⚖️")
         st.page_link("pages/stock.py", label="📈 주식 시장 대시보드", icon="📊")
+        st.page_link("pages/portfolio.py", label="🛡️ 포트폴리오 리스크 (VaR)", icon="📉")
         st.page_link("pages/investment.py", label="👨‍⚖️ 워렌 버핏의 투자 청문회", icon="🎤")
         st.page_link("pages/rent.py", label="🏢 병원 관리비 매니저", icon="🧾")
 
@@ -75,6 +78,7 @@ with col_right:
         st.caption("AI가 당신의 시간을 벌어줍니다.")
         
         st.page_link("pages/youtube.py", label="유튜브 인사이트 채굴기", icon="⛏️")
+        st.page_link("pages/search.py", label="통합 검색 (요약·노트·메모)", icon="🔎")
         st.page_link("pages/pdf_summary.py", label="논문/보고서 3초 요약기", icon="📑")
         
         st.page_link("pages/decision.py", label="결정의 신 (A vs B)", icon="⚖️")
@@ -82,7 +86,27 @@ with col_right:
         st.page_link("pages/english.py", label="글로벌 젠틀맨 (영어)", icon="👔")
 
 # ------------------------------------------------------------------
-# [4] 하단 상태바
+# [4] 가격 알림 (백그라운드 감시 엔진이 기록한 돌파/이탈)
+# ------------------------------------------------------------------
+try:
+    alert_df = alerts.recent_alerts(limit=10, unseen_only=True)
+except Exception:
+    alert_df = None
+
+if alert_df is not None and not alert_df.empty:
+    st.divider()
+    with st.container(border=True):
+        st.subheader(f"🔔 새 가격 알림 ({len(alert_df)}건)")
+        for row in alert_df.itertuples():
+            arrow = "📈 돌파" if row.direction == 'above' else "📉 이탈"
+            st.markdown(f"**{row.ticker}** {row.label} ${row.level:,.2f} {arrow} "
+                        f"(현재 ${row.price:,.2f}, {row.triggered_at:%m/%d %H:%M})")
+        if st.button("모두 확인 ✅"):
+            alerts.mark_seen(alert_df['id'].tolist())
+            st.rerun()
+
+# ------------------------------------------------------------------
+# [5] 하단 상태바
 # ------------------------------------------------------------------
 st.divider()
 st.caption("🚀 Powered by **Gemini AI** | Dr. Kim's Private System ✅")
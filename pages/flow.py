@@ -5,6 +5,10 @@ import plotly.graph_objects as go
 import plotly.express as px
 from datetime import datetime, timedelta
 
+from core.moneyflow import add_money_flow, DEFAULT_WINDOWS
+from core import insider_store
+from core.market_data import get_history
+
 # ------------------------------------------------------------------
 # [1] 페이지 설정
 # ------------------------------------------------------------------
@@ -20,21 +24,16 @@ st.caption("차트는 속일 수 있어도, 거래량과 내부자 거래는 속
 def analyze_smart_money(ticker_symbol):
     stock = yf.Ticker(ticker_symbol)
     
-    # 1. 기본 데이터 (1년치)
-    hist = stock.history(period="1y")
+    # 1. 기본 데이터 (1년치) - 다른 페이지와 동시에 요청되면 한 번의 다운로드로 합쳐짐
+    hist = get_history(ticker_symbol, period="1y")
     if hist.empty:
         return None, "데이터 부족"
 
     # 2. 내부자 거래 (Insider Trading)
+    # 로컬 저장소에서 조회 (12시간 이상 지난 경우에만 새로 받아 누적)
     try:
-        # 최근 6개월 내부자 거래 내역
-        insider = stock.insider_transactions
-        if insider is not None and not insider.empty:
-            # 매수(Purchase)만 필터링 (Text 컬럼 등에 'Purchase'나 'Buy'가 포함된 경우)
-            # yfinance 데이터 구조가 가변적이라 안전하게 처리
-            insider = insider.sort_index(ascending=False).head(10)
-        else:
-            insider = pd.DataFrame()
+        insider_store.refresh([ticker_symbol])
+        insider = insider_store.query(tickers=[ticker_symbol], limit=10)
     except:
         insider = pd.DataFrame()
 
@@ -55,9 +54,8 @@ def analyze_smart_money(ticker_symbol):
     # 4. 스마트 머니 점수 계산 (알고리즘)
     # 로직: 가격은 횡보/하락인데 거래량(OBV)이 늘거나, MFI(자금흐름)가 높으면 매집
     
-    # OBV 계산
-    hist['OBV'] = (pd.Series(1, index=hist.index).where(hist['Close'] > hist['Close'].shift(1), -1)
-                   .where(hist['Close'] != hist['Close'].shift(1), 0) * hist['Volume']).cumsum()
+    # OBV / A/D / MFI / CMF를 여러 기간(14·20·60일)에 대해 한 번에 계산
+    hist = add_money_flow(hist)
     
     # 최근 20일 기준 분석
     recent = hist.tail(20)
@@ -77,6 +75,23 @@ def analyze_smart_money(ticker_symbol):
     if vol_ratio > 1.5:
         score += 20
         reason.append("🔥 평소 대비 거래량 1.5배 급증 (손바뀜)")
+
+    # 시나리오 3: MFI 과매도인데 CMF(20일)는 순유입 -> 바닥 매집
+    last = hist.iloc[-1]
+    mfi, cmf_short, cmf_long = last['MFI_14'], last['CMF_20'], last['CMF_60']
+    if mfi < 20 and cmf_short > 0:
+        score += 20
+        reason.append("🧲 MFI 과매도 구간에서 자금 순유입 (바닥 매집)")
+    # 시나리오 4: 단기·중기 CMF가 모두 플러스 -> 꾸준한 유입
+    if cmf_short > 0.1 and cmf_long > 0:
+        score += 10
+        reason.append("💧 20일·60일 CMF 동반 순유입")
+    # 시나리오 5: MFI 과열 + CMF 순유출 -> 분산(물량 넘기기) 의심
+    if mfi > 80 and cmf_short < 0:
+        score -= 20
+        reason.append("⚠️ MFI 과열 중 자금 이탈 (분산 의심)")
+
+    score = max(0, min(100, score))
         
     return {
         "hist": hist,
@@ -85,7 +100,8 @@ def analyze_smart_money(ticker_symbol):
         "score": score,
         "reasons": reason,
         "price_change": price_change,
-        "last_price": recent['Close'].iloc[-1]
+        "last_price": recent['Close'].iloc[-1],
+        "flow": {k: last[k] for k in hist.columns if k.startswith(("MFI_", "CMF_"))}
     }, None
 
 # ------------------------------------------------------------------
@@ -169,12 +185,13 @@ if 'analyze' in st.session_state:
         if not insider_df.empty:
             # 보기 좋게 컬럼 정리
             st.dataframe(
-                insider_df[['Shares', 'Value', 'Text', 'Start Date']].style.highlight_max(axis=0),
-                use_container_width=True
+                insider_df[['start_date', 'insider', 'tx_type', 'shares', 'value', 'text']]
+                    .style.highlight_max(axis=0, subset=['shares', 'value']),
+                use_container_width=True, hide_index=True
             )
             st.caption("최근 내부자가 주식을 팔았다면 'Sale', 샀다면 'Purchase'로 표시됩니다.")
         else:
-            st.info("최근 6개월간 보고된 내부자 거래가 없습니다.")
+            st.info("저장된 내부자 거래가 없습니다.")
 
         st.divider()
 
@@ -208,8 +225,59 @@ if 'analyze' in st.session_state:
         )
         st.plotly_chart(fig2, use_container_width=True)
 
+        # [섹션 5] MFI / CMF (기간별 자금 흐름)
+        st.subheader("💸 기간별 자금 흐름 (MFI · CMF)")
+        st.caption("MFI 20 이하는 과매도, 80 이상은 과열. CMF가 0보다 크면 종가가 고가 쪽에서 끝나는 '매집' 구간입니다.")
+
+        f_cols = st.columns(len(DEFAULT_WINDOWS))
+        for f_col, w in zip(f_cols, DEFAULT_WINDOWS):
+            f_col.metric(f"{w}일 MFI", f"{data['flow'][f'MFI_{w}']:.0f}", f"CMF {data['flow'][f'CMF_{w}']:+.3f}", delta_color="normal")
+
+        fig3 = go.Figure()
+        fig3.add_trace(go.Scatter(x=hist_df.index, y=hist_df['MFI_14'], name='MFI(14)', line=dict(color='#1f77b4', width=2)))
+        fig3.add_trace(go.Bar(x=hist_df.index, y=hist_df['CMF_20'], name='CMF(20)', marker_color='#2ca02c', yaxis='y2', opacity=0.5))
+        fig3.add_hline(y=80, line_dash="dot", line_color="red")
+        fig3.add_hline(y=20, line_dash="dot", line_color="green")
+        fig3.update_layout(
+            height=350,
+            yaxis=dict(title="MFI", range=[0, 100]),
+            yaxis2=dict(title="CMF", overlaying='y', side='right'),
+            margin=dict(t=30, b=0, l=0, r=0),
+            legend=dict(x=0, y=1.2, orientation="h")
+        )
+        st.plotly_chart(fig3, use_container_width=True)
+
+# ------------------------------------------------------------------
+# [보너스 1] 관심 종목 내부자 거래 레이더 (로컬 저장소 조회)
+# ------------------------------------------------------------------
+st.divider()
+st.subheader("📡 관심 종목 내부자 거래 레이더")
+st.caption("관심 종목 전체의 내부자 거래를 모아두고, '이번 달 누가 샀나?'를 바로 조회합니다.")
+
+watch_text = st.text_input("관심 종목 (쉼표 구분)", value="TSLA, NVDA, AAPL, MSFT, AMD, PLTR, SOFI, IONQ")
+watchlist = [t.strip().upper() for t in watch_text.split(",") if t.strip()]
+
+r_col1, r_col2, r_col3 = st.columns([1, 1, 1])
+since = r_col1.date_input("시작일", insider_store.month_start())
+tx_type = r_col2.selectbox("거래 유형", ["Purchase", "Sale", "Award", "Gift", "Other", "전체"])
+with r_col3:
+    st.write("")
+    if st.button("내부자 거래 갱신 🔄"):
+        bar = st.progress(0)
+        stats = insider_store.refresh(
+            watchlist, on_progress=lambda i, n, t: bar.progress(i / n, text=f"{t} 수집 완료")
+        )
+        st.toast(f"{stats['fetched']}개 종목 갱신, 새 거래 {stats['inserted']}건")
+
+radar = insider_store.query(tickers=watchlist, since=since, tx_type=None if tx_type == "전체" else tx_type)
+if not radar.empty:
+    st.dataframe(radar, use_container_width=True, hide_index=True)
+    st.caption(f"{radar['ticker'].nunique()}개 종목 · {len(radar)}건")
+else:
+    st.info("조건에 맞는 거래가 없습니다. (처음이라면 '갱신'을 눌러 데이터를 모아주세요)")
+
 # ------------------------------------------------------------------
-# [보너스] 횡보 중 매집 종목 자동 탐색 (예시 리스트)
+# [보너스 2] 횡보 중 매집 종목 자동 탐색 (예시 리스트)
 # ------------------------------------------------------------------
 st.divider()
 st.subheader("🕵️‍♂️ '횡보 중 매집' 의심 종목 (Beta)")
@@ -229,6 +297,8 @@ if st.button("스캔 시작 (주요 빅테크 대상)"):
                     "종목": t, 
                     "점수": d['score'], 
                     "현재가": f"${d['last_price']:.2f}",
+                    "MFI(14)": round(d['flow']['MFI_14'], 1),
+                    "CMF(20)": round(d['flow']['CMF_20'], 3),
                     "이유": ", ".join(d['reasons']) if d['reasons'] else "수급 양호"
                 })
         except:
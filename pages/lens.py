@@ -1,6 +1,8 @@
 import streamlit as st
 import google.generativeai as genai
-from PIL import Image
+import time
+
+from core import images
 
 st.set_page_config(page_title="닥터의 만물 도감", page_icon="🔍", layout="centered")
 
@@ -15,14 +17,18 @@ st.caption("꽃, 와인 라벨, 처음 보는 물건... 사진을 찍어 올리
 img_file = st.file_uploader("사진 찍기/올리기", type=["jpg", "png", "jpeg"])
 
 if img_file:
-    image = Image.open(img_file)
-    st.image(image, caption="분석할 사진", use_container_width=True)
+    # 회전 보정 + 모델 해상도로 축소 + JPEG 재압축 (같은 사진은 저장된 처리본 사용)
+    prepared = images.prepare(img_file, "photo")
+    st.image(prepared["data"], caption="분석할 사진", use_container_width=True)
+    st.caption(f"📦 {images.report(prepared)}")
     
     if st.button("이게 뭐야? 🤔"):
         with st.spinner("AI가 눈을 크게 뜨고 보는 중..."):
             try:
                 # 이미지와 프롬프트를 함께 보냄
-                response = model.generate_content(["이 사진 속 물체가 뭔지 백과사전처럼 설명해줘. 이름, 특징, 유래나 재미있는 사실 포함.", image])
+                started = time.perf_counter()
+                response = model.generate_content(["이 사진 속 물체가 뭔지 백과사전처럼 설명해줘. 이름, 특징, 유래나 재미있는 사실 포함.", images.part(prepared)])
                 st.markdown(response.text)
+                st.caption(f"⏱️ AI 응답 {time.perf_counter() - started:.1f}초")
             except Exception as e:
                 st.error(f"분석 오류: {e}")
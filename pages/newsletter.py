@@ -1,102 +1,45 @@
+import time
 import streamlit as st
-import requests
-from bs4 import BeautifulSoup
-from datetime import datetime
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from core import opinion_archive, scheduler
 
 # --------------------------------------------------------------------------
 # 1. 설정 및 상수 정의
 # --------------------------------------------------------------------------
 st.set_page_config(layout="wide", page_title="오늘의 오피니언", page_icon="📰")
 
-# 네이버 뉴스 '리스트 페이지' 접근을 위한 상수
-PRESS_MAP = {
-    '조선일보': '023',
-    '중앙일보': '025',
-    '한국일보': '469'
-}
+# 네이버 뉴스 '리스트 페이지' 접근을 위한 상수 (아침 예열 작업과 공유)
+PRESS_MAP = opinion_archive.PRESSES
 
-HEADERS = {
-    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8'
-}
+# 신문사별 제한 시간(초, 수집 전체 기준). 없으면 기본값 사용 -> 느린 사이트 하나가 나머지를 붙잡지 않음
+DEFAULT_TIMEOUT = 8
+PRESS_TIMEOUTS = {}
+COLUMNS_PER_ROW = 3
 
 # --------------------------------------------------------------------------
-# 2. 날짜 및 파싱 헬퍼 함수
+# 2. 수집 함수 (증분 크롤러 -> 로컬 보관함)
 # --------------------------------------------------------------------------
 
-def is_today(date_text):
-    if not date_text: return False
-    date_text = date_text.strip()
-    
-    if '전' in date_text: # 1시간전, 50분전 등
-        return True
-        
-    today_str = datetime.now().strftime('%Y.%m.%d')
-    if today_str in date_text:
-        return True
-        
-    # 날짜 없이 시간만 있는 경우 (오전 10:30 등)도 오늘로 간주
-    if ':' in date_text and '.' not in date_text: 
-        return True
-        
-    return False
-
-def fetch_opinion_list(press_name, press_code):
-    url = f"https://news.naver.com/main/list.naver?mode=LPOD&mid=sec&oid={press_code}&sid1=110"
-    
-    debug_info = {
-        "url": url,
-        "status": None,
-        "error": None,
-        "html_preview": ""
-    }
-    
-    news_items = []
-    
-    try:
-        response = requests.get(url, headers=HEADERS, timeout=10)
-        debug_info["status"] = response.status_code
-        
-        if response.status_code != 200:
-            debug_info["error"] = f"Status Code: {response.status_code}"
-            return [], debug_info
-
-        soup = BeautifulSoup(response.content, 'html.parser')
-        debug_info["html_preview"] = soup.prettify()[:1000]
-
-        groups = soup.select('ul.type06_headline') + soup.select('ul.type06')
-        
-        for group in groups:
-            items = group.select('li')
-            for item in items:
-                try:
-                    dts = item.select('dt')
-                    if not dts: continue
-                    
-                    title_tag = dts[-1].select_one('a')
-                    title = title_tag.get_text(strip=True)
-                    link = title_tag['href']
-                    
-                    dd = item.select_one('dd')
-                    if dd:
-                        date_tag = dd.select_one('span.date')
-                        if date_tag:
-                            date_text = date_tag.get_text(strip=True)
-                            
-                            if is_today(date_text):
-                                news_items.append({
-                                    'title': title,
-                                    'link': link,
-                                    'date': date_text
-                                })
-                except:
-                    continue
-
-    except Exception as e:
-        debug_info["error"] = str(e)
-        return [], debug_info
-
-    return news_items, debug_info
+def to_items(df):
+    return [{'title': r.title, 'link': r.link, 'date': r.date_text or (r.published or '')[:16]} for r in df.itertuples()]
+
+def fetch_opinion_list(press_name, press_code, timeout=DEFAULT_TIMEOUT, debug=False, force=False):
+    """새 기사만 보관함에 추가한 뒤, 오늘 기사는 보관함에서 읽어옵니다.
+    오늘 기사가 이미 보관함에 있으면(아침 예열 등) 바로 보여주고 수집은 뒤에서 진행합니다."""
+    if not force and not debug:
+        today = opinion_archive.query(presses=[press_name], start=datetime.now().date())
+        if not today.empty:
+            scheduler.run_async(f"opinion:{press_name}", opinion_archive.crawl_press, press_name, press_code, timeout=timeout)
+            return to_items(today), {}
+
+    debug_info = opinion_archive.crawl_press(
+        press_name, press_code, timeout=timeout, debug=debug,
+        min_interval=0 if force else opinion_archive.MIN_INTERVAL
+    )
+    today = opinion_archive.query(presses=[press_name], start=datetime.now().date())
+    return to_items(today), debug_info
 
 # --------------------------------------------------------------------------
 # 3. UI 구성 (디자인 자동 적응형으로 수정)
@@ -127,48 +70,104 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-st.title("🗞️ 오늘의 오피니언")
-st.caption(f"기준: {datetime.now().strftime('%Y-%m-%d')} | 실시간 업데이트")
-
 with st.sidebar:
     st.header("설정")
-    if st.button("새로고침", use_container_width=True):
+    view_mode = st.radio("보기", ["오늘", "기간 검색 (보관함)"])
+    if view_mode == "오늘" and st.button("새로고침", use_container_width=True):
+        st.session_state.force_crawl = True
         st.rerun()
     st.markdown("---")
     show_debug = st.checkbox("디버깅 모드", value=False)
 
-col1, col2, col3 = st.columns(3)
-cols = [col1, col2, col3]
-
-with st.spinner('헤드라인을 가져오는 중...'):
-    for i, (name, code) in enumerate(PRESS_MAP.items()):
-        with cols[i]:
+force_crawl = st.session_state.pop("force_crawl", False)
+
+if view_mode == "오늘":
+    st.title("🗞️ 오늘의 오피니언")
+    st.caption(f"기준: {datetime.now().strftime('%Y-%m-%d')} | 실시간 업데이트")
+else:
+    st.title("🗄️ 오피니언 보관함")
+    d_col1, d_col2 = st.columns(2)
+    start_date = d_col1.date_input("시작일", datetime.now().date() - timedelta(days=7))
+    end_date = d_col2.date_input("종료일", datetime.now().date())
+    st.caption("네트워크 요청 없이 로컬 보관함에서만 조회합니다.")
+
+def render_press(name, items, debug):
+    """신문사 한 곳의 헤드라인 목록을 현재 컨테이너에 그립니다."""
+    if items:
+        for item in items:
+            # [수정됨] 하드코딩된 색상을 제거하고 CSS 클래스(headline-link)를 사용
+            st.markdown(f"""
+            <div style="padding: 12px 0; border-bottom: 1px solid #777;">
+                <a href="{item['link']}" target="_blank" class="headline-link">
+                    {item['title']}
+                </a>
+                <div style="
+                    font-size: 13px; 
+                    color: #999; 
+                    font-weight: 400;
+                ">
+                    🕒 {item['date']}
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+    elif debug.get("error"):
+        st.warning(f"불러오지 못했습니다. ({debug['error']})")
+    else:
+        st.info("오늘의 기사가 없습니다." if view_mode == "오늘" else "해당 기간의 기사가 없습니다.")
+
+    if show_debug and debug.get("url"):
+        with st.expander(f"데이터 확인"):
+            st.write(f"URL: {debug['url']} | 새 기사 {debug['new']}건 · {debug['pages']}페이지 · 생략: {debug['skipped']}")
+            st.text_area("HTML", debug['html_preview'], height=200, key=f"debug_{name}")
+
+# 신문사 수만큼 칸을 만들고(한 줄에 3개), 제목 아래에 '결과 자리'를 미리 잡아둠
+slots = {}
+press_items = list(PRESS_MAP.items())
+for row_start in range(0, len(press_items), COLUMNS_PER_ROW):
+    row = press_items[row_start:row_start + COLUMNS_PER_ROW]
+    for col, (name, _) in zip(st.columns(COLUMNS_PER_ROW), row):
+        with col:
             # 신문사 이름 스타일링
             st.markdown(f"<h3 style='border-bottom: 2px solid var(--text-color); padding-bottom: 10px; margin-bottom: 20px;'>{name}</h3>", unsafe_allow_html=True)
-            
-            items, debug = fetch_opinion_list(name, code)
-            
-            if items:
-                for item in items:
-                    # [수정됨] 하드코딩된 색상을 제거하고 CSS 클래스(headline-link)를 사용
-                    st.markdown(f"""
-                    <div style="padding: 12px 0; border-bottom: 1px solid #777;">
-                        <a href="{item['link']}" target="_blank" class="headline-link">
-                            {item['title']}
-                        </a>
-                        <div style="
-                            font-size: 13px; 
-                            color: #999; 
-                            font-weight: 400;
-                        ">
-                            🕒 {item['date']}
-                        </div>
-                    </div>
-                    """, unsafe_allow_html=True)
-            else:
-                st.info("오늘의 기사가 없습니다.")
-                
-            if show_debug:
-                with st.expander(f"데이터 확인"):
-                    st.write(f"URL: {debug['url']}")
-                    st.text_area("HTML", debug['html_preview'], height=200, key=f"debug_{name}")
\ No newline at end of file
+            slots[name] = st.empty()
+            slots[name].caption("⏳ 불러오는 중...")
+
+# 보관함 모드: 로컬 DB만 읽고 끝
+if view_mode != "오늘":
+    archive = opinion_archive.query(presses=list(PRESS_MAP), start=start_date, end=end_date)
+    for name in PRESS_MAP:
+        with slots[name].container():
+            render_press(name, to_items(archive[archive['press'] == name]), {})
+    st.stop()
+
+# 모든 신문사를 동시에 요청하고, 먼저 도착한 곳부터 바로 채움
+timeouts = {name: PRESS_TIMEOUTS.get(name, DEFAULT_TIMEOUT) for name in PRESS_MAP}
+pool = ThreadPoolExecutor(max_workers=len(PRESS_MAP))
+started = time.monotonic()
+futures = {pool.submit(fetch_opinion_list, name, code, timeouts[name], show_debug, force_crawl): name for name, code in PRESS_MAP.items()}
+# requests의 timeout은 소켓 읽기 한 번만 제한하므로, 신문사마다 '시작 + 제한 시간' 마감을 따로 둠
+deadlines = {fut: started + timeouts[name] for fut, name in futures.items()}
+pending = set(futures)
+try:
+    while pending:
+        now = time.monotonic()
+        for fut in [f for f in pending if not f.done() and deadlines[f] <= now]:
+            # 자기 마감을 넘긴 곳만 '지연' 표시 (다른 신문사는 계속 기다림)
+            pending.discard(fut)
+            slots[futures[fut]].warning("응답이 늦어 건너뛰었습니다. 새로고침 해주세요.")
+        if not pending:
+            break
+        done, _ = wait(pending, timeout=max(0.0, min(deadlines[f] for f in pending) - now), return_when=FIRST_COMPLETED)
+        for fut in done:
+            pending.discard(fut)
+            name = futures[fut]
+            try:
+                items, debug = fut.result()
+            except Exception as e:
+                slots[name].error(f"{name} 수집 실패: {e}")
+                continue
+            with slots[name].container():
+                render_press(name, items, debug)
+finally:
+    # 늦은 요청을 기다리지 않고 화면 렌더링을 끝냄
+    pool.shutdown(wait=False, cancel_futures=True)
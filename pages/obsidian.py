@@ -1,7 +1,8 @@
 import streamlit as st
 import google.generativeai as genai
-import requests
-from bs4 import BeautifulSoup
+
+from core import search_index
+from core.article import get_article
 
 st.set_page_config(page_title="지식 수집기", page_icon="🧠", layout="centered")
 
@@ -12,12 +13,8 @@ model = genai.GenerativeModel('gemini-flash-latest')
 # 간단한 텍스트 추출기
 def get_text_from_url(url):
     try:
-        headers = {'User-Agent': 'Mozilla/5.0'}
-        res = requests.get(url, headers=headers, timeout=5)
-        soup = BeautifulSoup(res.text, 'html.parser')
-        # 스크립트 제거
-        for s in soup(['script', 'style']): s.decompose()
-        return soup.get_text()[:10000] # 너무 길면 자름
+        # 메뉴/광고/댓글을 뺀 본문만 (URL 단위 캐시 -> 같은 링크는 재다운로드 없음)
+        return get_article(url, timeout=5)["text"][:10000] # 너무 길면 자름
     except Exception as e:
         return f"오류: {e}"
 
@@ -51,6 +48,9 @@ if st.button("변환 시작 ⚡"):
             출처: {url}
             """
             result = model.generate_content(prompt).text
+            # 통합 검색 색인 (노트 제목 = 첫 번째 '# ' 줄)
+            title = next((line.lstrip("# ").strip() for line in result.splitlines() if line.startswith("# ")), url)
+            search_index.add("note", url, title, result, url=url)
             st.markdown(result)
             st.code(result, language="markdown") # 복사하기 좋게 코드 블록 제공
             st.caption("👆 위 코드를 복사해서 옵시디언에 붙여넣으세요.")
@@ -1,8 +1,8 @@
 import streamlit as st
 import google.generativeai as genai
-from pypdf import PdfReader
-import requests
-import io
+import time
+
+from core import http_client, pdf_store, pdf_text, search_index
 
 # ------------------------------------------------------------------
 # [1] 설정
@@ -14,44 +14,126 @@ if "GEMINI_API_KEY" in st.secrets:
 
 model = genai.GenerativeModel('gemini-flash-latest')
 
+MAX_DOWNLOAD_MB = 100     # 링크로 받을 수 있는 PDF 최대 크기
+DOWNLOAD_DEADLINE = 90    # 다운로드 전체 제한 시간(초)
+
+# 요약 방식별 읽을 분량(추정 토큰). 예산이 차면 나머지 페이지는 파싱하지 않음
+STRATEGIES = {
+    "빠른 요약 (~1만 토큰)": 10_000,
+    "표준 요약 (~3만 토큰)": 30_000,
+    "전체 정독 (모든 페이지)": None,
+}
+FULL_READ_CAP = 500_000   # 전체 정독이라도 프롬프트에 넣는 최대 토큰
+
 # ------------------------------------------------------------------
 # [2] 기능 함수
 # ------------------------------------------------------------------
-def extract_text_from_pdf(file_obj):
-    """업로드된 PDF 파일에서 텍스트 추출"""
+def extract_all_pages(file_obj, sha):
+    """
+    전체 페이지 추출 (페이지 범위를 여러 프로세스가 나눠 읽고, 진행률 표시)
+    같은 파일(SHA-256)은 저장된 페이지 텍스트를 그대로 사용.
+    """
+    cached = pdf_store.load_pages(sha)
+    if cached is not None:
+        st.caption(f"⚡ 이전에 읽은 문서입니다 ({len(cached)}쪽, 저장된 텍스트 사용)")
+        return cached
+
+    progress = st.progress(0.0, text="페이지 읽는 중...")
+    started = time.time()
+
+    def on_progress(done, total):
+        progress.progress(done / total, text=f"페이지 읽는 중... {done}/{total}쪽")
+
     try:
-        reader = PdfReader(file_obj)
-        text = ""
-        for page in reader.pages:
-            text += page.extract_text() + "\n"
-        return text
-    except Exception as e:
+        pages = pdf_text.extract_pages(file_obj, on_progress=on_progress)
+    finally:
+        progress.empty()
+    if pages:
+        st.caption(f"📄 {len(pages)}쪽 · {len(pages) / max(time.time() - started, 1e-6):,.0f}쪽/초")
+    pdf_store.save_pages(sha, pages)
+    return pages
+
+def select_pages(total, chapters, page_spec, chosen_chapters):
+    """선택한 장(목차) 또는 쪽 범위 -> 0부터 시작하는 쪽 번호 목록"""
+    if chosen_chapters:
+        picked = set()
+        for ch in chapters:
+            if ch["title"] in chosen_chapters:
+                picked.update(range(ch["start"], ch["end"]))
+        return sorted(picked)
+    return pdf_text.parse_page_ranges(page_spec, total)
+
+def extract_text_from_pdf(file_obj, sha, strategy, page_spec="", chosen_chapters=(), use_toc=True):
+    """
+    요약 방식의 토큰 예산만큼만 페이지를 읽어 텍스트를 만듭니다.
+    목차가 있으면 각 장의 도입부를 먼저 읽어, 예산이 일찍 차도 문서 전체를 고르게 담습니다.
+    """
+    budget = STRATEGIES[strategy]
+    chapters = pdf_text.outline(file_obj)
+    cached = pdf_store.load_pages(sha)
+    total = len(cached) if cached is not None else pdf_text.page_count(file_obj)
+    selected = select_pages(total, chapters, page_spec, chosen_chapters)
+    if not selected:
         return None
 
-def extract_text_from_url(url):
-    """웹 링크(URL)에서 PDF 다운로드 후 텍스트 추출"""
+    if budget is None and cached is None and len(selected) == total:
+        # 전체 정독: 병렬로 한 번에 읽고 저장 (다음부터는 저장본 사용)
+        cached = extract_all_pages(file_obj, sha)
+
+    order = pdf_text.read_order(selected, chapters if use_toc else None)
+    if cached is not None:
+        pairs = ((i, cached[i]) for i in order)
+    else:
+        pairs = pdf_text.iter_pages(file_obj, order)  # 필요한 페이지만 그때그때 파싱
+
+    progress = st.progress(0.0, text="페이지 읽는 중...")
+    limit = budget or FULL_READ_CAP
+
+    def on_progress(n_pages, used):
+        progress.progress(min(used / limit, 1.0), text=f"페이지 읽는 중... {n_pages}쪽 · 약 {used:,}토큰")
+
     try:
-        headers = {'User-Agent': 'Mozilla/5.0'} # 로봇 아님을 증명
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        
-        f = io.BytesIO(response.content)
-        return extract_text_from_pdf(f)
-    except Exception as e:
-        st.error(f"링크 오류: {e}")
+        picked, used, stopped = pdf_text.take_budget(pairs, limit, pdf_store.estimate_tokens, on_progress)
+    finally:
+        progress.empty()
+
+    note = " · 예산이 차서 나머지는 건너뜀" if stopped else ""
+    st.caption(f"📄 {len(picked)}/{len(selected)}쪽 사용 · 약 {used:,}토큰{note}")
+    if not picked:
         return None
+    return "\n".join(f"[p.{i + 1}]\n{text}" for i, text in picked)
 
-def summarize_pdf(text):
-    """AI에게 요약 요청"""
-    # 텍스트가 너무 길면(토큰 제한) 앞부분 30,000자만 자름 (Gemini Flash는 넉넉하긴 함)
-    truncated_text = text[:50000]
-    
+def download_pdf(url):
+    """조각 단위로 받아 크면 임시 파일에 기록 (용량 제한 + 전체 제한 시간)"""
+    headers = {'User-Agent': 'Mozilla/5.0'} # 로봇 아님을 증명
+    progress = st.progress(0.0, text="다운로드 중...")
+
+    def on_progress(received, total):
+        if total:
+            progress.progress(min(received / total, 1.0), text=f"다운로드 중... {received / 1e6:.1f} / {total / 1e6:.1f}MB")
+        else:
+            progress.progress(0.0, text=f"다운로드 중... {received / 1e6:.1f}MB")
+
+    try:
+        return http_client.download(url, headers=headers, max_bytes=MAX_DOWNLOAD_MB * 1024 * 1024,
+                                    deadline=DOWNLOAD_DEADLINE, on_progress=on_progress)
+    finally:
+        progress.empty()
+
+def summarize_pdf(text, sha=None, variant="default"):
+    """AI에게 요약 요청 (같은 문서·같은 설정은 저장된 요약 재사용)"""
+    if sha:
+        cached = pdf_store.get_summary(sha, variant)
+        if cached:
+            return cached
+
+    # 분량은 요약 방식의 토큰 예산으로 이미 맞춰져 있음 ([p.N]은 원문 쪽 번호)
     prompt = f"""
     당신은 전문적인 '연구 보조원'이자 '비즈니스 분석가'입니다.
     아래 PDF 텍스트를 읽고 완벽하게 요약 보고서를 작성하세요.
     
     [PDF 내용]
-    {truncated_text}
+    {text}
     
     [요청사항]
     1. **한 줄 요약**: 문서의 핵심 주제를 한 문장으로 정의.
@@ -62,9 +144,31 @@ def summarize_pdf(text):
     톤앤매너: 전문적이고 명료하게. 한국어로 작성.
     """
     try:
-        return model.generate_content(prompt).text
+        summary = model.generate_content(prompt).text
     except Exception as e:
         return f"AI 분석 실패: {e}"
+    if sha:
+        pdf_store.save_summary(sha, summary, variant)
+    return summary
+
+def analyze(file_obj, sha, variant, title, url=None, **read_options):
+    """저장된 요약이 있으면 바로, 없으면 예산만큼 읽고 요약. 반환: 요약 또는 None(텍스트 없음)"""
+    cached = pdf_store.get_summary(sha, variant)
+    if cached:
+        st.caption("⚡ 같은 문서·같은 설정으로 만든 요약을 불러왔습니다.")
+        return cached
+    raw_text = extract_text_from_pdf(file_obj, sha, **read_options)
+    if not raw_text:
+        return None
+    st.success(f"텍스트 추출 완료! ({len(raw_text)}자)")
+    summary = summarize_pdf(raw_text, sha, variant)
+    if not summary.startswith("AI 분석 실패"):
+        # 통합 검색 색인 (요약 + 읽은 원문)
+        search_index.add("pdf", sha, title, f"{summary}\n\n{raw_text}", url=url)
+    return summary
+
+def variant_of(strategy, page_spec, chosen_chapters, use_toc):
+    return "|".join([strategy, page_spec.strip() or "전체", ",".join(chosen_chapters), "toc" if use_toc else "seq"])
 
 # ------------------------------------------------------------------
 # [3] 메인 화면
@@ -72,22 +176,46 @@ def summarize_pdf(text):
 st.title("📑 문서(PDF) 3초 요약기")
 st.caption("논문, 보고서, 계약서 등 긴 문서를 AI가 대신 읽어드립니다.")
 
+with st.expander("⚙️ 읽기 설정", expanded=False):
+    strategy = st.radio("요약 방식", list(STRATEGIES), index=1, horizontal=True)
+    page_spec = st.text_input("쪽 범위 (비우면 전체)", placeholder="예: 1-20, 35, 40-")
+    use_toc = st.checkbox("목차가 있으면 각 장의 앞부분부터 읽기", value=True)
+
 tab1, tab2 = st.tabs(["📂 파일 업로드", "🔗 PDF 링크"])
 
 # [탭 1] 파일 업로드 방식
 with tab1:
     uploaded_file = st.file_uploader("PDF 파일을 드래그하거나 선택하세요", type="pdf")
+    chosen_chapters = []
+    if uploaded_file:
+        try:
+            chapters = pdf_text.outline(uploaded_file)
+        except Exception:
+            chapters = []
+        if chapters:
+            chosen_chapters = st.multiselect(
+                "읽을 장 선택 (비우면 쪽 범위 설정을 따름)",
+                [ch["title"] for ch in chapters],
+                format_func=lambda t: next(f"{t} (p.{c['start'] + 1}-{c['end']})" for c in chapters if c["title"] == t),
+            )
     
     if st.button("파일 분석 시작 🚀", key="btn_file"):
         if uploaded_file:
             with st.spinner("PDF를 읽고 내용을 파악 중입니다..."):
-                raw_text = extract_text_from_pdf(uploaded_file)
-                if raw_text:
-                    st.success(f"텍스트 추출 완료! ({len(raw_text)}자)")
-                    result = summarize_pdf(raw_text)
+                error = None
+                try:
+                    sha = pdf_store.sha256_of(uploaded_file)
+                    result = analyze(uploaded_file, sha, variant_of(strategy, page_spec, chosen_chapters, use_toc),
+                                     uploaded_file.name, strategy=strategy, page_spec=page_spec, chosen_chapters=chosen_chapters, use_toc=use_toc)
+                except Exception as e:
+                    result, error = None, e
+                if result:
                     st.markdown("### 📝 AI 요약 보고서")
                     st.markdown(result)
+                elif error is not None:
+                    st.error(f"파일 오류: {error}")
                 else:
+                    # 추출은 성공했는데 글자가 없을 때만
                     st.error("텍스트를 추출할 수 없는 PDF입니다. (이미지 스캔본 등)")
         else:
             st.warning("파일을 먼저 업로드해주세요.")
@@ -100,14 +228,26 @@ with tab2:
     if st.button("링크 분석 시작 🚀", key="btn_url"):
         if url_input:
             with st.spinner("문서를 다운로드하고 분석 중입니다..."):
-                raw_text = extract_text_from_url(url_input)
-                if raw_text:
-                    st.success(f"다운로드 및 텍스트 추출 완료! ({len(raw_text)}자)")
-                    result = summarize_pdf(raw_text)
+                variant = variant_of(strategy, page_spec, [], use_toc)
+                # 최근에 받은 링크면 다운로드 없이 같은 파일의 저장된 요약 사용
+                known = pdf_store.sha_for_url(url_input)
+                result = pdf_store.get_summary(known, variant) if known else None
+                try:
+                    if result is None:
+                        with download_pdf(url_input) as f:
+                            sha = pdf_store.sha256_of(f)
+                            pdf_store.remember_url(url_input, sha)
+                            result = analyze(f, sha, variant, url_input.rsplit("/", 1)[-1] or url_input, url=url_input,
+                                             strategy=strategy, page_spec=page_spec, use_toc=use_toc)
+                    else:
+                        st.caption("⚡ 이전에 받은 문서입니다 (저장된 요약 사용)")
+                except Exception as e:
+                    st.error(f"링크 오류: {e}")
+                    result = None
+                if result:
                     st.markdown("### 📝 AI 요약 보고서")
                     st.markdown(result)
                 else:
                     st.error("해당 링크에서 PDF를 읽을 수 없습니다.")
         else:
             st.warning("주소를 입력해주세요.")
-
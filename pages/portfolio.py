@@ -0,0 +1,141 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import plotly.express as px
+
+from core.market_data import INDICES, trading_day, download_close
+from core import risk
+
+# ------------------------------------------------------------------
+# [1] 페이지 설정
+# ------------------------------------------------------------------
+st.set_page_config(page_title="포트폴리오 리스크 엔진", page_icon="🛡️", layout="wide")
+
+st.title("🛡️ 포트폴리오 리스크 엔진")
+st.caption("종목 하나가 아니라, 내 계좌 전체가 함께 흔들릴 때 얼마나 잃을 수 있는지 계산합니다.")
+
+DEFAULT_WATCHLIST = "TSLA, 10\nNVDA, 15\nAAPL, 20\nGOOGL, 12\nSCHD, 50"
+
+# ------------------------------------------------------------------
+# [2] 데이터 수집 (거래일 단위 캐시)
+# ------------------------------------------------------------------
+def parse_holdings(text):
+    """'티커, 수량' 형식의 여러 줄 입력을 {티커: 수량}으로 변환"""
+    holdings = {}
+    for line in text.splitlines():
+        parts = [p.strip() for p in line.replace('\t', ',').split(',') if p.strip()]
+        if not parts:
+            continue
+        try:
+            qty = float(parts[1]) if len(parts) > 1 else 1.0
+        except ValueError:
+            continue
+        ticker = parts[0].upper()
+        holdings[ticker] = holdings.get(ticker, 0) + qty
+    return holdings
+
+@st.cache_data(ttl=3600*24)
+def load_prices(tickers, day):
+    """보유 종목 + 지수 팩터 1년치 종가 (day 인자가 바뀔 때만 새로 받음)"""
+    close = download_close(list(tickers) + list(INDICES.keys()), period="1y")
+    assets = close[[t for t in tickers if t in close.columns]]
+    factors = close[[f for f in INDICES if f in close.columns]]
+    return assets, factors
+
+@st.cache_data(ttl=3600*24)
+def run_risk(holdings_items, day, confidence, horizon):
+    """동일 거래일·동일 포트폴리오 재계산은 캐시에서 바로 반환"""
+    holdings = dict(holdings_items)
+    assets, factors = load_prices(tuple(sorted(holdings)), day)
+    return risk.compute_portfolio_risk(assets, holdings, factors, confidence, horizon)
+
+# ------------------------------------------------------------------
+# [3] 화면 구성
+# ------------------------------------------------------------------
+with st.sidebar:
+    st.header("📋 보유 종목")
+    watchlist = st.text_area("티커, 수량 (한 줄에 하나)", DEFAULT_WATCHLIST, height=200)
+    confidence = st.select_slider("신뢰수준", options=[0.90, 0.95, 0.99], value=0.95)
+    horizon = st.number_input("보유 기간 (거래일)", min_value=1, max_value=20, value=1)
+
+holdings = parse_holdings(watchlist)
+day = trading_day()
+
+if not holdings:
+    st.info("왼쪽에 보유 종목을 입력해주세요.")
+    st.stop()
+
+with st.spinner("공분산 행렬과 VaR를 계산 중입니다..."):
+    result = run_risk(tuple(sorted(holdings.items())), day, confidence, int(horizon))
+
+if not result:
+    st.error("가격 데이터가 부족해 리스크를 계산할 수 없습니다. (최소 20거래일 필요)")
+    st.stop()
+
+total = result['total_value']
+excluded = result.get('excluded', [])
+missing = [t for t in holdings if t not in result['tickers'] and t not in excluded]
+if missing:
+    st.warning(f"데이터를 찾지 못해 제외된 종목: {', '.join(missing)}")
+if excluded:
+    st.warning(f"가격 기록이 없거나 너무 짧아 제외된 종목: {', '.join(excluded)}")
+
+# [섹션 1] 핵심 지표
+st.subheader(f"📊 리스크 요약 (기준 거래일: {day})")
+c1, c2, c3, c4 = st.columns(4)
+c1.metric("평가 금액", f"${total:,.0f}")
+c2.metric("연환산 변동성", f"{result['volatility']*100:.1f}%")
+c3.metric(f"VaR {confidence:.0%} (정규)", f"${result['parametric']['var']*total:,.0f}",
+          f"CVaR ${result['parametric']['cvar']*total:,.0f}", delta_color="off")
+c4.metric(f"VaR {confidence:.0%} (과거)", f"${result['historical']['var']*total:,.0f}",
+          f"CVaR ${result['historical']['cvar']*total:,.0f}", delta_color="off")
+st.caption(f"관측 {result['observations']}일 | 공분산 수축 강도 {result['shrinkage']:.2f} (0=표본 그대로, 1=완전 수축)")
+
+st.divider()
+
+# [섹션 2] 비중 vs 위험 기여도
+col_w, col_c = st.columns(2)
+pos_df = pd.DataFrame({
+    "종목": result['tickers'],
+    "평가금액": result['values'],
+    "비중(%)": result['weights'] * 100,
+    "위험기여(%)": result['contributions'] * 100,
+})
+
+with col_w:
+    st.markdown("##### 💼 비중 vs 위험 기여도")
+    st.caption("비중보다 위험기여가 훨씬 크다면, 그 종목이 계좌를 흔드는 주범입니다.")
+    st.dataframe(pos_df.style.format({"평가금액": "${:,.0f}", "비중(%)": "{:.1f}", "위험기여(%)": "{:.1f}"}),
+                 use_container_width=True, hide_index=True)
+
+with col_c:
+    st.markdown("##### 🔗 상관관계 히트맵")
+    vol = np.sqrt(np.diag(result['cov']))
+    corr = result['cov'] / np.outer(vol, vol)
+    fig = px.imshow(corr, x=result['tickers'], y=result['tickers'], color_continuous_scale='RdBu_r',
+                    zmin=-1, zmax=1, text_auto=".2f")
+    fig.update_layout(height=350, margin=dict(t=0, b=0, l=0, r=0))
+    st.plotly_chart(fig, use_container_width=True)
+
+st.divider()
+
+# [섹션 3] What-if 스트레스 시나리오
+st.subheader("🌪️ What-if 스트레스 테스트")
+if result['betas'] is None:
+    st.info("지수 팩터 데이터를 불러오지 못해 스트레스 테스트를 생략합니다.")
+else:
+    st.caption("지수가 아래만큼 움직인다면? (과거 1년 회귀 베타 기반 추정)")
+    factors = result['factors']
+    shock_cols = st.columns(len(factors))
+    shocks = []
+    for col, f in zip(shock_cols, factors):
+        default = 10 if f == "^VIX" else (-5 if f != "KRW=X" else 3)
+        shocks.append(col.number_input(f"{INDICES.get(f, f)} (%)", value=float(default), step=1.0, key=f"shock_{f}") / 100)
+
+    asset_impact, port_impact = risk.stress_test(result['weights'], result['betas'], shocks)
+    st.metric("포트폴리오 예상 손익", f"${port_impact*total:,.0f}", f"{port_impact*100:.2f}%")
+
+    impact_df = pd.DataFrame({"종목": result['tickers'], "예상 변동(%)": asset_impact * 100,
+                              "예상 손익($)": asset_impact * result['values']})
+    st.dataframe(impact_df.style.format({"예상 변동(%)": "{:.2f}", "예상 손익($)": "${:,.0f}"}),
+                 use_container_width=True, hide_index=True)
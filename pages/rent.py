@@ -3,12 +3,14 @@ import pandas as pd
 import gspread
 from oauth2client.service_account import ServiceAccountCredentials
 import google.generativeai as genai
-from PIL import Image
 import datetime
+import time
 import json
 import re
 import ast
 
+from core import images
+
 # ------------------------------------------------------------------
 # [1] 설정 및 연결
 # ------------------------------------------------------------------
@@ -63,8 +65,10 @@ with tab1:
         col_img, col_data = st.columns([1, 2])
         
         with col_img:
-            image = Image.open(img_file)
-            st.image(image, caption="고지서 미리보기", use_container_width=True)
+            # 회전 보정 + 축소 + 흑백·대비 강조 (같은 사진은 저장된 처리본 사용)
+            prepared = images.prepare(img_file, "document")
+            st.image(prepared["data"], caption="고지서 미리보기 (AI에 보내는 이미지)", use_container_width=True)
+            st.caption(f"📦 {images.report(prepared)}")
             
             if st.button("🔍 세부 내역 추출하기", type="primary", use_container_width=True):
                 with st.spinner("AI가 항목별로 금액을 쪼개는 중입니다..."):
@@ -87,7 +91,9 @@ with tab1:
                             {"date": "2026-02-25", "category": "수선적립금", "amount": 20000, "memo": "장기수선충당금"}
                         ]
                         """
-                        response = model.generate_content([prompt, image])
+                        started = time.perf_counter()
+                        response = model.generate_content([prompt, images.part(prepared)])
+                        st.caption(f"⏱️ AI 응답 {time.perf_counter() - started:.1f}초")
                         text = response.text
                         
                         # 대괄호 [ ... ] 영역만 추출
@@ -0,0 +1,46 @@
+import streamlit as st
+import datetime
+import time
+
+from core import search_index
+
+# ------------------------------------------------------------------
+# [1] 설정
+# ------------------------------------------------------------------
+st.set_page_config(page_title="통합 검색", page_icon="🔎", layout="centered")
+
+st.title("🔎 통합 검색")
+counts = search_index.stats()
+st.caption(f"지금까지 정리한 PDF·유튜브·노트·맛집 분석·메모 {sum(counts.values()):,}건을 로컬 색인에서 찾습니다.")
+
+# ------------------------------------------------------------------
+# [2] 검색창
+# ------------------------------------------------------------------
+query = st.text_input("검색어", placeholder="예: 테슬라 배터리, 오사카 라멘")
+kinds = st.multiselect(
+    "종류", list(search_index.KINDS),
+    format_func=lambda k: f"{search_index.KINDS[k]} ({counts.get(k, 0)})",
+)
+
+# ------------------------------------------------------------------
+# [3] 결과
+# ------------------------------------------------------------------
+if query:
+    started = time.perf_counter()
+    results = search_index.search(query, kinds=kinds, limit=50)
+    elapsed = (time.perf_counter() - started) * 1000
+    st.caption(f"{len(results)}건 · {elapsed:.1f}ms")
+
+    if any(len(t) < 2 for t in query.split()):
+        st.caption("💡 한 글자 단어는 색인 대신 본문 포함 여부로 찾아 조금 느릴 수 있습니다.")
+
+    for r in results:
+        with st.container(border=True):
+            title = f"[{r['title']}]({r['url']})" if r['url'] else r['title']
+            st.markdown(f"**{title}**")
+            st.markdown(r['snippet'])
+            date = datetime.datetime.fromtimestamp(r['created_at']).strftime("%Y-%m-%d")
+            st.caption(f"{search_index.KINDS.get(r['kind'], r['kind'])} | 🕒 {date}")
+
+    if not results:
+        st.info("검색 결과가 없습니다.")
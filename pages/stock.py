@@ -1,10 +1,13 @@
 import streamlit as st
-import yfinance as yf
 import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
 
+from core.montecarlo import simulate_touch_probabilities, DEFAULT_PATHS, DEFAULT_SEED
+from core import alerts
+from core.market_data import get_history
+
 # -----------------------------------------------------------------------------
 # 1. Page Configuration & Styling
 # -----------------------------------------------------------------------------
@@ -39,8 +42,8 @@ def get_stock_data(ticker):
     Fetches 1 year of OHLCV data with robust error handling.
     """
     try:
-        # Download data
-        df = yf.download(ticker, period="1y", interval="1d", progress=False)
+        # Download data (shared gateway: concurrent requests from other pages/sessions are merged)
+        df = get_history(ticker, period="1y", interval="1d")
         
         if df.empty:
             return None
@@ -135,6 +138,18 @@ def calculate_scenarios(df):
         st.error(f"Error calculating scenarios: {e}")
         return None
 
+# -----------------------------------------------------------------------------
+# 3-1. Monte Carlo Simulation (Probability of Touching Key Levels)
+# -----------------------------------------------------------------------------
+@st.cache_data(ttl=300)
+def run_simulation(close_values, sim_levels, days, method, n_paths=DEFAULT_PATHS, seed=DEFAULT_SEED):
+    """
+    Vectorized GBM / bootstrap simulation over the ticker's own history.
+    Cached so re-renders with the same inputs skip the simulation.
+    """
+    return simulate_touch_probabilities(close_values, dict(sim_levels), days=days,
+                                        method=method, n_paths=n_paths, seed=seed)
+
 # -----------------------------------------------------------------------------
 # 4. Visualization Engine
 # -----------------------------------------------------------------------------
@@ -204,6 +219,12 @@ def main():
         st.header("Settings")
         ticker = st.text_input("Ticker Symbol", value="AAPL").upper()
         
+        st.subheader("Simulation")
+        sim_mode = st.checkbox("Monte Carlo Mode", value=False)
+        sim_days = st.slider("Horizon (trading days)", 5, 120, 20)
+        sim_method = st.radio("Return Model", ["gbm", "bootstrap"],
+                              format_func=lambda m: "GBM (Normal)" if m == "gbm" else "Bootstrap (History)")
+
         st.info("""
         **Strategy Guide:**
         - **Upside:** 돌파 시 목표가 (E-Value, Fib Ext)
@@ -258,11 +279,43 @@ def main():
                     - **위험 신호:** **${levels['stop_loss']:.2f}** 이탈 시 추세 훼손으로 간주, 리스크 관리가 필요합니다.
                     """)
 
+                # --- MONTE CARLO SIMULATION ---
+                if sim_mode:
+                    st.subheader(f"🎲 Monte Carlo Simulation ({DEFAULT_PATHS:,} paths, {sim_days} days)")
+                    sim_levels = (
+                        ("Pivot R1", float(levels['pivot']['R1'])),
+                        ("Fib Ext 1.618", float(levels['fib']['ext_1.618'])),
+                        ("Wave E-Value", float(levels['wave']['e_value'])),
+                        ("ATR Stop Loss", float(levels['stop_loss'])),
+                    )
+                    with st.spinner("Simulating price paths..."):
+                        sim = run_simulation(df['Close'].to_numpy(dtype=float), sim_levels, sim_days, sim_method)
+
+                    if sim:
+                        m_cols = st.columns(len(sim_levels))
+                        for m_col, (label, price) in zip(m_cols, sim_levels):
+                            m_col.metric(f"Touch {label}", f"{sim['touch'][label]*100:.1f}%", f"${price:.2f}", delta_color="off")
+
+                        pct = sim['final_percentiles']
+                        st.caption(
+                            f"Day-{sim_days} price range: 5% ${pct[5]:.2f} · 25% ${pct[25]:.2f} · "
+                            f"Median ${pct[50]:.2f} · 75% ${pct[75]:.2f} · 95% ${pct[95]:.2f} | "
+                            f"P(close above today) {sim['prob_up']*100:.1f}% | seed={DEFAULT_SEED}"
+                        )
+                    else:
+                        st.info("Not enough history to simulate (need 30+ sessions).")
+
                 # --- CHART VISUALIZATION ---
                 st.subheader("📊 Technical Analysis Chart")
                 fig = plot_chart(df, ticker, levels)
                 st.plotly_chart(fig, use_container_width=True)
 
+                # --- BACKGROUND ALERTS ---
+                if st.button("🔔 Watch these levels (background alerts)"):
+                    n = alerts.save_levels(ticker, alerts.levels_from_scenarios(levels), curr_price)
+                    st.toast(f"{n} levels registered for {ticker}. Alerts appear on the home page.")
+                    st.caption("Run `python -m core.alerts` on the server to keep checking prices without an open page.")
+
                 # --- RAW DATA (Expandable) ---
                 with st.expander("Show Raw Data & Calculation Details"):
                     st.write("Recent OHLCV Data:", df.tail())
@@ -2,9 +2,10 @@ import streamlit as st
 import pandas as pd
 import gspread
 from oauth2client.service_account import ServiceAccountCredentials
-import google.generativeai as genai
 import datetime
-import requests
+import hashlib
+
+from core import briefing, search_index, warmup
 
 # ------------------------------------------------------------------
 # [1] 기본 설정
@@ -24,9 +25,6 @@ else:
     except:
         creds = None
 
-genai.configure(api_key=GEMINI_API_KEY)
-model = genai.GenerativeModel('gemini-flash-latest')
-
 def get_sheet():
     try:
         client = gspread.authorize(creds)
@@ -34,48 +32,25 @@ def get_sheet():
     except:
         return None
 
+def hash_text(text):
+    return hashlib.sha1(text.encode()).hexdigest()[:12]
+
 # [핵심] 한국 시간 구하는 함수
 def get_korea_today():
-    korea_now = datetime.datetime.utcnow() + datetime.timedelta(hours=9)
-    return korea_now.date()
+    return briefing.korea_today()
 
-# 날씨 함수
+# 날씨 (아침 예열 스냅샷을 먼저 보여주고, 30분 지났으면 뒤에서 갱신)
 def get_weather():
     try:
-        url = "https://api.open-meteo.com/v1/forecast?latitude=36.35&longitude=127.38&current_weather=true&timezone=Asia%2FSeoul"
-        response = requests.get(url, timeout=5)
-        data = response.json()
-        
-        temp = data['current_weather']['temperature']
-        code = data['current_weather']['weathercode']
-        
-        w_text = "맑음 ☀️"
-        if code in [1, 2, 3]: w_text = "구름 조금 ⛅"
-        elif code in [45, 48]: w_text = "안개 🌫️"
-        elif code in [51, 53, 55, 61, 63, 65, 80, 81, 82]: w_text = "비 🌧️"
-        elif code in [71, 73, 75, 77, 85, 86]: w_text = "눈 ❄️"
-        elif code >= 95: w_text = "뇌우 ⚡"
-        
-        return f"{w_text} {temp}°C"
+        value, _ = warmup.read("weather")
+        return value
     except Exception as e:
         return f"날씨 오류 ({e})"
 
-# 오늘의 역사/명언 캐싱
-@st.cache_data(ttl=3600*12) 
-def get_daily_content(today_str):
-    prompt = f"""
-    오늘은 {today_str}이다.
-    1. [역사]: 오늘 날짜의 흥미로운 세계사 사건 1개 (연도 포함).
-    2. [명언]: 민음사 세계문학 전집 스타일의 문장 1개 (출처 포함).
-    JSON 포맷: {{"history": "...", "quote": "...", "author": "..."}}
-    """
-    try:
-        response = model.generate_content(prompt)
-        import json, re
-        match = re.search(r'\{.*\}', response.text, re.DOTALL)
-        return json.loads(match.group()) if match else None
-    except:
-        return None
+# 오늘의 역사/명언 (날짜별 스냅샷 -> 하루에 한 번만 Gemini 호출)
+def get_daily_content(today):
+    value, _ = warmup.read(warmup.daily_content_name(today))
+    return value
 
 # ------------------------------------------------------------------
 # [2] 화면 구성
@@ -88,7 +63,7 @@ col1, col2 = st.columns([1, 2])
 with col1:
     st.metric("대전 날씨", get_weather())
 with col2:
-    info = get_daily_content(today_obj.strftime("%Y년 %m월 %d일"))
+    info = get_daily_content(today_obj)
     if info:
         st.info(f"📜 **오늘의 역사**\n\n{info['history']}")
 
@@ -172,6 +147,7 @@ with tab2:
             if note:
                 sheet = get_sheet()
                 sheet.append_row([str(today_obj), "메모", note, "", "없음"])
+                search_index.add("memo", f"{today_obj}:{hash_text(note)}", note.splitlines()[0][:60], note)
                 st.toast("메모 저장됨")
                 st.rerun()
     
@@ -184,6 +160,13 @@ with tab2:
         # '메모' 유형만 필터링하고 최신순 정렬
         # 원본 행 번호(row_idx)를 보존하기 위해 인덱스를 컬럼으로 만듦
         df_memo = df[df['유형'] == '메모'].copy()
+        # 시트의 메모를 통합 검색 색인과 맞춤 (바뀐 메모만 다시 색인, 시트에서 고치거나 지운 메모는 색인에서도 삭제)
+        search_index.sync("memo", [
+            {"ref": f"{r['날짜']}:{hash_text(str(r['내용']))}",
+             "title": str(r['내용']).splitlines()[0][:60] if str(r['내용']).strip() else "(빈 메모)",
+             "body": str(r['내용'])}
+            for _, r in df_memo.iterrows()
+        ])
         df_memo['original_row'] = df_memo.index + 2 # 시트 행 번호 계산 (헤더=1행 이므로 +2)
         df_memo = df_memo.sort_values(by='날짜', ascending=False).head(5) # 최근 5개만
 
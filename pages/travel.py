@@ -4,10 +4,10 @@ import gspread
 from oauth2client.service_account import ServiceAccountCredentials
 import google.generativeai as genai
 import datetime
-import requests
-from bs4 import BeautifulSoup
 import json
-import re
+
+from core import search_index
+from core.article import get_article
 
 # ------------------------------------------------------------------
 # [1] 설정 및 연결
@@ -40,35 +40,13 @@ def get_sheet(worksheet_name):
 # [핵심] 네이버 블로그까지 뚫어버리는 텍스트 수집기
 def fetch_url_content(url):
     try:
-        # 1. 네이버 블로그라면? -> '진짜 주소(PostView)'로 변환
-        if "blog.naver.com" in url:
-            # 주소에서 아이디와 글번호 추출 (예: blog.naver.com/id/1234 -> id, 1234)
-            match = re.search(r'blog.naver.com/([^/]+)/([0-9]+)', url)
-            if match:
-                blog_id, log_no = match.groups()
-                # iframe을 벗겨낸 진짜 주소
-                url = f"https://blog.naver.com/PostView.naver?blogId={blog_id}&logNo={log_no}"
-
-        # 2. 구글 지도 링크 거절 (보안 문제)
+        # 1. 구글 지도 링크 거절 (보안 문제)
         if "google.com" in url and "maps" in url:
              return "구글 지도 링크는 읽을 수 없습니다. 블로그나 식당 소개 페이지 링크를 주세요."
 
-        # 3. 접속 시도
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        }
-        session = requests.Session()
-        response = session.get(url, headers=headers, timeout=10)
-        
-        # 4. 텍스트 추출
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # 스크립트 등 불필요한 태그 제거
-        for script in soup(["script", "style", "header", "footer", "nav", "iframe"]):
-            script.extract()
-            
-        # 본문 텍스트만 깔끔하게
-        text = soup.get_text(separator=' ', strip=True)
+        # 2. 본문 추출 (네이버 블로그는 PostView 주소로 자동 변환)
+        # 메뉴·광고·댓글을 걷어낸 본문만 URL 단위로 캐시 -> 같은 링크 재분석 시 다운로드/파싱 없음
+        text = get_article(url)["text"]
         
         # 내용이 너무 없으면 실패로 간주
         if len(text) < 50:
@@ -147,6 +125,9 @@ with tab2:
                 try:
                     response = model.generate_content(prompt)
                     st.markdown(response.text)
+                    # 통합 검색 색인 (제목 = 기준 장소 줄)
+                    place = next((line.lstrip("# ").strip() for line in response.text.splitlines() if line.strip()), url_input)
+                    search_index.add("travel", url_input, place, response.text, url=url_input)
                     
                     # 저장 버튼
                     st.divider()
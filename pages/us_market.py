@@ -1,131 +1,41 @@
 import streamlit as st
-import yfinance as yf
 import pandas as pd
-import google.generativeai as genai
 import plotly.graph_objects as go
 import plotly.express as px
 
+from core import briefing, snapshots, warmup
+from core.market_data import INDICES
+
 # ------------------------------------------------------------------
 # [1] 설정 & API
 # ------------------------------------------------------------------
 st.set_page_config(page_title="🇺🇸 월스트리트 인사이드 (Special)", page_icon="🗽", layout="wide")
 
-if "GEMINI_API_KEY" in st.secrets:
-    genai.configure(api_key=st.secrets["GEMINI_API_KEY"])
-
-model = genai.GenerativeModel('gemini-flash-latest')
-
 # --- 데이터 정의 ---
-# 1. 주요 지수
-INDICES = {
-    "^GSPC": "S&P 500",
-    "^IXIC": "나스닥",
-    "^SOX": "반도체",
-    "^VIX": "공포지수(VIX)",
-    "KRW=X": "원/달러 환율"
-}
-
-# 2. 집중 분석 대상
-SPECIALS = {
-    "TSLA": "테슬라 (Tesla)",
-    "BTC-USD": "비트코인 (Bitcoin)",
-    "GOOGL": "구글 (Alphabet)"
-}
-
-# 3. 히트맵용
-SECTOR_MAP = {
-    "Big Tech": ["AAPL", "MSFT", "GOOGL", "AMZN", "META"],
-    "Semi & AI": ["NVDA", "AMD", "AVGO", "TSM", "INTC"],
-    "Auto": ["TSLA", "RIVN", "F", "GM"],
-    "Finance": ["JPM", "V", "MA", "BAC"],
-    "Health": ["LLY", "JNJ", "PFE"]
-}
+# 지수·관심 종목·히트맵 구성과 수집/브리핑 로직은 아침 예열 작업과 공유하므로 core.briefing에 정의
+SPECIALS = briefing.SPECIALS
+SECTOR_MAP = briefing.SECTOR_MAP
 
 # ------------------------------------------------------------------
-# [2] 데이터 수집
+# [2] 데이터 수집 (스냅샷 우선: 예열된 결과를 바로 그리고, 30분 지났으면 뒤에서 갱신)
 # ------------------------------------------------------------------
-@st.cache_data(ttl=1800)
 def get_all_market_data():
-    all_tickers = list(INDICES.keys()) + list(SPECIALS.keys()) + [t for cat in SECTOR_MAP.values() for t in cat]
-    all_tickers = list(set(all_tickers))
-    
-    data = yf.download(all_tickers, period="5d", progress=False)['Close']
-    
-    summary = {}
-    for t in all_tickers:
-        if t in data.columns:
-            series = data[t].dropna()
-            if len(series) >= 2:
-                curr = series.iloc[-1]
-                prev = series.iloc[-2]
-                pct = ((curr - prev) / prev) * 100
-                summary[t] = {"price": curr, "change": pct}
-            else:
-                summary[t] = {"price": 0, "change": 0}
-        else:
-            summary[t] = {"price": 0, "change": 0}
-            
-    heatmap_data = []
-    for sector, symbols in SECTOR_MAP.items():
-        for s in symbols:
-            if s in summary:
-                heatmap_data.append({
-                    "Sector": sector,
-                    "Ticker": s,
-                    "Change": summary[s]['change'],
-                    "Price": summary[s]['price']
-                })
-    
-    return summary, pd.DataFrame(heatmap_data)
-
-def get_special_news():
-    news_dict = {}
-    for ticker in SPECIALS.keys():
-        try:
-            items = yf.Ticker(ticker).news[:1]
-            if items:
-                news_dict[ticker] = items[0]['title']
-            else:
-                news_dict[ticker] = "뉴스 없음"
-        except:
-            news_dict[ticker] = "로딩 실패"
-    return news_dict
+    snapshot, saved_at = warmup.read("us_market")
+    if not snapshot:
+        return {}, pd.DataFrame(), {}, "", None
+    return (snapshot["summary"], pd.DataFrame(snapshot["heatmap"]), snapshot["news"],
+            snapshot["brief"], saved_at)
 
 # ------------------------------------------------------------------
 # [3] AI 브리핑
 # ------------------------------------------------------------------
-def generate_combined_brief(summary, news_map):
-    vix = summary.get("^VIX", {}).get('price', 0)
-    usd = summary.get("KRW=X", {}).get('price', 0)
-    
-    tsla = summary.get("TSLA", {})
-    btc = summary.get("BTC-USD", {})
-    googl = summary.get("GOOGL", {})
-    
-    prompt = f"""
-    당신은 월스트리트 수석 전략가입니다. 
-    한국 투자자를 위해 [미국 증시 마감 시황]과 [3대 관심 종목]을 브리핑하세요.
-    
-    [1. 시장 지표]
-    - 나스닥 등락: {summary.get('^IXIC', {}).get('change', 0):.2f}%
-    - 공포지수(VIX): {vix:.2f} (높으면 공포)
-    - 환율: {usd:.1f}원
-    
-    [2. Special 3 종목]
-    - 테슬라: {tsla.get('change', 0):.2f}% (뉴스: {news_map.get('TSLA')})
-    - 비트코인: {btc.get('change', 0):.2f}% (뉴스: {news_map.get('BTC-USD')})
-    - 구글: {googl.get('change', 0):.2f}% (뉴스: {news_map.get('GOOGL')})
-    
-    [작성 요청]
-    1. **시장 총평**: 거시경제/금리 관점에서 시장 분위기 요약 (국장 영향 포함).
-    2. **테슬라 & 2차전지**: 주가 원인 분석 + 한국 2차전지주(에코프로 등) 영향.
-    3. **구글 & AI**: 빅테크 AI 흐름 분석 + 한국 반도체/SW주 영향.
-    4. **비트코인**: 가상자산 시장 분위기.
-    """
-    try:
-        return model.generate_content(prompt).text
-    except:
-        return "브리핑 생성 실패"
+def refresh_brief(summary, news_map):
+    """브리핑만 다시 생성해 스냅샷에 반영"""
+    brief = briefing.combined_brief(summary, news_map)
+    snapshot, _ = snapshots.load("us_market")
+    if snapshot:
+        snapshots.save("us_market", {**snapshot, "brief": brief})
+    return brief
 
 # ------------------------------------------------------------------
 # [4] 메인 화면
@@ -134,8 +44,7 @@ st.title("🇺🇸 월스트리트 인사이드 (V2 + Special)")
 st.caption("시장 전체 흐름(V2)과 테슬라·비트코인·구글을 집중 분석합니다.")
 
 with st.spinner("뉴욕 증시 및 3대장 데이터 분석 중... 🔍"):
-    summary, heat_df = get_all_market_data()
-    special_news = get_special_news()
+    summary, heat_df, special_news, final_brief, saved_at = get_all_market_data()
 
 if not summary:
     st.error("데이터 로딩 실패")
@@ -176,13 +85,12 @@ else:
         st.caption(special_news.get("GOOGL", "-"))
 
     st.markdown("##### 💡 AI 심층 브리핑")
-    if "final_brief" not in st.session_state:
-        st.session_state.final_brief = generate_combined_brief(summary, special_news)
-        
-    st.info(st.session_state.final_brief)
+    st.info(final_brief)
+    st.caption(f"기준 시각: {pd.Timestamp(saved_at, unit='s', tz='UTC').tz_convert('Asia/Seoul'):%m-%d %H:%M} KST")
     
     if st.button("🔄 브리핑 새로고침"):
-        del st.session_state.final_brief
+        with st.spinner("브리핑 다시 작성 중..."):
+            refresh_brief(summary, special_news)
         st.rerun()
 
     st.divider()
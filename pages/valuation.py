@@ -1,8 +1,9 @@
 import streamlit as st
-import yfinance as yf
 import google.generativeai as genai
 import pandas as pd
 
+from core.market_data import get_info
+
 # ------------------------------------------------------------------
 # [1] 설정
 # ------------------------------------------------------------------
@@ -19,8 +20,7 @@ model = genai.GenerativeModel('gemini-flash-latest')
 def get_analyst_data(ticker):
     """월가 애널리스트들의 목표주가와 투자의견을 가져옵니다."""
     try:
-        stock = yf.Ticker(ticker)
-        info = stock.info
+        info = get_info(ticker)
         
         # 1. 현재 정보
         current_price = info.get('currentPrice', 0)
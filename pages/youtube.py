@@ -1,102 +1,101 @@
 import streamlit as st
-import google.generativeai as genai
-import yt_dlp
-import requests
-import json
-import re
+
+import pandas as pd
+
+from core import llm, search_index, transcript_qa, transcripts, yt_batch
 
 # ------------------------------------------------------------------
 # [1] 설정
 # ------------------------------------------------------------------
 st.set_page_config(page_title="유튜브 인사이트 채굴기 (Pro)", page_icon="⛏️", layout="centered")
-
-if "GEMINI_API_KEY" in st.secrets:
-    genai.configure(api_key=st.secrets["GEMINI_API_KEY"])
-
-model = genai.GenerativeModel('gemini-flash-latest')
+# Gemini 호출은 core.llm 공용 모델 경유 (일괄 요약·질문과 같은 동시 요청 제한을 공유)
 
 # ------------------------------------------------------------------
-# [2] 강력한 자막 추출 함수 (yt-dlp 사용)
+# [2] 강력한 자막 추출 함수 (yt-dlp 사용, 영상 ID별 저장본 우선)
 # ------------------------------------------------------------------
 def get_transcript_with_ytdlp(video_url):
     """
     yt-dlp를 사용하여 유튜브의 자동생성 자막(스크립트)을 강제로 추출합니다.
-    IP 차단을 우회하고 더 강력하게 데이터를 가져옵니다.
+    한 번 분석한 영상은 저장된 자막을 바로 사용합니다. (yt-dlp 실행 없음)
+    반환: (자막 dict, 오류 메시지)
     """
-    ydl_opts = {
-        'skip_download': True,      # 영상은 다운로드 안 함
-        'writeautomaticsub': True,  # 자동 생성 자막 가져오기
-        'writesubtitles': True,     # 수동 자막도 가져오기
-        'subtitleslangs': ['ko', 'en'], # 한국어 우선, 없으면 영어
-        'quiet': True,              # 로그 출력 끄기
-    }
-
     try:
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            # 1. 영상 정보 추출
-            info = ydl.extract_info(video_url, download=False)
-            
-            # 2. 자막 데이터 찾기 (수동 -> 자동 순서)
-            subs = info.get('subtitles', {})
-            auto_subs = info.get('automatic_captions', {})
-            
-            # 우선순위: 한국어(수동) > 한국어(자동) > 영어(수동) > 영어(자동)
-            target_sub = None
-            
-            # (1) 한국어 찾기
-            if 'ko' in subs: target_sub = subs['ko']
-            elif 'ko' in auto_subs: target_sub = auto_subs['ko']
-            # (2) 영어 찾기
-            elif 'en' in subs: target_sub = subs['en']
-            elif 'en' in auto_subs: target_sub = auto_subs['en']
-            
-            # (3) 아무거나 찾기 (위에서 못 찾았을 경우)
-            if not target_sub:
-                # 사용 가능한 첫 번째 언어라도 가져옴
-                if auto_subs:
-                    first_lang = list(auto_subs.keys())[0]
-                    target_sub = auto_subs[first_lang]
-
-            if not target_sub:
-                return None, "자막 트랙을 찾을 수 없습니다."
-
-            # 3. JSON3 포맷의 자막 URL 찾기 (가장 파싱하기 좋음)
-            json3_url = None
-            for fmt in target_sub:
-                if fmt.get('ext') == 'json3':
-                    json3_url = fmt['url']
-                    break
-            
-            if not json3_url:
-                # JSON3가 없으면 첫 번째 포맷 사용
-                json3_url = target_sub[0]['url']
-
-            # 4. 자막 내용 다운로드 및 파싱
-            response = requests.get(json3_url)
-            caption_data = response.json()
-            
-            full_text = ""
-            events = caption_data.get('events', [])
-            
-            for event in events:
-                # 시간 정보 (밀리초 -> 분:초)
-                start_ms = event.get('tStartMs', 0)
-                start_sec = int(start_ms / 1000)
-                m, s = divmod(start_sec, 60)
-                time_str = f"[{m:02d}:{s:02d}]"
-                
-                # 텍스트 합치기
-                segs = event.get('segs', [])
-                text = "".join([seg.get('utf8', '') for seg in segs]).strip()
-                
-                if text:
-                    full_text += f"{time_str} {text} "
-            
-            return full_text, None
-
+        return transcripts.get_transcript(video_url), None
     except Exception as e:
         return None, str(e)
 
+def run_batch(collection_url, limit):
+    """재생목록·채널: 영상 목록을 가져와 병렬로 요약하고, 끝나는 대로 표에 추가합니다."""
+    with st.spinner("영상 목록을 가져오는 중..."):
+        try:
+            videos = transcripts.list_videos(collection_url, limit=limit)
+        except Exception as e:
+            st.error(f"목록을 가져오지 못했습니다: {e}")
+            return
+    if not videos:
+        st.warning("영상을 찾지 못했습니다.")
+        return
+
+    progress = st.progress(0.0, text=f"0/{len(videos)}개 처리")
+    table = st.empty()
+    rows, results = [], []
+    for n, result in enumerate(yt_batch.run(videos), start=1):
+        results.append(result)
+        first_line = (result["summary"] or "").strip().split("\n")[0]
+        rows.append({"제목": result["title"], "상태": result["status"], "핵심": first_line, "링크": result["url"]})
+        table.dataframe(pd.DataFrame(rows), hide_index=True, use_container_width=True,
+                        column_config={"링크": st.column_config.LinkColumn("링크", display_text="열기")})
+        progress.progress(n / len(videos), text=f"{n}/{len(videos)}개 처리")
+
+    done = sum(1 for r in results if r["summary"])
+    cached = sum(1 for r in results if r["status"] == "저장됨")
+    st.success(f"{done}/{len(videos)}개 요약 완료 (저장본 {cached}개 재사용). 실패한 영상은 다시 실행하면 이어서 처리합니다.")
+    for r in results:
+        if r["summary"]:
+            with st.expander(f"📺 {r['title']}"):
+                st.markdown(r["summary"])
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def qa_index(vid):
+    """영상 ID별 자막 구간 BM25 색인 (질문할 때마다 다시 만들지 않음)"""
+    transcript = transcripts.load(vid)
+    if transcript is None:
+        return None, None
+    return transcript["title"], transcript_qa.build_index(transcript_qa.segment(transcript["starts"], transcript["texts"]))
+
+def render_qa(vid):
+    """분석한 영상에 대한 추가 질문 (관련 자막 구간만 보내고, 답변에 타임스탬프 인용)"""
+    title, index = qa_index(vid)
+    if index is None:
+        return
+    st.divider()
+    st.subheader(f"💬 영상에 질문하기 · {title or vid}")
+    summary = transcripts.get_summary(vid)
+    if summary:
+        with st.expander("📊 분석 결과 다시 보기"):
+            st.markdown(summary)
+
+    history = st.session_state.setdefault("yt_qa_history", {}).setdefault(vid, [])
+    for item in history:
+        with st.chat_message("user"):
+            st.markdown(item["question"])
+        with st.chat_message("assistant"):
+            st.markdown(item["answer"])
+            if item["stamps"]:
+                st.caption("참고 구간: " + " · ".join(
+                    f"[{s}](https://www.youtube.com/watch?v={vid}&t={ms // 1000}s)" for s, ms in item["stamps"]))
+
+    question = st.chat_input("영상 내용에 대해 물어보세요 (예: 금리 이야기는 언제 나와?)")
+    if question:
+        with st.spinner("관련 구간을 찾아 답하는 중..."):
+            try:
+                reply, hits = transcript_qa.answer(index, title, question)
+            except Exception as e:
+                reply, hits = f"AI 답변 오류: {e}", []
+        history.append({"question": question, "answer": reply,
+                        "stamps": [(transcripts.timestamp(h["start"]), h["start"]) for h in hits]})
+        st.rerun()
+
 # ------------------------------------------------------------------
 # [3] 메인 화면
 # ------------------------------------------------------------------
@@ -104,21 +103,29 @@ st.title("⛏️ 유튜브 인사이트 채굴기 (Pro)")
 st.caption("기존 방식이 안 될 때 사용하는 강력한 버전입니다.")
 
 url = st.text_input("유튜브 링크 입력 (공유 버튼 -> 링크 복사)")
+st.caption("재생목록이나 채널 주소를 넣으면 여러 영상을 한 번에 요약합니다.")
+
+batch = transcripts.is_collection(url)
+if batch:
+    limit = st.number_input("최대 영상 수", min_value=1, max_value=200, value=20, step=5)
 
 if st.button("분석 시작 🚀", type="primary"):
-    if url:
+    if url and batch:
+        run_batch(url, int(limit))
+    elif url:
         # 영상 ID 추출 (썸네일용)
-        video_id = None
-        if "v=" in url: video_id = url.split("v=")[1].split("&")[0]
-        elif "youtu.be" in url: video_id = url.split("/")[-1].split("?")[0]
+        video_id = transcripts.video_id(url)
         
         if video_id:
             st.image(f"https://img.youtube.com/vi/{video_id}/hqdefault.jpg", width=300)
         
         with st.spinner("⛏️ 영상의 스크립트를 강제로 채굴 중입니다... (약간의 시간이 걸립니다)"):
-            script, error = get_transcript_with_ytdlp(url)
+            transcript, error = get_transcript_with_ytdlp(url)
+            script = transcripts.format_script(transcript["starts"], transcript["texts"]) if transcript else None
             
             if script:
+                if transcript["cached"]:
+                    st.caption(f"⚡ 이전에 받은 자막을 사용합니다 ({transcript['title'] or video_id})")
                 # 너무 길면 자르기 (AI 토큰 한계 고려)
                 final_script = script[:30000]
                 
@@ -136,9 +143,15 @@ if st.button("분석 시작 🚀", type="primary"):
                 
                 try:
                     st.success("자막 추출 성공! AI 분석을 시작합니다... 🧠")
-                    res = model.generate_content(prompt)
+                    summary = llm.generate(prompt)
                     st.markdown("### 📊 분석 결과")
-                    st.markdown(res.text)
+                    st.markdown(summary)
+                    if video_id:
+                        transcripts.save_summary(video_id, summary)
+                        st.session_state["yt_qa_video"] = video_id
+                    # 통합 검색 색인 (분석 결과 + 자막 원문)
+                    search_index.add("youtube", video_id or url, transcript["title"] or f"유튜브 {video_id or url}",
+                                     f"{summary}\n\n{script}", url=url)
                     
                     with st.expander("📜 원본 스크립트 보기"):
                         st.text(script)
@@ -151,3 +164,7 @@ if st.button("분석 시작 🚀", type="primary"):
                 st.info("Tip: 링크가 정확한지, 혹은 유료 멤버십 영상인지 확인해주세요.")
     else:
         st.warning("링크를 입력해주세요.")
+
+# 분석한 영상은 새로고침 후에도 질문 가능 (자막은 저장본에서 다시 읽음)
+if st.session_state.get("yt_qa_video") and not batch:
+    render_qa(st.session_state["yt_qa_video"])
@@ -0,0 +1,26 @@
+import pytest
+
+from core import html_extract
+
+# header 안의 nav, 바로 옆 footer처럼 버릴 태그가 겹치거나 이어져 있는 구조
+PAGE = ("<html><body><header><nav><a>Body links</a></nav></header><footer>f</footer>"
+        "<p>본문 첫 문단</p><script>var x = 1;</script><nav>메뉴</nav>꼬리 텍스트<p>둘째 문단</p></body></html>")
+
+BACKENDS = ["selectolax", "lxml", "html.parser"]
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request, monkeypatch):
+    if request.param == "selectolax" and html_extract._SelectolaxParser is None:
+        pytest.skip("selectolax 미설치")
+    if request.param == "lxml" and html_extract._lxml_html is None:
+        pytest.skip("lxml 미설치")
+    if request.param != "selectolax":
+        monkeypatch.setattr(html_extract, "_SelectolaxParser", None)
+    if request.param == "html.parser":
+        monkeypatch.setattr(html_extract, "_lxml_html", None)
+    return request.param
+
+
+def test_sibling_drop_tags_are_all_removed(backend):
+    assert html_extract.extract_text(PAGE) == "본문 첫 문단 꼬리 텍스트 둘째 문단"
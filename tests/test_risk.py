@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+
+from core import risk
+
+
+def _prices(days=120, seed=0):
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range("2025-01-01", periods=days)
+    rets = rng.normal(0.0005, 0.01, size=(days, 2))
+    return pd.DataFrame(100 * np.cumprod(1 + rets, axis=0), index=dates, columns=["AAPL", "MSFT"])
+
+
+def test_bogus_ticker_is_excluded_instead_of_emptying_matrix():
+    prices = _prices()
+    prices["NOTATICKER"] = np.nan  # yf.download가 잘못된 티커에 주는 빈 열
+    holdings = {"AAPL": 10, "MSFT": 5, "NOTATICKER": 3}
+
+    result = risk.compute_portfolio_risk(prices, holdings)
+
+    assert result is not None
+    assert result["tickers"] == ["AAPL", "MSFT"]
+    assert result["excluded"] == ["NOTATICKER"]
+    assert result["observations"] == len(prices) - 1
+
+
+def test_recent_listing_does_not_cut_history():
+    prices = _prices()
+    prices["NEWIPO"] = np.nan
+    prices.iloc[-10:, prices.columns.get_loc("NEWIPO")] = 50.0
+    result = risk.compute_portfolio_risk(prices, {"AAPL": 1, "MSFT": 1, "NEWIPO": 1})
+
+    assert result["excluded"] == ["NEWIPO"]
+    assert result["observations"] == len(prices) - 1